@@ -0,0 +1,67 @@
+# fold_cache_benchmark.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import click
+import os
+import pickle
+import time
+import pandas as pd
+from scipy.stats import loguniform
+from sklearn import set_config
+from sklearn.metrics import make_scorer, f1_score
+from sklearn.model_selection import RandomizedSearchCV
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.data_io import WINE_DTYPES, find_table, read_table
+from src.fold_cache import CachedRandomizedSearchCV
+
+@click.command()
+@click.option('--train-data', type=str, default="./data/proc/wine_train.csv", help="Path to train data")
+@click.option('--pipeline-path', type=str, default="./results/models/wine_pipeline.pickle",
+              help="Path to the pickled (unfitted) pipeline")
+@click.option('--n-iter', type=int, default=10, help="Number of candidate values of C")
+@click.option('--scale', type=int, multiple=True, default=[1, 10],
+              help="Number of copies of the training data to search on; can be repeated")
+@click.option('--seed', type=int, default=123, help="Random seed")
+@click.option('--output', type=click.Path(), default=None, help="Optional CSV file for the timings")
+
+def main(train_data, pipeline_path, n_iter, scale, seed, output):
+    '''Compares the fit time of RandomizedSearchCV with and without
+    the per-fold preprocessing cache.'''
+    set_config(transform_output="pandas")
+    wine_train = read_table(find_table(train_data), columns=list(WINE_DTYPES))
+    with open(pipeline_path, 'rb') as f:
+        wine_pipe = pickle.load(f)
+
+    param_grid = {"logisticregression__C": loguniform(1e-1, 10)}
+    scoring = make_scorer(f1_score, pos_label="red")
+    rows = []
+    for copies in scale:
+        data = pd.concat([wine_train] * copies, ignore_index=True)
+        X, y = data.drop(columns=["color"]), data["color"]
+        for name, search_class in [("uncached", RandomizedSearchCV), ("fold_cache", CachedRandomizedSearchCV)]:
+            search = search_class(wine_pipe, param_grid, n_iter=n_iter, random_state=seed,
+                                  return_train_score=True, scoring=scoring)
+            start = time.perf_counter()
+            search.fit(X, y)
+            rows.append({
+                "rows": len(X),
+                "search": name,
+                "fit_seconds": search.cv_results_["mean_fit_time"].sum() * search.n_splits_,
+                "score_seconds": search.cv_results_["mean_score_time"].sum() * search.n_splits_,
+                "total_seconds": time.perf_counter() - start,
+                "best_C": search.best_params_["logisticregression__C"],
+                "best_score": search.best_score_
+            })
+
+    results = pd.DataFrame(rows)
+    uncached = results[results["search"] == "uncached"].set_index("rows")["fit_seconds"]
+    results["fit_speedup"] = results["rows"].map(uncached) / results["fit_seconds"]
+    print(results.round(4).to_string(index=False))
+    if output is not None:
+        results.to_csv(output, index=False)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# parallel_scaling_benchmark.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import click
+import os
+import pickle
+import time
+import pandas as pd
+from joblib import cpu_count
+from scipy.stats import loguniform
+from sklearn import set_config
+from sklearn.metrics import make_scorer, f1_score
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.data_io import WINE_DTYPES, find_table, read_table
+from src.fold_cache import CachedRandomizedSearchCV
+from src.parallel import BACKENDS, executor
+
+@click.command()
+@click.option('--train-data', type=str, default="./data/proc/wine_train.csv", help="Path to train data")
+@click.option('--pipeline-path', type=str, default="./results/models/wine_pipeline.pickle",
+              help="Path to the pickled (unfitted) pipeline")
+@click.option('--n-iter', type=int, default=20, help="Number of candidate values of C")
+@click.option('--scale', type=int, default=10, help="Number of copies of the training data to search on")
+@click.option('--backend', type=click.Choice(list(BACKENDS)), multiple=True, default=["process", "thread"],
+              help="Executor to benchmark; can be repeated")
+@click.option('--max-jobs', type=int, default=None, help="Largest number of workers. Defaults to all cores")
+@click.option('--seed', type=int, default=123, help="Random seed")
+@click.option('--output', type=click.Path(), default=None, help="Optional CSV file for the timings")
+
+def main(train_data, pipeline_path, n_iter, scale, backend, max_jobs, seed, output):
+    '''Times the hyperparameter search on each executor with 1 to N workers.'''
+    set_config(transform_output="pandas")
+    wine_train = read_table(find_table(train_data), columns=list(WINE_DTYPES))
+    data = pd.concat([wine_train] * scale, ignore_index=True)
+    X, y = data.drop(columns=["color"]), data["color"]
+    with open(pipeline_path, 'rb') as f:
+        wine_pipe = pickle.load(f)
+
+    max_jobs = max_jobs or cpu_count()
+    runs = [("serial", 1)] + [(name, n_jobs) for name in backend if name != "serial"
+                              for n_jobs in range(1, max_jobs + 1)]
+    rows = []
+    for name, n_jobs in runs:
+        search = CachedRandomizedSearchCV(
+            wine_pipe, {"logisticregression__C": loguniform(1e-1, 10)}, n_iter=n_iter,
+            random_state=seed, scoring=make_scorer(f1_score, pos_label="red")
+        )
+        start = time.perf_counter()
+        with executor(name, n_jobs):
+            search.fit(X, y)
+        rows.append({"backend": name, "n_jobs": n_jobs, "rows": len(X), "seconds": time.perf_counter() - start})
+
+    results = pd.DataFrame(rows)
+    results["speedup"] = results["seconds"].iloc[0] / results["seconds"]
+    results["efficiency"] = results["speedup"] / results["n_jobs"]
+    print(results.round(3).to_string(index=False))
+    if output is not None:
+        results.to_csv(output, index=False)
+
+if __name__ == '__main__':
+    main()
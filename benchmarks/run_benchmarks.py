@@ -0,0 +1,155 @@
+# run_benchmarks.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import click
+import contextlib
+import io
+import os
+import pickle
+import shutil
+import tempfile
+import pandas as pd
+from sklearn import set_config
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.benchmarking import TOLERANCE, compare_to_baseline, read_results, run_isolated, write_results
+from src.data_io import WINE_DTYPES, read_table
+from src.synthetic import WineSynthesizer
+
+STAGES = ["split", "column_names", "validation", "search", "evaluation"]
+
+
+# Every stage has a setup function (untimed) returning its arguments and row count,
+# and is run by run_isolated in its own process.
+
+def setup_split(workdir, pipeline_path):
+    n_rows = sum(1 for _ in open(os.path.join(workdir, "wine.csv"))) - 1
+    return (os.path.join(workdir, "wine.csv"), os.path.join(workdir, "split")), n_rows
+
+
+def run_split(raw_path, output_dir):
+    from src.split_data import clean_n_split
+    os.makedirs(output_dir, exist_ok=True)
+    clean_n_split(raw_path, output_dir)
+
+
+def setup_raw(workdir, pipeline_path):
+    wine = read_table(os.path.join(workdir, "wine.csv"))
+    return (wine,), len(wine)
+
+
+def run_column_names(wine):
+    from src.validate_column_names import validate_column_names
+    with contextlib.redirect_stdout(io.StringIO()):
+        validate_column_names(wine, set(WINE_DTYPES))
+
+
+def run_validation(wine):
+    from src.validation import validate_wine
+    validate_wine(wine)
+
+
+def setup_search(workdir, pipeline_path):
+    set_config(transform_output="pandas")
+    wine_train = read_table(os.path.join(workdir, "split", "wine_train.csv"), columns=list(WINE_DTYPES))
+    with open(pipeline_path, 'rb') as f:
+        wine_pipe = pickle.load(f)
+    X_train, y_train = wine_train.drop(columns=["color"]), wine_train["color"]
+    return (wine_pipe, X_train, y_train, os.path.join(workdir, "search.pickle")), len(wine_train)
+
+
+def run_search(wine_pipe, X_train, y_train, output_path):
+    from src.random_search import perform_random_search
+    with contextlib.redirect_stdout(io.StringIO()):
+        perform_random_search(wine_pipe, X_train, y_train, 123, output_path)
+
+
+def setup_evaluation(workdir, pipeline_path):
+    set_config(transform_output="pandas")
+    wine_test = read_table(os.path.join(workdir, "split", "wine_test.csv"), columns=list(WINE_DTYPES))
+    with open(os.path.join(workdir, "search.pickle"), 'rb') as f:
+        model = pickle.load(f)
+    output_dir = os.path.join(workdir, "evaluation")
+    os.makedirs(output_dir, exist_ok=True)
+    X_test, y_test = wine_test.drop(columns=["color"]), wine_test["color"]
+    return (model, X_test, y_test, "red", output_dir, output_dir), len(wine_test)
+
+
+def run_evaluation(model, X_test, y_test, pos_label, table_to, plot_to):
+    import matplotlib
+    matplotlib.use("Agg")
+    from src.evaluation import evaluation
+    evaluation(model, X_test, y_test, pos_label, table_to, plot_to)
+
+
+STAGE_FUNCTIONS = {
+    "split": (setup_split, run_split),
+    "column_names": (setup_raw, run_column_names),
+    "validation": (setup_raw, run_validation),
+    "search": (setup_search, run_search),
+    "evaluation": (setup_evaluation, run_evaluation)
+}
+
+
+@click.command()
+@click.option('--raw-data', type=str, default="./data/raw/wine.csv", help="Path to the raw wine data")
+@click.option('--pipeline-path', type=str, default="./results/models/wine_pipeline.pickle",
+              help="Path to the pickled (unfitted) pipeline")
+@click.option('--rows', type=int, multiple=True, default=[6497, 65000],
+              help="Dataset size to benchmark; can be repeated, e.g. --rows 6497 --rows 1000000")
+@click.option('--stage', type=click.Choice(STAGES), multiple=True, default=STAGES,
+              help="Stage to benchmark; can be repeated. Defaults to all stages")
+@click.option('--output', type=click.Path(), default="./results/benchmarks/benchmarks.json",
+              help="JSON file for the results")
+@click.option('--baseline', type=click.Path(), default="./results/benchmarks/baseline.json",
+              help="Stored results to check for regressions against, if the file exists")
+@click.option('--save-baseline', is_flag=True, help="Store these results as the new baseline")
+@click.option('--tolerance', type=float, default=TOLERANCE,
+              help="Relative slowdown or memory growth reported as a regression")
+
+def main(raw_data, pipeline_path, rows, stage, output, baseline, save_baseline, tolerance):
+    '''Times the pipeline stages on synthetic wine data of several sizes, recording
+    wall time, throughput and peak memory, and flags regressions against a baseline.'''
+    synthesizer = WineSynthesizer(random_state=123).fit(read_table(raw_data))
+    pipeline_path = os.path.abspath(pipeline_path)
+    # Later stages read the outputs of earlier ones
+    stages = [name for name in STAGES if name in stage]
+    if "evaluation" in stages and "search" not in stages:
+        stages.insert(stages.index("evaluation"), "search")
+    if {"search", "evaluation"} & set(stages) and "split" not in stages:
+        stages.insert(0, "split")
+
+    results = []
+    for n_rows in rows:
+        workdir = tempfile.mkdtemp(prefix="wine-benchmark-")
+        try:
+            synthesizer.write(os.path.join(workdir, "wine.csv"), n_rows)
+            for name in stages:
+                setup, run = STAGE_FUNCTIONS[name]
+                result = {"stage": name, "dataset_rows": n_rows,
+                          **run_isolated(setup, run, workdir, pipeline_path)}
+                results.append(result)
+                print(f"{name:>12} {result['rows']:>10,} rows {result['seconds']:9.3f} s "
+                      f"{result['rows_per_second']:>12,.0f} rows/s {result['peak_rss_mb']:8.1f} MB")
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    write_results(output, results)
+    print(f"Results saved at: {output}")
+
+    regressions = pd.DataFrame()
+    if os.path.exists(baseline) and not save_baseline:
+        comparison = compare_to_baseline(results, read_results(baseline), tolerance)
+        regressions = comparison[comparison["regression"]]
+        print(comparison.round(3).to_string(index=False))
+    if save_baseline:
+        shutil.copyfile(output, baseline)
+        print(f"Baseline saved at: {baseline}")
+    if not regressions.empty:
+        print(f"{len(regressions)} regression(s) of more than {tolerance:.0%} against {baseline}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
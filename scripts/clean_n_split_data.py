@@ -8,16 +8,53 @@ import sys
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from src.split_data import clean_n_split
+from src.split_data import clean_n_split, append_split
+from src.data_io import FORMAT_EXTENSIONS
+from src.stage_cache import StageCache, code_files
+from src.instrumentation import stage
+
+PROC_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'proc')
 
 @click.command()
 @click.option('--raw-data', type=str, help="Path to raw data")
+@click.option('--output-format', type=click.Choice(["csv", "parquet", "feather"]), default="csv",
+              help="Storage format of the train and test sets")
+@click.option('--compression', type=str, default=None,
+              help="Compression codec for parquet/feather outputs (e.g. snappy, zstd, lz4)")
+@click.option('--chunksize', type=int, default=None,
+              help="Stream the raw data in chunks of this many rows to keep memory bounded")
+@click.option('--split-method', type=click.Choice(["shuffle", "hash"]), default="shuffle",
+              help="Split with a seeded shuffle, or by a seeded hash of each row so batches can be appended (CSV only)")
+@click.option('--append', is_flag=True, default=False,
+              help="Append the raw data as a new batch to an existing hash split")
 
-def main(raw_data):
+@stage("split")
+def main(raw_data, output_format, compression, chunksize, split_method, append):
     '''This script drops duplicates from the data, 
     as well as splits the raw data into train and test sets
     '''
-    clean_n_split(raw_data)
+    if append:
+        append_split(raw_data, chunksize=chunksize)
+        return
+    if split_method == "hash" and output_format != "csv":
+        raise click.BadParameter("a hash split can only be appended to as CSV", param_hint="--output-format")
+
+    cache = StageCache("split")
+    key = cache.key(
+        inputs=[raw_data],
+        params={"output_format": output_format, "compression": compression,
+                "chunksize": chunksize, "split_method": split_method},
+        code=code_files(__file__)
+    )
+    extension = FORMAT_EXTENSIONS[output_format]
+    outputs = [os.path.join(PROC_DIR, name + extension) for name in ["wine_train", "wine_test"]]
+    if cache.is_fresh(key, outputs):
+        print("Split: raw data and parameters unchanged, reusing cached train and test sets")
+        return
+
+    clean_n_split(raw_data, output_format=output_format, compression=compression,
+                  chunksize=chunksize, split_method=split_method)
+    cache.record(key, outputs)
 
 if __name__ == '__main__':
     main()
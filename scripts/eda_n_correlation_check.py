@@ -4,17 +4,34 @@
 
 import os
 import click
-import pandas as pd
 import altair as alt
 import altair_ally as aly
-from deepchecks.tabular import Dataset
-from deepchecks.tabular.checks import FeatureLabelCorrelation, FeatureFeatureCorrelation
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.data_io import WINE_FEATURES, WINE_LABEL, find_table, read_table
+from src.correlation_checks import MAX_FEATURE_CORRELATION, MAX_PPS, feature_feature_check, feature_label_check
+from src.eda import binned_densities, correlation_matrix, correlation_table
+from src.parallel import executor
+from src.split_data import load_train_summary
+from src.stage_cache import StageCache, code_files
+from src.streaming_stats import StreamingSummary
+from src.instrumentation import span, stage
+
 
 @click.command()
-@click.option('--train-file', type=click.Path(exists=True), help='Path to the training dataset CSV file.', required=True)
+@click.option('--train-file', type=click.Path(), help='Path to the training dataset (CSV, Parquet or Arrow file).', required=True)
 @click.option('--output-img', type=click.Path(), help='Path to the directory to save images.', required=True)
 @click.option('--output-table', type=click.Path(), help='Path to the directory to save table.', required=True)
-def main(train_file, output_img, output_table):
+@click.option('--plot-mode', type=click.Choice(["aggregated", "raw"]), default="aggregated",
+              help="Plot densities estimated on a fixed grid in NumPy, or estimate them from every row in Vega")
+@click.option('--correlation-engine', type=click.Choice(["native", "deepchecks"]), default="native",
+              help="Run the correlation checks with NumPy and scikit-learn in parallel, or with deepchecks")
+@click.option('--pps-sample-size', type=int, default=None,
+              help="Score the features on a stratified sample of this many rows (native engine only)")
+@click.option('--n-jobs', type=int, default=-1, help="Number of workers scoring the features; -1 uses all available cores")
+@stage("eda")
+def main(train_file, output_img, output_table, plot_mode, correlation_engine, pps_sample_size, n_jobs):
     """Process EDA and save tables and plots combined with feature correlation check."""
 
     if not os.path.exists(output_img):
@@ -23,68 +40,136 @@ def main(train_file, output_img, output_table):
     if not os.path.exists(output_table):
         os.makedirs(output_table)
 
+    train_file = find_table(train_file)
+    outputs = [
+        os.path.join(output_table, "feature_datatypes.csv"),
+        os.path.join(output_table, "summary_statistics.csv"),
+        os.path.join(output_img, "feature_densities_by_class.png"),
+        os.path.join(output_img, "feature_correlation.png")
+    ]
+    cache = StageCache("eda")
+    key = cache.key(inputs=[train_file], params={"outputs": outputs, "plot_mode": plot_mode,
+                                                           "correlation_engine": correlation_engine,
+                                                           "pps_sample_size": pps_sample_size},
+                    code=code_files(__file__))
+    if cache.is_fresh(key, outputs):
+        print("EDA: training data unchanged, reusing cached tables and figures")
+        return
+
     # Load datasets
-    train_df = pd.read_csv(train_file)
+    with span("read") as step:
+        train_df = read_table(train_file, columns=WINE_FEATURES + [WINE_LABEL])
+        step.rows = len(train_df)
+    n_rows = len(train_df)
 
     # Save feature datatypes and summary statistics
-    datatype_path = os.path.join(output_table, "feature_datatypes.csv")
-    info_df = pd.DataFrame({
-        "Column": train_df.columns,
-        "Non-Null Count": [train_df[col].notnull().sum() for col in train_df.columns],
-        "Data Type": [train_df[col].dtype for col in train_df.columns]
-    })
-    info_df.to_csv(datatype_path, index=False)
-    print(f"Feature datatypes saved at: {datatype_path}")
-
-    summary_path = os.path.join(output_table, "summary_statistics.csv")
-    train_df.describe().to_csv(summary_path)
-    print(f"Summary statistics saved at: {summary_path}")
+    with span("summary_tables", rows=n_rows):
+        # A hash split keeps the statistics of its train set up to date as batches are appended
+        summary = load_train_summary(train_file)
+        if summary is None or list(summary.columns) != list(train_df.columns):
+            summary = StreamingSummary().update(train_df)
+
+        datatype_path = os.path.join(output_table, "feature_datatypes.csv")
+        summary.datatypes().to_csv(datatype_path, index=False)
+        print(f"Feature datatypes saved at: {datatype_path}")
+
+        summary_path = os.path.join(output_table, "summary_statistics.csv")
+        summary.describe().to_csv(summary_path)
+        print(f"Summary statistics saved at: {summary_path}")
 
     # Enable Altair VegaFusion
     alt.data_transformers.enable('vegafusion')
 
     # Figure 1: Distribution of Features per Target Class
-    dist_plot = aly.dist(train_df, color = "color").properties(
-        title=""
-    )
-    dist_plot_path = os.path.join(output_img, "feature_densities_by_class.png")
-    dist_plot.save(dist_plot_path, scale_factor=2.0)
-    print(f"Feature distribution plot saved at: {dist_plot_path}")
+    with span("density_plot", rows=n_rows):
+        if plot_mode == "raw":
+            dist_plot = aly.dist(train_df, color = "color").properties(
+                title=""
+            )
+        else:
+            # Only the densities on a 100-point grid per feature and class are passed to Vega
+            densities = binned_densities(train_df, class_column="color")
+            dist_plot = alt.Chart(densities).mark_area(opacity=0.7, interpolate="monotone").encode(
+                x=alt.X("value:Q", title=None),
+                y=alt.Y("density:Q", title=None, stack=None),
+                color=alt.Color("color:N")
+            ).properties(width=150, height=100).facet(
+                facet=alt.Facet("feature:N", title=None), columns=3
+            ).resolve_scale(x="independent", y="independent").properties(
+                title=""
+            )
+        dist_plot_path = os.path.join(output_img, "feature_densities_by_class.png")
+        dist_plot.save(dist_plot_path, scale_factor=2.0)
+        print(f"Feature distribution plot saved at: {dist_plot_path}")
 
     # Figure 2: Correlation between Features
-    corr_matrix = train_df.drop(columns=['color']).corr()
-    corr_plot = aly.corr(corr_matrix).properties(
-        title=""
-    )
-    corr_plot_path = os.path.join(output_img, "feature_correlation.png")
-    corr_plot.save(corr_plot_path, scale_factor=2.0)
-    print(f"Feature correlation plot saved at: {corr_plot_path}")
-
-    # Deepchecks correlation validations
-    wine_train_ds = Dataset(train_df, label="color", cat_features=[])
-
-    # Feature-label correlation check
-    check_feat_lab_corr = FeatureLabelCorrelation().add_condition_feature_pps_less_than(0.8)
-    check_feat_lab_corr_result = check_feat_lab_corr.run(dataset=wine_train_ds)
-
-    if check_feat_lab_corr_result.passed_conditions():
+    with span("correlation_plot", rows=n_rows):
+        # The precomputed matrix is plotted as is, one cell per pair of features
+        corr_matrix = correlation_matrix(train_df.drop(columns=['color']))
+        features = list(corr_matrix.columns)
+        corr_plot = alt.Chart(correlation_table(corr_matrix)).mark_rect().encode(
+            x=alt.X("feature_1:N", sort=features, title=None),
+            y=alt.Y("feature_2:N", sort=features, title=None),
+            color=alt.Color("correlation:Q", scale=alt.Scale(scheme="blueorange", domain=[-1, 1])),
+            tooltip=["feature_1:N", "feature_2:N", alt.Tooltip("correlation:Q", format=".2f")]
+        ).properties(
+            title=""
+        )
+        corr_plot_path = os.path.join(output_img, "feature_correlation.png")
+        corr_plot.save(corr_plot_path, scale_factor=2.0)
+        print(f"Feature correlation plot saved at: {corr_plot_path}")
+
+    if correlation_engine == "native":
+        X_train, y_train = train_df.drop(columns=["color"]), train_df["color"]
+
+        # Feature-label correlation check
+        with span("feature_label_pps", rows=n_rows):
+            with executor("process", n_jobs=n_jobs):
+                feat_lab_passed, pps = feature_label_check(X_train, y_train, threshold=MAX_PPS,
+                                                           sample_size=pps_sample_size)
+        print(pps[["feature", "pps", "pps_low", "pps_high"]].round(3).to_string(index=False))
+        if pps_sample_size is not None and feat_lab_passed and (pps["pps_high"] >= MAX_PPS).any():
+            print(f"Feature-Label Correlation: the 95% interval of a sampled PPS reaches {MAX_PPS}, "
+                  "consider a larger --pps-sample-size")
+
+        # Feature-feature correlation check
+        with span("feature_feature_correlation", rows=n_rows):
+            feat_feat_passed, pairs = feature_feature_check(X_train, threshold=MAX_FEATURE_CORRELATION)
+        if not pairs.empty:
+            print(pairs.round(3).to_string(index=False))
+    else:
+        from deepchecks.tabular import Dataset
+        from deepchecks.tabular.checks import FeatureLabelCorrelation, FeatureFeatureCorrelation
+
+        # Deepchecks correlation validations
+        wine_train_ds = Dataset(train_df, label="color", cat_features=[])
+
+        # Feature-label correlation check
+        with span("feature_label_pps", rows=n_rows):
+            check_feat_lab_corr = FeatureLabelCorrelation().add_condition_feature_pps_less_than(MAX_PPS)
+            feat_lab_passed = check_feat_lab_corr.run(dataset=wine_train_ds).passed_conditions()
+
+        # Feature-feature correlation check
+        with span("feature_feature_correlation", rows=n_rows):
+            check_feat_feat_corr = FeatureFeatureCorrelation().add_condition_max_number_of_pairs_above_threshold(
+                threshold=MAX_FEATURE_CORRELATION, n_pairs=0
+            )
+            feat_feat_passed = check_feat_feat_corr.run(dataset=wine_train_ds).passed_conditions()
+
+    if feat_lab_passed:
         print("Feature-Label Correlation: PASSED")
     else:
         print("Feature-Label Correlation: FAILED")
         raise ValueError("Feature-Label correlation exceeds the maximum acceptable threshold.")
 
-    # Feature-feature correlation check
-    check_feat_feat_corr = FeatureFeatureCorrelation().add_condition_max_number_of_pairs_above_threshold(
-        threshold=0.8, n_pairs=0
-    )
-    check_feat_feat_corr_result = check_feat_feat_corr.run(dataset=wine_train_ds)
-
-    if check_feat_feat_corr_result.passed_conditions():
+    if feat_feat_passed:
         print("Feature-Feature Correlation: PASSED")
     else:
         print("Feature-Feature Correlation: FAILED")
         raise ValueError("Feature-feature correlation exceeds the maximum acceptable threshold.")
 
+    cache.record(key, outputs)
+
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,40 @@
+# export_fast_predictor.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import click
+import os
+import pickle
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.data_io import WINE_FEATURES, find_table, read_table
+from src.fast_predictor import export_fast_predictor, verify_fast_predictor
+from src.instrumentation import stage
+
+
+@click.command()
+@click.option('--model-path', type=click.Path(exists=True), default="./results/models/wine_random_search.pickle",
+              help="Path to the pickled model")
+@click.option('--output', type=click.Path(), default="./results/models/wine_model.artifact",
+              help="Path to save the fast predictor artifact to")
+@click.option('--verify-data', type=str, default="./data/proc/wine_test.csv",
+              help="Data used to check the fast predictor against the model")
+@click.option('--atol', type=float, default=1e-9, help="Largest allowed difference in probabilities")
+
+@stage("export")
+def main(model_path, output, verify_data, atol):
+    '''Exports the trained pipeline to an array-backed NumPy predictor
+    and checks that it reproduces the model's probabilities.'''
+    with open(model_path, 'rb') as f:
+        model = pickle.load(f)
+
+    fast = export_fast_predictor(model)
+    X = read_table(find_table(verify_data), columns=WINE_FEATURES)
+    difference = verify_fast_predictor(fast, model, X, atol=atol)
+    print(f"Fast predictor matches the model on {len(X)} rows (max difference {difference:.3g})")
+
+    fast.save(output, source_path=model_path)
+    print(f"Fast predictor saved at: {output}")
+
+if __name__ == '__main__':
+    main()
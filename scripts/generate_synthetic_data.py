@@ -0,0 +1,38 @@
+# generate_synthetic_data.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import click
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_io import read_table
+from src.synthetic import DEFAULT_CHUNKSIZE, WineSynthesizer
+
+@click.command()
+@click.option('--raw-data', type=str, default="./data/raw/wine.csv",
+              help="Path to the real wine data the distributions are fitted to")
+@click.option('--n-rows', type=int, required=True, help="Number of synthetic rows to generate")
+@click.option('--output', type=str, required=True,
+              help="Destination .csv, .parquet or .arrow file")
+@click.option('--seed', type=int, default=123, help="Random seed of the generated rows")
+@click.option('--red-fraction', type=float, default=None,
+              help="Fraction of red wines; defaults to the fraction in the real data")
+@click.option('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+              help="Rows generated and written at a time")
+@click.option('--compression', type=str, default=None,
+              help="Compression codec for parquet/feather outputs (e.g. snappy, zstd, lz4)")
+
+def main(raw_data, n_rows, output, seed, red_fraction, chunksize, compression):
+    '''Generates synthetic wine data of any size with the per-color
+    distributions and correlations of the real data.'''
+    fractions = None if red_fraction is None else {"red": red_fraction, "white": 1 - red_fraction}
+    synthesizer = WineSynthesizer(class_fractions=fractions, random_state=seed).fit(read_table(raw_data))
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    n_written = synthesizer.write(output, n_rows, chunksize=chunksize, compression=compression)
+    print(f"{n_written:,} synthetic rows saved at: {output}")
+
+if __name__ == '__main__':
+    main()
@@ -14,15 +14,20 @@ from sklearn.metrics import (
     accuracy_score
 )
 
-from sklearn.model_selection import cross_validate
-from deepchecks.tabular import Dataset
-from deepchecks.tabular.checks import PredictionDrift
-
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from src.random_search import perform_random_search
 from src.evaluation import evaluation
+from src.drift import DriftMonitor, class_proportion_deviations
+from src.prediction_cache import PredictionCache
+from src.data_io import WINE_FEATURES, WINE_LABEL, find_table, read_table
+from src.stage_cache import StageCache, code_files
+from src.instrumentation import span, stage
+from src.fast_predictor import export_fast_predictor, verify_fast_predictor
 
+MODEL_PATH = './results/models/wine_random_search.pickle'
+ARTIFACT_PATH = './results/models/wine_model.artifact'
+DRIFT_REFERENCE_PATH = './results/models/drift_reference.npz'
 
 @click.command()
 @click.option('--train-data', type=str, help="Path to train data")
@@ -31,8 +36,20 @@ from src.evaluation import evaluation
 @click.option('--table-to', type=str, help="Path to directory where the tables will be written to")
 @click.option('--plot-to', type=str, help="Path to directory where the plots will be written to")
 @click.option('--seed', type=int, help="Random seed", default=123)
-
-def main(train_data, test_data, pipeline_path, table_to, plot_to, seed):
+@click.option('--search-strategy', type=click.Choice(["random", "path", "halving", "bayes"]), default="random",
+              help="Sample 10 values of C at random, evaluate a dense warm-started path of C values, "
+                   "run successive halving or a Bayesian (Gaussian process) search")
+@click.option('--time-budget', type=float, default=None,
+              help="Seconds after which the halving and bayes searches stop adding rounds or candidates")
+@click.option('--backend', type=click.Choice(["process", "thread", "serial"]), default="process",
+              help="Executor of the hyperparameter search")
+@click.option('--n-jobs', type=int, default=-1, help="Number of search workers; -1 uses all available cores")
+@click.option('--drift-engine', type=click.Choice(["native", "deepchecks"]), default="native",
+              help="Compute the prediction drift with NumPy, or with deepchecks' PredictionDrift")
+
+@stage("evaluation")
+def main(train_data, test_data, pipeline_path, table_to, plot_to, seed, search_strategy, time_budget,
+         backend, n_jobs, drift_engine):
     '''Optimize the wine chromatic profile classifier
     and evaluates the wine chromatic profile classifier on the test data 
     and saves the optimization and evaluation results.'''
@@ -45,11 +62,32 @@ def main(train_data, test_data, pipeline_path, table_to, plot_to, seed):
     if not os.path.exists(plot_to):
         os.mkdir(plot_to)
 
+    train_data = find_table(train_data)
+    test_data = find_table(test_data)
+    outputs = [MODEL_PATH, ARTIFACT_PATH, DRIFT_REFERENCE_PATH] + [
+        os.path.join(table_to, name) for name in
+        ["cross_validation.csv", "drift_score.csv", "random_search.csv", "test_scores.csv"]
+    ] + [
+        os.path.join(plot_to, name) for name in ["confusion_matrix.png", "pr_curve.png"]
+    ]
+    cache = StageCache("evaluation")
+    key = cache.key(
+        inputs=[train_data, test_data, pipeline_path],
+        params={"seed": seed, "search_strategy": search_strategy, "time_budget": time_budget,
+                "drift_engine": drift_engine, "outputs": outputs},
+        code=code_files(__file__)
+    )
+    if cache.is_fresh(key, outputs):
+        print("Evaluation: data, pipeline and seed unchanged, reusing cached model and results")
+        return
+
     # Read in data & wine_pipe (pipeline object)
-    wine_train = pd.read_csv(train_data)
-    wine_test = pd.read_csv(test_data)
-    with open(pipeline_path, 'rb') as f:
-        wine_pipe = pickle.load(f)
+    with span("read") as step:
+        wine_train = read_table(train_data, columns=WINE_FEATURES + [WINE_LABEL])
+        wine_test = read_table(test_data, columns=WINE_FEATURES + [WINE_LABEL])
+        with open(pipeline_path, 'rb') as f:
+            wine_pipe = pickle.load(f)
+        step.rows = len(wine_train) + len(wine_test)
 
     # Split train and test data into X and y
     X_train = wine_train.drop(columns = ["color"])
@@ -57,7 +95,7 @@ def main(train_data, test_data, pipeline_path, table_to, plot_to, seed):
     X_test = wine_test.drop(columns = ["color"])
     y_test = wine_test["color"]
 
-    # Running cross validation on default model
+    # Metrics collected for every candidate during the search
     scoring = {
         "accuracy": 'accuracy',
         'precision': make_scorer(precision_score, pos_label = 'red'),
@@ -65,53 +103,81 @@ def main(train_data, test_data, pipeline_path, table_to, plot_to, seed):
         'f1': make_scorer(f1_score, pos_label = 'red')
     }
 
-    # Hyperparameter Optimization with RandomizedSearchCV via F1 scoring
+    # Hyperparameter Optimization with RandomizedSearchCV, picking the best model via F1 scoring
     random_search, best_estimator = perform_random_search(wine_pipe, X_train, y_train, seed, 
-        './results/models/wine_random_search.pickle'
+        MODEL_PATH, strategy=search_strategy, scoring=scoring, refit="f1",
+        backend=backend, n_jobs=n_jobs, time_budget=time_budget
     )
     
     random_search_df = pd.DataFrame(random_search.cv_results_)[
         [
-            "mean_train_score",
-            "mean_test_score",
+            "mean_train_f1",
+            "mean_test_f1",
             "param_logisticregression__C",
             "mean_fit_time",
-            "rank_test_score"
+            "rank_test_f1"
         ]
-    ].set_index("rank_test_score").sort_index().T
+    ].rename(columns={
+        "mean_train_f1": "mean_train_score",
+        "mean_test_f1": "mean_test_score",
+        "rank_test_f1": "rank_test_score"
+    }).set_index("rank_test_score").sort_index().T
     random_search_df.to_csv(os.path.join(table_to, "random_search.csv"))
 
-    cv_df = pd.DataFrame(
-        cross_validate(best_estimator, X_train, y_train, cv = 5, scoring = scoring)
-    ).agg(['mean']).round(3).T.reset_index()
-
-    cv_df = cv_df[~cv_df['index'].isin(["fit_time", "score_time"])]
-    cv_df = cv_df.set_index('index').T
+    # Cross validation scores of the best model, taken from the same folds as the search
+    cv_df = pd.DataFrame({
+        f"test_{metric}": [random_search.cv_results_[f"mean_test_{metric}"][random_search.best_index_]]
+        for metric in scoring
+    }).round(3)
     cv_df.to_csv(os.path.join(table_to, "cross_validation.csv"), index=False)
 
     # Results
+    # Train and test predictions are scored once and shared by the evaluation and the drift check
+    predictions = PredictionCache()
     # call test_evalutaion function to evaluate test scores, plot confusion matrix and PR-curve
-    evaluation(random_search, X_test, y_test, "red", table_to, plot_to)
+    evaluation(random_search, X_test, y_test, "red", table_to, plot_to, cache=predictions)
+    y_pred_train, y_proba_train = predictions.predict(random_search, X_train)
+    y_pred_test, y_proba_test = predictions.predict(random_search, X_test)
 
-    # Prediction drift check
-    wine_train_ds = Dataset(wine_train, label="color", cat_features=[])
-    wine_test_ds = Dataset(wine_test, label="color", cat_features=[])
-    target_drift_check = PredictionDrift()
-
-    expected_distribution = {"red": 0.25, "white": 0.75} 
-    actual_distribution = wine_train['color'].value_counts(normalize=True).to_dict()
-
-    for cat, prob in expected_distribution.items():
-        if abs(actual_distribution.get(cat) - prob) > 0.1:
-            print(f"Class '{cat}' deviates significantly from the expected distribution {prob}.")
+    # Export the best model as a memory-mappable artifact for fast loading and scoring
+    with span("export_fast_predictor", rows=len(X_test)):
+        fast_predictor = export_fast_predictor(random_search)
+        verify_fast_predictor(fast_predictor, random_search, X_test, proba=y_proba_test)
+        fast_predictor.save(ARTIFACT_PATH, source_path=MODEL_PATH)
 
-    target_dist_result = target_drift_check.run(
-        wine_train_ds, 
-        wine_test_ds, 
-        model = random_search.best_estimator_
-    )
-    drift_df =  pd.DataFrame([target_dist_result.reduce_output()])
-    drift_df.to_csv(os.path.join(table_to, "drift_score.csv"))
+    # Prediction drift check
+    with span("drift_check", rows=len(wine_train) + len(wine_test)):
+        expected_distribution = {"red": 0.25, "white": 0.75} 
+        for cat, prob in class_proportion_deviations(wine_train["color"], expected_distribution).items():
+            print(f"Class '{cat}' deviates significantly from the expected distribution {expected_distribution[cat]}.")
+
+        # The training predictions are the reference that live scoring traffic is monitored against
+        pos_index = list(random_search.classes_).index("red")
+        monitor = DriftMonitor(y_proba_train[:, pos_index], y_pred_train)
+        monitor.save(DRIFT_REFERENCE_PATH)
+
+        if drift_engine == "native":
+            drift = monitor.score(y_proba_test[:, pos_index], y_pred_test)
+            drift_df = pd.DataFrame([{"Prediction Drift Score": drift["ks"]}])
+        else:
+            from deepchecks.tabular import Dataset
+            from deepchecks.tabular.checks import PredictionDrift
+
+            wine_train_ds = Dataset(wine_train, label="color", cat_features=[])
+            wine_test_ds = Dataset(wine_test, label="color", cat_features=[])
+            target_dist_result = PredictionDrift().run(
+                wine_train_ds, 
+                wine_test_ds, 
+                y_pred_train = y_pred_train,
+                y_pred_test = y_pred_test,
+                y_proba_train = y_proba_train,
+                y_proba_test = y_proba_test,
+                model_classes = list(random_search.classes_)
+            )
+            drift_df =  pd.DataFrame([target_dist_result.reduce_output()])
+        drift_df.to_csv(os.path.join(table_to, "drift_score.csv"))
+
+    cache.record(key, outputs)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -8,41 +8,43 @@ import numpy as np
 import pandas as pd
 import pickle
 from sklearn import set_config
-from sklearn.preprocessing import StandardScaler, OrdinalEncoder
-from sklearn.compose import make_column_transformer
 from sklearn.linear_model import LogisticRegression
 from sklearn.pipeline import make_pipeline
 
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.preprocessing import make_preprocessor
+from src.stage_cache import StageCache, code_files
+from src.instrumentation import stage
+
 
 @click.command()
 @click.option('--pipe-to', type=str, help="Path to directory where the pipeline object will be written to")
 @click.option('--seed', type=int, help="Random seed", default=123)
 
+@stage("model")
 def main(pipe_to, seed):
     '''This script makes the preprocessor and model pipeline'''
+    # The pipeline definition lives in this file and src/preprocessing.py, so the code digest covers it
+    pipe_path = os.path.join(pipe_to, "wine_pipeline.pickle")
+    cache = StageCache("model")
+    key = cache.key(params={"seed": seed, "pipe_to": pipe_to}, code=code_files(__file__))
+    if cache.is_fresh(key, [pipe_path]):
+        print("Model: pipeline definition unchanged, reusing cached pipeline")
+        return
+
     np.random.seed(seed)
     set_config(transform_output="pandas")
 
-    ordinal_features = ["quality"]
-    numerical_features = [
-        'fixed_acidity', 'volatile_acidity', 'citric_acid', 'residual_sugar', 'chlorides', 
-        'free_sulfur_dioxide', 'total_sulfur_dioxide', 'density', 'pH', 'sulphates', 'alcohol'
-    ]
-
-    preprocessor = make_column_transformer(
-        (OrdinalEncoder(dtype=int), ordinal_features),
-        (StandardScaler(), numerical_features),
-        remainder='passthrough' 
-    )
     wine_pipe = make_pipeline(
-        preprocessor, 
+        make_preprocessor(), 
         LogisticRegression(random_state=seed, max_iter=1000, class_weight="balanced"),
     )
     
     # save pipeline
-    pipe_path = os.path.join(pipe_to, "wine_pipeline.pickle")
     os.makedirs(os.path.dirname(pipe_path), exist_ok=True)
     pickle.dump(wine_pipe, open(pipe_path, "wb"))
+    cache.record(key, [pipe_path])
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
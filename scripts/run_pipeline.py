@@ -0,0 +1,104 @@
+# run_pipeline.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import click
+import importlib
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.orchestrator import check_dag, critical_path, run_dag
+
+TRAIN_DATA = "./data/proc/wine_train.csv"
+TEST_DATA = "./data/proc/wine_test.csv"
+
+
+def script_stage(script, args, after=(), shares=()):
+    """
+    Defines a pipeline stage that runs one of the scripts in this directory.
+
+    The script's module is imported before the stage starts, so its imports are
+    paid once and inherited by the forked process running it.
+
+    Parameters:
+        script (str): Module name of the script, e.g. "preprocessing".
+        args (list): Command-line arguments of the script.
+        after (list, optional): Stages that must finish first. Defaults to ().
+        shares (list, optional): Tables the stage writes that later stages read. Defaults to ().
+
+    Returns:
+        dict: The stage definition for `run_dag`.
+    """
+    module = f"scripts.{script}"
+
+    def prepare():
+        importlib.import_module(module)
+
+    def run():
+        importlib.import_module(module).main.main(args=list(args), standalone_mode=False)
+
+    return {"run": run, "prepare": prepare, "after": list(after), "shares": list(shares)}
+
+
+# The stages of the Makefile; the pipeline definition does not read the split, so it runs alongside it
+STAGES = {
+    "validate": script_stage("validation_before_split", ["--file_name", "wine.csv", "--data_path", "./data/raw"]),
+    "split": script_stage("clean_n_split_data", ["--raw-data", "./data/raw/wine.csv"],
+                          shares=[TRAIN_DATA, TEST_DATA]),
+    "model": script_stage("preprocessing", ["--pipe-to", "./results/models"]),
+    "eda": script_stage("eda_n_correlation_check", [
+        "--train-file", TRAIN_DATA, "--output-img", "./results/figures", "--output-table", "./results/tables"
+    ], after=["validate", "split"]),
+    "evaluate": script_stage("model_evaluation_wine_predictor", [
+        "--train-data", TRAIN_DATA, "--test-data", TEST_DATA,
+        "--pipeline-path", "./results/models/wine_pipeline.pickle",
+        "--table-to", "./results/tables", "--plot-to", "./results/figures"
+    ], after=["split", "model"])
+}
+
+
+def with_dependencies(stages, targets):
+    """Selects the target stages and every stage they depend on."""
+    selected = set()
+    pending = list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending += stages[name]["after"]
+    return {name: definition for name, definition in stages.items() if name in selected}
+
+
+@click.command()
+@click.option('--stage', 'targets', type=click.Choice(list(STAGES)), multiple=True, default=list(STAGES),
+              help="Stage to run together with the stages it depends on; can be repeated. Defaults to all")
+@click.option('--workers', type=int, default=None,
+              help="Largest number of stages running at once; defaults to the number of cores, 1 runs them in order")
+@click.option('--report', type=click.Path(), default="./results/perf/pipeline.csv",
+              help="CSV file for the start, end and duration of every stage")
+
+def main(targets, workers, report):
+    '''Runs the analysis pipeline as a DAG, running independent stages in parallel,
+    and reports the time of every stage and the critical path.'''
+    stages = with_dependencies(STAGES, targets)
+    check_dag(stages)
+    results = run_dag(stages, workers=workers)
+
+    os.makedirs(os.path.dirname(os.path.abspath(report)), exist_ok=True)
+    results.to_csv(report, index=False)
+    print(results.drop(columns=["error"]).round(2).to_string(index=False))
+
+    done = results[results["status"] == "done"]
+    path, seconds = critical_path(stages, dict(zip(done["stage"], done["seconds"])))
+    if path:
+        print(f"Critical path: {' -> '.join(path)} ({seconds:.2f}s); wall time {results['end'].max():.2f}s, "
+              f"total stage time {done['seconds'].sum():.2f}s")
+    failed = results[results["status"] == "failed"]
+    for name, error in zip(failed["stage"], failed["error"]):
+        print(f"Stage '{name}' failed:\n{error}", file=sys.stderr)
+    if not failed.empty:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
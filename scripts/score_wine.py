@@ -0,0 +1,62 @@
+# score_wine.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import click
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.model_artifact import load_model
+from src.drift import DriftMonitor
+from src.scoring import score_table
+from src.instrumentation import stage
+
+
+@click.command()
+@click.option('--input', 'input_path', type=click.Path(exists=True), required=True,
+              help="Path to the CSV, Parquet or Arrow file of wine samples to score")
+@click.option('--output', 'output_path', type=click.Path(), required=True,
+              help="Path to write the predictions to (.csv, .parquet or .arrow)")
+@click.option('--model-path', type=click.Path(exists=True), default="./results/models/wine_model.artifact",
+              help="Path to the exported .artifact file or a pickled model")
+@click.option('--chunksize', type=int, default=100_000, help="Number of rows scored at a time")
+@click.option('--pos-label', type=str, default="red", help="Class whose probability is written")
+@click.option('--compression', type=str, default=None, help="Compression codec for parquet/arrow outputs")
+@click.option('--drift-reference', type=click.Path(), default=None,
+              help="Reference predictions saved by the evaluation (drift_reference.npz) to monitor drift against")
+@click.option('--drift-window', type=int, default=10_000, help="Rows per drift window")
+@click.option('--drift-step', type=int, default=None,
+              help="Rows between the starts of two drift windows; smaller than the window for sliding windows")
+@click.option('--drift-to', type=click.Path(), default="./results/tables/drift_windows.csv",
+              help="Path to write the drift score of every window to")
+
+@stage("score")
+def main(input_path, output_path, model_path, chunksize, pos_label, compression,
+         drift_reference, drift_window, drift_step, drift_to):
+    '''Scores a large table of wine samples in chunks with the trained model
+    and writes the predicted colour and class probability of every row.'''
+    model = load_model(model_path)
+    monitor = None
+    if drift_reference is not None:
+        monitor = DriftMonitor.load(drift_reference, window=drift_window, step=drift_step)
+
+    def report(totals):
+        click.echo(f"Scored {totals['rows']:,} rows ({totals['rows_per_second']:,.0f} rows/s)", err=True)
+
+    totals = score_table(model, input_path, output_path, chunksize=chunksize,
+                         pos_label=pos_label, compression=compression, progress=report, monitor=monitor)
+    click.echo(f"Predictions for {totals['rows']:,} rows saved at: {output_path} "
+               f"in {totals['seconds']:.2f}s ({totals['rows_per_second']:,.0f} rows/s)")
+
+    if monitor is not None:
+        drift_df = monitor.results()
+        os.makedirs(os.path.dirname(os.path.abspath(drift_to)), exist_ok=True)
+        drift_df.to_csv(drift_to)
+        if len(drift_df):
+            click.echo(f"Drift of {len(drift_df):,} windows saved at: {drift_to} "
+                       f"(largest score {drift_df['Prediction Drift Score'].max():.3f})")
+        else:
+            click.echo(f"Fewer than {drift_window:,} rows were scored, no drift window completed")
+
+if __name__ == '__main__':
+    main()
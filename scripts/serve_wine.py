@@ -0,0 +1,39 @@
+# serve_wine.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import click
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.model_artifact import load_model
+from src.serving import MicroBatcher, make_server
+
+
+@click.command()
+@click.option('--model-path', type=click.Path(exists=True), default="./results/models/wine_model.artifact",
+              help="Path to the exported .artifact file or a pickled model")
+@click.option('--host', type=str, default="127.0.0.1", help="Interface to listen on")
+@click.option('--port', type=int, default=8000, help="Port to listen on")
+@click.option('--max-batch-size', type=int, default=256, help="Maximum number of rows scored per batch")
+@click.option('--max-latency-ms', type=float, default=5.0,
+              help="Longest time a request waits for other requests to join its batch")
+
+def main(model_path, host, port, max_batch_size, max_latency_ms):
+    '''Serves wine colour predictions over HTTP, micro-batching concurrent requests.'''
+    model = load_model(model_path)
+
+    batcher = MicroBatcher(model, max_batch_size=max_batch_size, max_latency_ms=max_latency_ms).start()
+    server = make_server(batcher, host, port)
+    click.echo(f"Serving predictions on http://{host}:{server.server_address[1]}/predict "
+               f"(metrics at /metrics)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.stop()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+# train_online.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import click
+import os
+import pandas as pd
+import pickle
+from sklearn import set_config
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.data_io import WINE_FEATURES, WINE_LABEL, find_table, read_table
+from src.instrumentation import span, stage
+from src.model_artifact import load_model
+from src.online_training import DEFAULT_REFIT_EVERY, OnlineWineModel, compare_models
+
+
+@click.command()
+@click.option('--train-data', type=str, default="./data/proc/wine_train.csv",
+              help="Path to the training history before the first batch, used for the first fit and every full refit")
+@click.option('--test-data', type=str, default="./data/proc/wine_test.csv", help="Path to test data")
+@click.option('--batch', 'batch_path', type=click.Path(exists=True), default=None,
+              help="Path to a new batch of labelled samples to update the model with")
+@click.option('--model-path', type=click.Path(), default="./results/models/wine_online.pickle",
+              help="Path of the online model, created on the first run and updated on the next ones")
+@click.option('--batch-model-path', type=click.Path(), default="./results/models/wine_random_search.pickle",
+              help="Path to the model trained by model_evaluation_wine_predictor.py to compare with")
+@click.option('--table-to', type=str, default="./results/tables", help="Path to directory where the tables will be written to")
+@click.option('--refit-every', type=int, default=DEFAULT_REFIT_EVERY,
+              help="Number of batches after which the model is refit on the whole history")
+@click.option('--max-accuracy-gap', type=float, default=0.01,
+              help="Refit on the whole history when the test accuracy falls this far below the batch model")
+
+@stage("online")
+def main(train_data, test_data, batch_path, model_path, batch_model_path, table_to, refit_every,
+         max_accuracy_gap):
+    '''Updates the online wine chromatic profile classifier with a new batch of samples
+    and compares its test scores with the batch model.'''
+    # The batch model was fitted with pandas outputs between its steps
+    set_config(transform_output="pandas")
+    columns = WINE_FEATURES + [WINE_LABEL]
+
+    with span("read") as step:
+        wine_train = read_table(find_table(train_data), columns=columns)
+        wine_test = read_table(find_table(test_data), columns=columns)
+        step.rows = len(wine_train) + len(wine_test)
+    X_test, y_test = wine_test.drop(columns=["color"]), wine_test["color"]
+
+    # The online model uses the regularization chosen by the hyperparameter search
+    batch_model = load_model(batch_model_path) if os.path.exists(batch_model_path) else None
+    C = getattr(batch_model, "best_params_", {}).get("logisticregression__C", 1.0)
+
+    def refit(reason):
+        """Refits the model on the training history and every batch applied so far."""
+        with span("fit") as step:
+            history = pd.concat([wine_train] + [read_table(find_table(path), columns=columns)
+                                                for path in model.batch_paths_], ignore_index=True)
+            step.rows = len(history)
+            model.C = C
+            model.fit(history.drop(columns=["color"]), history["color"])
+        print(f"Online model refit on {len(history)} rows ({len(model.batch_paths_)} batches) {reason}")
+
+    if not os.path.exists(model_path):
+        with span("fit", rows=len(wine_train)):
+            model = OnlineWineModel(C=C, refit_every=refit_every).fit(
+                wine_train.drop(columns=["color"]), wine_train["color"]
+            )
+        # Batches are not in the training history, so they are kept for the refits
+        model.batch_paths_ = []
+        print(f"Online model fitted on {len(wine_train)} rows")
+    else:
+        with open(model_path, 'rb') as f:
+            model = pickle.load(f)
+        model.refit_every = refit_every
+
+    if batch_path is not None:
+        batch_path = os.path.abspath(batch_path)
+        if batch_path in model.batch_paths_:
+            raise click.BadParameter(f"{batch_path} was already applied to the model", param_hint="--batch")
+        with span("partial_fit") as step:
+            batch = read_table(find_table(batch_path), columns=columns)
+            model.partial_fit(batch.drop(columns=["color"]), batch["color"])
+            step.rows = len(batch)
+        model.batch_paths_.append(batch_path)
+        print(f"Online model updated with {len(batch)} rows "
+              f"({model.batches_since_refit_} batches since the last full refit)")
+    if model.refit_due:
+        refit(f"after {refit_every} batches")
+
+    models = {"online": model} if batch_model is None else {"online": model, "batch": batch_model}
+    comparison = compare_models(models, X_test, y_test)
+    if batch_model is not None:
+        gap = comparison.loc[1, "accuracy"] - comparison.loc[0, "accuracy"]
+        if gap > max_accuracy_gap and model.batches_since_refit_ > 0:
+            refit(f"as its accuracy was {gap:.3f} below the batch model")
+            comparison = compare_models(models, X_test, y_test)
+
+    os.makedirs(table_to, exist_ok=True)
+    comparison_path = os.path.join(table_to, "online_comparison.csv")
+    comparison.to_csv(comparison_path, index=False)
+    print(comparison.round(4).to_string(index=False))
+
+    os.makedirs(os.path.dirname(os.path.abspath(model_path)), exist_ok=True)
+    with open(model_path, 'wb') as f:
+        pickle.dump(model, f)
+    print(f"Online model saved at: {model_path}")
+
+if __name__ == '__main__':
+    main()
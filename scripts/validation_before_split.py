@@ -5,68 +5,33 @@
 import os
 import click
 import pandas as pd
-import pandera as pa
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from src.validate_column_names import validate_column_names
+from src.validation import validate_wine, validate_wine_file
+from src.stage_cache import StageCache, code_files
+from src.instrumentation import span, stage
 
-# Define schemas for validation
-def define_schemas():
-    # Checking for missingness
-    base_checks = [pa.Check(lambda s: s.isna().mean() <= 0.05, element_wise=False, error="Too many null values.")]
-    
-    general_schema = pa.DataFrameSchema({
-        "fixed_acidity": pa.Column(float, base_checks, nullable=True),
-        "volatile_acidity": pa.Column(float, base_checks, nullable=True),
-        "citric_acid": pa.Column(float, base_checks, nullable=True),
-        "residual_sugar": pa.Column(float, base_checks, nullable=True),
-        "chlorides": pa.Column(float, base_checks, nullable=True),
-        "free_sulfur_dioxide": pa.Column(float, base_checks, nullable=True),
-        "total_sulfur_dioxide": pa.Column(float, base_checks, nullable=True),
-        "density": pa.Column(float, base_checks, nullable=True),
-        "pH": pa.Column(float, base_checks, nullable=True),
-        "sulphates": pa.Column(float, base_checks, nullable=True),
-        "alcohol": pa.Column(float, base_checks, nullable=True),
-        "quality": pa.Column(int, base_checks, nullable=True),
-        "color": pa.Column(str, base_checks, nullable=True)
-    })
-
-    outlier_schema = pa.DataFrameSchema({
-        "fixed_acidity": pa.Column(float, pa.Check.between(3.5, 16)),
-        "volatile_acidity": pa.Column(float, pa.Check.between(0.08, 1.6)),
-        "citric_acid": pa.Column(float, pa.Check.between(0.0, 1)),
-        "residual_sugar": pa.Column(float, pa.Check.between(0.5, 66)),
-        "chlorides": pa.Column(float, pa.Check.between(0.01, 0.7)),
-        "free_sulfur_dioxide": pa.Column(float, pa.Check.between(0, 200)),
-        "total_sulfur_dioxide": pa.Column(float, pa.Check.between(0, 400)),
-        "density": pa.Column(float, pa.Check.between(0.985, 1.04)),
-        "pH": pa.Column(float, pa.Check.between(2.5, 4.0)),
-        "sulphates": pa.Column(float, pa.Check.between(0.2, 1.8)),
-        "alcohol": pa.Column(float, pa.Check.between(8.0, 15.0)),
-        "quality": pa.Column(int, pa.Check.between(3, 9))
-    })
-
-    category_schema = pa.DataFrameSchema({
-        "color": pa.Column(str, pa.Check.isin(["red", "white"]))
-    })
 
-    duplicate_check = pa.DataFrameSchema(checks=[
-        pa.Check(lambda df: ~df.duplicated().any(), error="Duplicate rows found.")
-    ])
-
-    empty_row_check = pa.DataFrameSchema(
-            checks=[
-                pa.Check(lambda df: ~(df.isna().all(axis=1)).any(), error="Empty rows found.")
-    ])
-
-    return general_schema, outlier_schema, category_schema, duplicate_check, empty_row_check
+# Groups of report checks and the name printed for each group
+CHECK_GROUPS = {
+    "General validation": ["dtype", "missingness"],
+    "Empty row check": ["empty_rows"],
+    "Outlier validation": ["range"],
+    "Category validation": ["category"],
+    "Duplicate check": ["duplicates"]
+}
 
 
 @click.command()
 @click.option("--file_name", required=True, help="Name of the input CSV file.")
 @click.option("--data_path", required=True, help="Path to the directory containing the file.")
+@click.option("--chunksize", type=int, default=None, help="Validate the file in chunks of this many rows.")
+@click.option("--report-to", type=str, default="./results/tables/validation_report.csv",
+              help="Path to write the report of every check to.")
 # Main function for script execution
-def main(file_name, data_path):
+@stage("validate")
+def main(file_name, data_path, chunksize, report_to):
     path = os.path.join(data_path, file_name)
     
     # 1. Validate file existence and format
@@ -76,8 +41,22 @@ def main(file_name, data_path):
         raise ValueError("File extension is not in .csv format")
     print("File existence and format test passed!")
 
-    # Read data
-    wine = pd.read_csv(path)
+    # Reuse the report if this exact file was already validated by the same code, whether it passed or not
+    cache = StageCache("validate")
+    key = cache.key(inputs=[path], params={"chunksize": chunksize, "report_to": report_to},
+                    code=code_files(__file__))
+    if cache.is_fresh(key, [report_to]):
+        print("Validation: data unchanged since the last validation run, reusing its report")
+        report = pd.read_csv(report_to)
+        # Table-wide checks such as duplicates have no column
+        report["column"] = report["column"].astype(object).where(report["column"].notna(), None)
+        print_report(report)
+        return
+
+    # Read data (only the header when validating in chunks)
+    with span("read") as step:
+        wine = pd.read_csv(path, nrows=0 if chunksize else None)
+        step.rows = len(wine)
     
     # Define correct columns
     correct_columns = {
@@ -89,56 +68,27 @@ def main(file_name, data_path):
     # 2. Validate column names
     validate_column_names(wine, correct_columns)
     
-    # Load schemas
-    general_schema, outlier_schema, category_schema, duplicate_check, empty_row_check = define_schemas()
-
-    # 3, 4 General validation #Missingness check
-    # General validation (Colum type check & Missingness check)
-    try:
-        general_schema.validate(wine, lazy=True)
-        print("General validation passed!")
-    except pa.errors.SchemaErrors as e:
-        print("General validation failed:", e)
-
-    # 5.Category validation # Checking correct column types
-    # Empty row validation
-    try:
-        empty_row_check.validate(wine, lazy=True)
-        print("Empty row check passed!")
-    except pa.errors.SchemaErrors as e:
-        print("Empty row check failed:")
-        print(pd.DataFrame(e.failure_cases).to_string())
-
-    # Outlier validation
-    try:
-        outlier_schema.validate(wine, lazy=True)
-        print("Outlier validation passed!")
-    except pa.errors.SchemaErrors as e:
-        print("Outlier validation failed:")
-        print(pd.DataFrame(e.failure_cases).to_string())
-
-    # Category validation
-    try:
-        category_schema.validate(wine, lazy=True)
-        print("Category validation passed!")
-    except pa.errors.SchemaErrors as e:
-        print("Category validation failed:", e)
-
-    # 6. Duplicate row validation
-    try:
-        duplicate_check.validate(wine, lazy=True)
-        print("Duplicate check passed!")
-    except pa.errors.SchemaErrors as e:
-        print("Duplicate check failed:")
-        print(pd.DataFrame(e.failure_cases).to_string())
-
-    # 7. Outlier validation
-    try:
-        outlier_schema.validate(wine, lazy=True)
-        print("Outlier validation passed!")
-    except pa.errors.SchemaErrors as e:
-        print("Outlier validation failed:")
-        print(pd.DataFrame(e.failure_cases).to_string())
+    # 3-7. Type, missingness, empty row, outlier, category and duplicate validation in one pass
+    if chunksize:
+        report = validate_wine_file(path, chunksize)
+    else:
+        report = validate_wine(wine)
+
+    print_report(report)
+    os.makedirs(os.path.dirname(os.path.abspath(report_to)), exist_ok=True)
+    report.to_csv(report_to, index=False)
+    cache.record(key, [report_to])
+
+
+def print_report(report):
+    """Prints whether each group of checks passed, and the failed checks."""
+    for group, checks in CHECK_GROUPS.items():
+        results = report[report["check"].isin(checks)]
+        if results["passed"].all():
+            print(f"{group} passed!")
+        else:
+            print(f"{group} failed:")
+            print(results[~results["passed"]].to_string(index=False))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,260 @@
+# adaptive_search.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import math
+import time
+import warnings
+import numpy as np
+from scipy.stats import norm, rv_discrete
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.gaussian_process import GaussianProcessRegressor
+from sklearn.gaussian_process.kernels import ConstantKernel, Matern, WhiteKernel
+from sklearn.model_selection import ParameterSampler
+from sklearn.utils import check_random_state
+from src.fold_cache import CachedRandomizedSearchCV, FoldCache, check_scorers, format_cv_results
+from src.parallel import SharedArrays, uses_processes
+
+
+class SuccessiveHalvingSearchCV(CachedRandomizedSearchCV):
+    """
+    Randomized search that spends training rows only on promising candidates.
+
+    All sampled candidates are first fitted on a small random subset of each
+    fold's training rows. After every round only the best 1 / `factor` of them
+    are kept, and the survivors are refitted on `factor` times more rows, until
+    the last round uses every training row. Every round is scored on the full
+    validation part of each fold, which is preprocessed once through a `FoldCache`.
+
+    `cv_results_` has one row per candidate and round, with the round in "iter"
+    and its number of training rows in "n_resources". Candidates of later rounds
+    rank ahead of earlier ones, and the best candidate comes from the last round.
+
+    Parameters:
+        estimator (Pipeline): The unfitted pipeline; sampled parameters must belong to its last step.
+        param_distributions (dict): Distributions or lists of values to sample from.
+        n_candidates (int, optional): Number of candidates in the first round. Defaults to 30.
+        factor (int, optional): Rate at which candidates are dropped and rows added. Defaults to 3.
+        min_resources (int, optional): Training rows per fold in the first round. Defaults to
+                                       the number that makes the last round use all rows.
+        time_budget (float, optional): Seconds after which no new round is started; the best
+                                       candidate then comes from the last finished round.
+                                       Defaults to None (no limit).
+        scoring, refit, cv, n_jobs, random_state, return_train_score: As in `RandomizedSearchCV`.
+
+    Example:
+        search = SuccessiveHalvingSearchCV(wine_pipe, {"logisticregression__C": loguniform(1e-1, 10)},
+                                           time_budget=60)
+        search.fit(X_train, y_train)
+    """
+    def __init__(self, estimator, param_distributions, *, n_candidates=30, factor=3,
+                 min_resources=None, time_budget=None, scoring=None, refit=True, cv=5,
+                 n_jobs=None, random_state=None, return_train_score=False):
+        super().__init__(estimator, param_distributions, n_iter=n_candidates, scoring=scoring,
+                         refit=refit, cv=cv, n_jobs=n_jobs, random_state=random_state,
+                         return_train_score=return_train_score)
+        self.n_candidates = n_candidates
+        self.factor = factor
+        self.min_resources = min_resources
+        self.time_budget = time_budget
+
+    def fit(self, X, y):
+        """
+        Runs the rounds of successive halving and refits the best candidate on all the data.
+
+        Parameters:
+            X (pd.DataFrame): Training features.
+            y (pd.Series): Training labels.
+
+        Returns:
+            SuccessiveHalvingSearchCV: The fitted search.
+        """
+        start = time.perf_counter()
+        rng = check_random_state(self.random_state)
+        candidates = list(ParameterSampler(self.param_distributions, self.n_candidates,
+                                           random_state=rng))
+        self._check_candidates(candidates)
+        self.scorer_ = check_scorers(self.estimator, self.scoring, self.refit)
+        folds = FoldCache(self.estimator[:-1], self.cv).fit(X, y).folds_
+        # Shuffle each fold's training rows once, so that every round trains on a random subset
+        for fold in folds:
+            order = rng.permutation(len(fold["y_train"]))
+            fold["X_train"], fold["y_train"] = fold["X_train"][order], fold["y_train"][order]
+
+        max_resources = min(len(fold["y_train"]) for fold in folds)
+        n_rounds = 1 + int(math.log(len(candidates), self.factor) + 1e-9)
+        min_resources = self.min_resources or max_resources // self.factor ** (n_rounds - 1)
+        metric = _ranking_metric(self.scorer_, self.refit)
+
+        rows, results, iters, resources = [], [], [], []
+        with SharedArrays(uses_processes(self.n_jobs)) as shared:
+            shared_folds = [shared.share_all(fold) for fold in folds]
+            survivors = candidates
+            for i in range(n_rounds):
+                if i > 0 and self.time_budget is not None and time.perf_counter() - start > self.time_budget:
+                    break
+                n_rows = max_resources if i == n_rounds - 1 else min(max_resources, min_resources * self.factor ** i)
+                subsets = [dict(fold, X_train=fold["X_train"][:n_rows], y_train=fold["y_train"][:n_rows])
+                           for fold in shared_folds]
+                round_results = self._evaluate(survivors, subsets)
+
+                rows += survivors
+                results += round_results
+                iters += [i] * len(survivors)
+                resources += [n_rows] * len(survivors)
+
+                scores = _mean_test_score(round_results, len(folds), metric)
+                n_keep = max(1, math.ceil(len(survivors) / self.factor))
+                survivors = [survivors[j] for j in np.argsort(-scores, kind="stable")[:n_keep]]
+
+        self.n_splits_ = len(folds)
+        self.n_iterations_ = max(iters) + 1
+        self.n_resources_ = sorted(set(resources))
+        self.n_candidates_ = [iters.count(i) for i in range(self.n_iterations_)]
+        cv_results = format_cv_results(rows, results, len(folds), self.return_train_score)
+        cv_results["iter"] = np.array(iters)
+        cv_results["n_resources"] = np.array(resources)
+        # Candidates that reached a later round rank ahead of those dropped earlier
+        for key in [key for key in cv_results if key.startswith("rank_test_")]:
+            mean = cv_results[f"mean_test_{key[len('rank_test_'):]}"]
+            cv_results[key] = np.array([
+                1 + np.sum((cv_results["iter"] > it) | ((cv_results["iter"] == it) & (mean > score)))
+                for it, score in zip(cv_results["iter"], mean)
+            ], dtype=np.int32)
+        return self._set_results(X, y, cv_results)
+
+
+class BayesianSearchCV(CachedRandomizedSearchCV):
+    """
+    Sequential model-based search: each candidate is chosen from the results so far.
+
+    After `n_initial` random candidates, a Gaussian process is fitted to the mean
+    validation score of every evaluated candidate, and the next candidate is the
+    one with the highest expected improvement among `n_proposals` random points.
+    The parameters are searched on the unit cube, mapped to the given
+    distributions through their quantile functions (lists are split into equal
+    intervals), so a log-uniform range of C is explored on the log scale.
+    Folds are preprocessed once through a `FoldCache`.
+
+    Parameters:
+        estimator (Pipeline): The unfitted pipeline; searched parameters must belong to its last step.
+        param_distributions (dict): scipy.stats distributions or lists of values.
+        n_iter (int, optional): Largest number of candidates to evaluate. Defaults to 20.
+        n_initial (int, optional): Number of random candidates before the model is used.
+                                   Defaults to 5.
+        n_proposals (int, optional): Random points scored by the acquisition function at each
+                                     step. Defaults to 1000.
+        time_budget (float, optional): Seconds after which no new candidate is evaluated.
+                                       Defaults to None (no limit).
+        scoring, refit, cv, n_jobs, random_state, return_train_score: As in `RandomizedSearchCV`.
+
+    Example:
+        search = BayesianSearchCV(wine_pipe, {"logisticregression__C": loguniform(1e-1, 10)},
+                                  time_budget=60)
+        search.fit(X_train, y_train)
+    """
+    def __init__(self, estimator, param_distributions, *, n_iter=20, n_initial=5, n_proposals=1000,
+                 time_budget=None, scoring=None, refit=True, cv=5, n_jobs=None, random_state=None,
+                 return_train_score=False):
+        super().__init__(estimator, param_distributions, n_iter=n_iter, scoring=scoring,
+                         refit=refit, cv=cv, n_jobs=n_jobs, random_state=random_state,
+                         return_train_score=return_train_score)
+        self.n_initial = n_initial
+        self.n_proposals = n_proposals
+        self.time_budget = time_budget
+
+    def fit(self, X, y):
+        """
+        Evaluates candidates one at a time until `n_iter` or the time budget is reached,
+        then refits the best one on all the data.
+
+        Parameters:
+            X (pd.DataFrame): Training features.
+            y (pd.Series): Training labels.
+
+        Returns:
+            BayesianSearchCV: The fitted search.
+
+        Raises:
+            ValueError: If a parameter is neither a list nor a distribution with a `ppf` method.
+        """
+        start = time.perf_counter()
+        rng = check_random_state(self.random_state)
+        names = sorted(self.param_distributions)
+        for name in names:
+            dist = self.param_distributions[name]
+            if not isinstance(dist, (list, tuple)) and not hasattr(dist, "ppf"):
+                raise ValueError(f"Parameter '{name}' must be a list or a scipy.stats distribution")
+        self._check_candidates([dict.fromkeys(names)])
+        self.scorer_ = check_scorers(self.estimator, self.scoring, self.refit)
+        folds = FoldCache(self.estimator[:-1], self.cv).fit(X, y).folds_
+        metric = _ranking_metric(self.scorer_, self.refit)
+        model = GaussianProcessRegressor(
+            ConstantKernel() * Matern(length_scale=np.full(len(names), 0.2), nu=2.5)
+            + WhiteKernel(1e-4, noise_level_bounds=(1e-12, 1e-1)),
+            normalize_y=True, random_state=rng
+        )
+
+        points, scores, candidates, results = [], [], [], []
+        with SharedArrays(uses_processes(self.n_jobs)) as shared:
+            shared_folds = [shared.share_all(fold) for fold in folds]
+            while len(candidates) < self.n_iter:
+                if candidates and self.time_budget is not None and time.perf_counter() - start > self.time_budget:
+                    break
+                if len(candidates) < self.n_initial:
+                    point = rng.uniform(size=len(names))
+                else:
+                    with warnings.catch_warnings():
+                        # Scores of nearby candidates are often identical, so the fitted noise is tiny
+                        warnings.simplefilter("ignore", ConvergenceWarning)
+                        model.fit(np.array(points), np.array(scores))
+                    proposals = rng.uniform(size=(self.n_proposals, len(names)))
+                    point = proposals[np.argmax(_expected_improvement(model, proposals, max(scores)))]
+
+                params = _from_unit_cube(point, names, self.param_distributions)
+                fold_results = self._evaluate([params], shared_folds)
+                points.append(point)
+                scores.append(float(_mean_test_score(fold_results, len(folds), metric)[0]))
+                candidates.append(params)
+                results += fold_results
+
+        for i, result in enumerate(results):
+            result["fit_time"] += folds[i % len(folds)]["time"] / len(candidates)
+        self.n_splits_ = len(folds)
+        return self._set_results(X, y, format_cv_results(candidates, results, len(folds),
+                                                         self.return_train_score))
+
+
+def _ranking_metric(scorer, refit):
+    """The metric that ranks candidates during the search, or None for a single scorer."""
+    if not isinstance(scorer, dict):
+        return None
+    return refit if isinstance(refit, str) else next(iter(scorer))
+
+
+def _mean_test_score(results, n_splits, metric=None):
+    """Mean test score of each candidate over its folds, for one metric when several are scored."""
+    scores = [result["test_score"][metric] if metric else result["test_score"] for result in results]
+    return np.array(scores, dtype=float).reshape(-1, n_splits).mean(axis=1)
+
+
+def _expected_improvement(model, points, best, xi=1e-4):
+    """Expected improvement over the best score so far of the model's predictions at the points."""
+    mean, std = model.predict(points, return_std=True)
+    std = np.maximum(std, 1e-12)
+    z = (mean - best - xi) / std
+    return (mean - best - xi) * norm.cdf(z) + std * norm.pdf(z)
+
+
+def _from_unit_cube(point, names, param_distributions):
+    """Maps a point of the unit cube to parameter values through each distribution's quantiles."""
+    params = {}
+    for u, name in zip(point, names):
+        dist = param_distributions[name]
+        if isinstance(dist, (list, tuple)):
+            params[name] = dist[min(int(u * len(dist)), len(dist) - 1)]
+        elif isinstance(getattr(dist, "dist", None), rv_discrete):
+            params[name] = int(dist.ppf(u))
+        else:
+            params[name] = float(dist.ppf(u))
+    return params
@@ -0,0 +1,135 @@
+# benchmarking.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+# Relative slowdown or memory growth over the baseline reported as a regression
+TOLERANCE = 0.25
+
+
+def run_isolated(setup, stage, *args):
+    """
+    Times one pipeline stage in a fresh process and records its peak memory.
+
+    Running every stage in its own spawned process keeps the peak resident set
+    size of one stage from hiding another's. `setup` runs first, untimed, and
+    returns the stage's arguments and the number of rows it processes.
+
+    Parameters:
+        setup (callable): Module-level function called with `args`; returns a tuple of
+                          the stage arguments and the number of rows.
+        stage (callable): Module-level function to time.
+        *args: Arguments of `setup`.
+
+    Returns:
+        dict: "rows", wall-clock "seconds", "rows_per_second", the process's "peak_rss_mb"
+              and its "startup_rss_mb" (interpreter, imports and inputs) before the stage.
+              Worker processes started by the stage are not included in the memory.
+    """
+    # Not a multiprocessing.Pool: its daemon workers could not start the search's own workers
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(_measure, setup, stage, args).result()
+
+
+def environment():
+    """Describes the machine and library versions the benchmarks ran with."""
+    import sklearn
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "scikit-learn": sklearn.__version__
+    }
+
+
+def write_results(path, results):
+    """
+    Saves benchmark results with a description of the environment as JSON.
+
+    Parameters:
+        path (str): Destination .json file.
+        results (list): One dictionary per stage and dataset size.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "environment": environment(),
+                   "results": results}, f, indent=2)
+
+
+def read_results(path):
+    """Loads the results list of a file saved by `write_results`."""
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare_to_baseline(results, baseline, tolerance=TOLERANCE):
+    """
+    Compares benchmark results with a stored baseline.
+
+    Runs are matched on their stage and dataset size. A run regresses when it
+    is more than `tolerance` slower, or uses more than `tolerance` more peak
+    memory, than the baseline run.
+
+    Parameters:
+        results (list): The current results, with "stage", "dataset_rows", "seconds"
+                        and "peak_rss_mb" keys.
+        baseline (list): The baseline results.
+        tolerance (float, optional): Allowed relative change. Defaults to TOLERANCE.
+
+    Returns:
+        pd.DataFrame: One row per matched stage and metric (stage, dataset_rows, metric,
+                      baseline, current, change and a boolean "regression" column).
+    """
+    current = pd.DataFrame(results).set_index(["stage", "dataset_rows"])
+    previous = pd.DataFrame(baseline).set_index(["stage", "dataset_rows"])
+    rows = []
+    for key in current.index.intersection(previous.index):
+        for metric in ["seconds", "peak_rss_mb"]:
+            change = current.loc[key, metric] / previous.loc[key, metric] - 1
+            rows.append({
+                "stage": key[0], "dataset_rows": key[1], "metric": metric,
+                "baseline": previous.loc[key, metric], "current": current.loc[key, metric],
+                "change": change, "regression": change > tolerance
+            })
+    return pd.DataFrame(rows, columns=["stage", "dataset_rows", "metric", "baseline", "current",
+                                       "change", "regression"])
+
+
+def _peak_rss_mb():
+    # On Linux ru_maxrss keeps the peak of the parent the process was forked from, before
+    # it started the new interpreter, so the peak of this process is read from /proc
+    if os.path.exists("/proc/self/status"):
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 ** 2 if sys.platform == "darwin" else 1024)
+
+
+def _measure(setup, stage, args):
+    stage_args, n_rows = setup(*args)
+    startup = _peak_rss_mb()
+    start = time.perf_counter()
+    stage(*stage_args)
+    seconds = time.perf_counter() - start
+    return {
+        "rows": int(n_rows),
+        "seconds": seconds,
+        "rows_per_second": n_rows / seconds if seconds else 0.0,
+        "peak_rss_mb": _peak_rss_mb(),
+        "startup_rss_mb": startup
+    }
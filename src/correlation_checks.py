@@ -0,0 +1,169 @@
+# correlation_checks.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.metrics import f1_score
+from sklearn.model_selection import StratifiedKFold, train_test_split
+from sklearn.tree import DecisionTreeClassifier
+from src.eda import correlation_matrix
+from src.parallel import SharedArrays, uses_processes
+
+# Largest predictive power score allowed between a feature and the label
+MAX_PPS = 0.8
+
+# Largest absolute Spearman correlation allowed between two features
+MAX_FEATURE_CORRELATION = 0.8
+
+
+def spearman_matrix(df):
+    """
+    Computes the Spearman rank correlation of every pair of numeric columns.
+
+    Every column is ranked once (ties share their average rank) and the Pearson
+    correlation of the ranks comes from matrix products through `correlation_matrix`.
+    As in `pd.DataFrame.corr(method="spearman")`, a pair involving a column with
+    missing values is ranked again over the rows where both values are present.
+
+    Parameters:
+        df (pd.DataFrame): The data; non-numeric columns are left out.
+
+    Returns:
+        pd.DataFrame: The correlation matrix, indexed and labelled by the numeric columns.
+    """
+    numeric = df.select_dtypes("number")
+    correlation = correlation_matrix(numeric.rank())
+    incomplete = numeric.columns[numeric.isna().any()]
+    for col in incomplete:
+        for other in numeric.columns.drop(col):
+            ranks = numeric[[col, other]].dropna().rank().to_numpy()
+            correlation.loc[col, other] = correlation.loc[other, col] = np.corrcoef(ranks.T)[0, 1]
+    return correlation
+
+
+def feature_feature_check(df, threshold=MAX_FEATURE_CORRELATION, n_pairs=0):
+    """
+    Checks that few pairs of features are strongly correlated with each other.
+
+    The same condition as deepchecks' `FeatureFeatureCorrelation` with
+    `add_condition_max_number_of_pairs_above_threshold`, on the Spearman
+    correlation of the numeric features; negative correlations count by their size.
+
+    Parameters:
+        df (pd.DataFrame): The features; non-numeric columns are left out.
+        threshold (float, optional): Largest allowed absolute correlation. Defaults to
+                                     MAX_FEATURE_CORRELATION.
+        n_pairs (int, optional): Number of pairs allowed above the threshold. Defaults to 0.
+
+    Returns:
+        tuple: Whether the check passed, and a DataFrame of the pairs above the threshold
+               with the columns "feature_1", "feature_2" and "correlation".
+
+    Example:
+        passed, pairs = feature_feature_check(train_df.drop(columns=["color"]))
+    """
+    correlation = spearman_matrix(df)
+    upper = np.triu(np.abs(correlation.to_numpy()) > threshold, k=1)
+    rows, cols = np.nonzero(upper)
+    pairs = pd.DataFrame({
+        "feature_1": correlation.index[rows],
+        "feature_2": correlation.columns[cols],
+        "correlation": correlation.to_numpy()[rows, cols]
+    })
+    return len(pairs) <= n_pairs, pairs
+
+
+def pps_scores(X, y, cv=4, sample_size=None, n_jobs=None, random_state=42):
+    """
+    Computes the predictive power score (PPS) of every feature for the label.
+
+    As in deepchecks' `FeatureLabelCorrelation` (and ppscore), the score of a
+    feature is the cross-validated weighted F1 of a decision tree predicting the
+    label from that feature alone, normalized between the F1 of always predicting
+    the most common class (0) and a perfect F1 (1). The features are scored in
+    parallel on the active joblib executor (see `src.parallel.executor`), with the
+    data memory-mapped once for worker processes.
+
+    With `sample_size`, the scores are computed on a stratified sample of that
+    many rows. The standard error of each score is estimated from its spread over
+    the folds, and "pps_low" and "pps_high" bound a 95% interval around it.
+
+    Parameters:
+        X (pd.DataFrame): The numeric features.
+        y (pd.Series): The label.
+        cv (int, optional): Number of cross-validation folds. Defaults to 4.
+        sample_size (int, optional): Number of rows to sample, keeping the class
+                                     proportions. Defaults to None (all rows).
+        n_jobs (int, optional): Number of workers. Defaults to None (the executor's default).
+        random_state (int, optional): Seed of the sampling and folds. Defaults to 42.
+
+    Returns:
+        pd.DataFrame: One row per feature, by decreasing score, with the columns "feature",
+                      "pps", "pps_std_error", "pps_low", "pps_high", "model_f1" and "baseline_f1".
+
+    Example:
+        pps_scores(train_df.drop(columns=["color"]), train_df["color"], sample_size=5000, n_jobs=-1)
+    """
+    codes = pd.factorize(y)[0]
+    values = X.to_numpy(dtype=float)
+    if sample_size is not None and sample_size < len(codes):
+        values, _, codes, _ = train_test_split(values, codes, train_size=sample_size,
+                                               stratify=codes, random_state=random_state)
+    counts = np.bincount(codes)
+    baseline = f1_score(codes, np.full(len(codes), np.argmax(counts)), average="weighted")
+    folds = list(StratifiedKFold(cv, shuffle=True, random_state=random_state).split(values, codes))
+
+    with SharedArrays(uses_processes(n_jobs)) as shared:
+        values, codes = shared.share(values), shared.share(codes)
+        fold_scores = Parallel(n_jobs=n_jobs)(
+            delayed(_feature_f1)(values, codes, j, folds, random_state) for j in range(values.shape[1])
+        )
+
+    fold_scores = np.array(fold_scores)
+    normalized = (fold_scores - baseline) / (1 - baseline) if baseline < 1 else np.zeros_like(fold_scores)
+    pps = np.clip(normalized.mean(axis=1), 0, 1)
+    std_error = normalized.std(axis=1, ddof=1) / np.sqrt(cv)
+    return pd.DataFrame({
+        "feature": X.columns,
+        "pps": pps,
+        "pps_std_error": std_error,
+        "pps_low": np.clip(pps - 1.96 * std_error, 0, 1),
+        "pps_high": np.clip(pps + 1.96 * std_error, 0, 1),
+        "model_f1": fold_scores.mean(axis=1),
+        "baseline_f1": baseline
+    }).sort_values("pps", ascending=False, kind="stable").reset_index(drop=True)
+
+
+def feature_label_check(X, y, threshold=MAX_PPS, **kwargs):
+    """
+    Checks that no single feature predicts the label too well, which would suggest leakage.
+
+    The same condition as deepchecks' `FeatureLabelCorrelation` with
+    `add_condition_feature_pps_less_than`.
+
+    Parameters:
+        X (pd.DataFrame): The numeric features.
+        y (pd.Series): The label.
+        threshold (float, optional): Score every feature must stay below. Defaults to MAX_PPS.
+        **kwargs: Passed to `pps_scores` (cv, sample_size, n_jobs, random_state).
+
+    Returns:
+        tuple: Whether the check passed, and the scores from `pps_scores`.
+
+    Example:
+        passed, scores = feature_label_check(train_df.drop(columns=["color"]), train_df["color"])
+    """
+    scores = pps_scores(X, y, **kwargs)
+    return bool((scores["pps"] < threshold).all()), scores
+
+
+def _feature_f1(values, codes, j, folds, random_state):
+    """Weighted F1 of a decision tree on feature `j` in every fold."""
+    column = np.ascontiguousarray(values[:, j:j + 1])
+    scores = []
+    for train, test in folds:
+        tree = DecisionTreeClassifier(random_state=random_state).fit(column[train], codes[train])
+        scores.append(f1_score(codes[test], tree.predict(column[test]), average="weighted"))
+    return scores
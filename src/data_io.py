@@ -0,0 +1,293 @@
+# data_io.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import pandas as pd
+
+# Typed schema of the wine data, shared by every stage that reads or writes it
+WINE_DTYPES = {
+    "fixed_acidity": "float64",
+    "volatile_acidity": "float64",
+    "citric_acid": "float64",
+    "residual_sugar": "float64",
+    "chlorides": "float64",
+    "free_sulfur_dioxide": "float64",
+    "total_sulfur_dioxide": "float64",
+    "density": "float64",
+    "pH": "float64",
+    "sulphates": "float64",
+    "alcohol": "float64",
+    "quality": "int64",
+    "color": "object"
+}
+
+# Column the models predict, and the features they predict it from
+WINE_LABEL = "color"
+WINE_FEATURES = [col for col in WINE_DTYPES if col != WINE_LABEL]
+
+# File extension used for each supported storage format
+FORMAT_EXTENSIONS = {
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "feather": ".arrow"
+}
+
+
+def table_format(path):
+    """
+    Detects the storage format of a table from its file extension.
+
+    Parameters:
+        path (str): Path to a .csv, .parquet or .arrow/.feather file.
+
+    Returns:
+        str: One of "csv", "parquet" or "feather".
+
+    Raises:
+        ValueError: If the extension is not a supported table format.
+    """
+    extension = os.path.splitext(str(path))[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".parquet", ".pq"):
+        return "parquet"
+    if extension in (".arrow", ".feather", ".ipc"):
+        return "feather"
+    raise ValueError(f"Unsupported table format: '{extension}'")
+
+
+def coerce_dtypes(df):
+    """
+    Casts the wine columns present in `df` to the dtypes of WINE_DTYPES,
+    so that every storage format is written with the same typed schema.
+
+    Parameters:
+        df (pd.DataFrame): A dataframe with (a subset of) the wine columns.
+
+    Returns:
+        pd.DataFrame: The dataframe with the known columns cast to their schema dtype.
+    """
+    dtypes = {col: dtype for col, dtype in WINE_DTYPES.items() if col in df.columns}
+    return df.astype(dtypes)
+
+
+def write_table(df, path, compression=None):
+    """
+    Writes a dataframe to disk in the format given by the extension of `path`.
+
+    CSV files are written without the index as before; Parquet and Arrow IPC
+    (feather) files are written with the typed WINE_DTYPES schema and optional compression.
+
+    Parameters:
+        df (pd.DataFrame): The dataframe to save.
+        path (str): Destination path ending in .csv, .parquet or .arrow.
+        compression (str, optional): Compression codec for columnar formats
+                                     (e.g. "snappy", "zstd", "lz4"). Defaults to None.
+
+    Returns:
+        None
+
+    Example:
+        write_table(train_df, "data/proc/wine_train.parquet", compression="zstd")
+    """
+    fmt = table_format(path)
+    if fmt == "csv":
+        df.to_csv(path, index=False)
+    elif fmt == "parquet":
+        coerce_dtypes(df).to_parquet(path, index=False, compression=compression)
+    else:
+        coerce_dtypes(df).reset_index(drop=True).to_feather(
+            path, compression=compression or "uncompressed"
+        )
+
+
+# Tables kept in memory by `preload_table`, by absolute path
+_preloaded = {}
+
+
+def preload_table(path):
+    """
+    Reads a table once and keeps it in memory for later `read_table` calls.
+
+    The table is shared with every process later forked from this one, so
+    pipeline stages started by `src.orchestrator.run_dag` do not parse it again.
+    It is read from disk again as soon as the file changes.
+
+    Parameters:
+        path (str): Path to a .csv, .parquet or .arrow file.
+
+    Returns:
+        pd.DataFrame: The loaded table.
+    """
+    table = read_table(path)
+    _preloaded[os.path.abspath(path)] = (_file_state(path), table)
+    return table
+
+
+def read_table(path, columns=None):
+    """
+    Reads a table written by `write_table`, detecting the format from the extension.
+
+    Only the requested columns are loaded: columnar formats read just those
+    column chunks from disk, CSV files skip parsing the other columns. Tables
+    loaded by `preload_table` are copied from memory instead.
+
+    Parameters:
+        path (str): Path to a .csv, .parquet or .arrow file.
+        columns (list, optional): Columns to load. Defaults to None (all columns).
+
+    Returns:
+        pd.DataFrame: The loaded table with columns in the requested order.
+
+    Example:
+        read_table("data/proc/wine_train.parquet", columns=["alcohol", "color"])
+    """
+    state, preloaded = _preloaded.get(os.path.abspath(path), (None, None))
+    if preloaded is not None and state == _file_state(path):
+        return preloaded.copy() if columns is None else preloaded[list(columns)]
+
+    fmt = table_format(path)
+    if fmt == "csv":
+        df = pd.read_csv(path, usecols=columns)
+    elif fmt == "parquet":
+        df = pd.read_parquet(path, columns=columns)
+    else:
+        df = pd.read_feather(path, columns=columns)
+
+    if columns is not None:
+        df = df[list(columns)]
+    return df
+
+
+def _file_state(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def find_table(path):
+    """
+    Resolves a split output path to the file that actually exists on disk.
+
+    Consumer scripts are given e.g. `data/proc/wine_train.csv`; if the split was
+    written in a columnar format, the file with the same stem and a columnar
+    extension is returned instead. When the table exists in several formats,
+    e.g. a csv split left over from before a parquet one, the most recently
+    written file is returned.
+
+    Parameters:
+        path (str): The expected path of the table.
+
+    Returns:
+        str: The most recently written of `path` and its siblings in the other formats.
+
+    Raises:
+        FileNotFoundError: If no file with that stem exists in any supported format.
+    """
+    stem = os.path.splitext(str(path))[0]
+    candidates = [str(path)] + [stem + extension for extension in FORMAT_EXTENSIONS.values()]
+    existing = [candidate for candidate in dict.fromkeys(candidates) if os.path.exists(candidate)]
+    if not existing:
+        raise FileNotFoundError(f"No table found for '{path}'")
+    return max(existing, key=lambda candidate: os.stat(candidate).st_mtime_ns)
+
+
+def iter_table(path, chunksize, columns=None):
+    """
+    Reads a table in chunks of at most `chunksize` rows, so that files larger
+    than memory can be processed one piece at a time.
+
+    Parameters:
+        path (str): Path to a .csv, .parquet or .arrow file.
+        chunksize (int): Maximum number of rows per chunk.
+        columns (list, optional): Columns to load. Defaults to None (all columns).
+
+    Yields:
+        pd.DataFrame: The next chunk of the table.
+
+    Example:
+        for chunk in iter_table("data/raw/wine.csv", chunksize=100_000):
+            ...
+    """
+    fmt = table_format(path)
+    if fmt == "csv":
+        for chunk in pd.read_csv(path, chunksize=chunksize, usecols=columns):
+            yield chunk if columns is None else chunk[list(columns)]
+    elif fmt == "parquet":
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        import pyarrow as pa
+        with pa.memory_map(str(path), "r") as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                if columns is not None:
+                    batch = batch.select(list(columns))
+                for start in range(0, batch.num_rows, chunksize):
+                    yield batch.slice(start, chunksize).to_pandas()
+
+
+class TableWriter:
+    """
+    Writes a table incrementally, one dataframe chunk at a time.
+
+    The format is taken from the extension of `path` as in `write_table`; columnar
+    files get the typed WINE_DTYPES schema of the first chunk.
+
+    Parameters:
+        path (str): Destination path ending in .csv, .parquet or .arrow.
+        compression (str, optional): Compression codec for columnar formats. Defaults to None.
+        append (bool, optional): Append to an existing CSV file instead of overwriting it.
+                                 Columnar files cannot be appended to. Defaults to False.
+
+    Example:
+        with TableWriter("data/proc/wine_train.parquet") as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+    """
+    def __init__(self, path, compression=None, append=False):
+        self.path = str(path)
+        self.format = table_format(path)
+        self.compression = compression
+        if append and self.format != "csv":
+            raise ValueError(f"Appending is only supported for CSV files, not {self.format}")
+        self._header = not (append and os.path.exists(self.path))
+        if not append:
+            open(self.path, "w").close()
+        self._writer = None
+        self.rows_written = 0
+
+    def write(self, df):
+        """Appends the rows of `df` to the table."""
+        if self.format == "csv":
+            df.to_csv(self.path, mode="a", header=self._header, index=False)
+            self._header = False
+        else:
+            import pyarrow as pa
+            table = pa.Table.from_pandas(coerce_dtypes(df), preserve_index=False)
+            if self._writer is None:
+                self._writer = self._open(table.schema)
+            self._writer.write_table(table.cast(self._writer.schema))
+        self.rows_written += len(df)
+
+    def _open(self, schema):
+        import pyarrow as pa
+        if self.format == "parquet":
+            import pyarrow.parquet as pq
+            return pq.ParquetWriter(self.path, schema, compression=self.compression or "none")
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        return pa.ipc.new_file(self.path, schema, options=options)
+
+    def close(self):
+        """Finalizes the file footer of columnar formats."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,291 @@
+# drift.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Number of reference quantile bins of the probability histograms (deciles, as usual for PSI)
+N_BINS = 10
+
+# Smallest bin proportion used in the PSI, so that empty bins give a finite score
+PSI_EPSILON = 1e-4
+
+# Drift measures; "ks" is the score deepchecks' PredictionDrift reports for probabilities
+DRIFT_METHODS = ("ks", "psi", "js")
+
+# Largest number of window values scored at once, which bounds the memory of sliding windows
+MAX_WINDOW_VALUES = 1_000_000
+
+
+class DriftMonitor:
+    """
+    Measures how far predictions drift from the predictions on a reference set.
+
+    Every score compares the predicted probabilities of the positive class and
+    the proportions of the predicted classes with those of the reference (the
+    training predictions):
+
+    - "ks": Kolmogorov-Smirnov statistic of the probabilities, computed exactly
+      from the sorted reference.
+    - "psi": population stability index of the probabilities, binned on the
+      reference deciles.
+    - "js": Jensen-Shannon divergence (base 2, between 0 and 1) of the same bins.
+    - "class_psi": population stability index of the class proportions.
+
+    Predictions arriving as a stream are cut into windows of `window` rows, starting
+    every `step` rows: tumbling windows when `step` equals `window` (the default),
+    sliding windows when it is smaller. The windows completed by a chunk are views
+    into it, scored with array operations in batches of at most MAX_WINDOW_VALUES
+    values, so memory stays bounded however small the step is; only the rows of the
+    windows still open are kept. The time still grows with window / step, since
+    every window is scored in full.
+
+    Parameters:
+        reference_proba (array-like): Reference probabilities of the positive class.
+        reference_predictions (array-like): Reference predicted classes.
+        window (int, optional): Rows per window of `update`. Defaults to None (no windows).
+        step (int, optional): Rows between the starts of two windows. Defaults to `window`.
+        bins (int, optional): Number of probability bins. Defaults to N_BINS.
+        method (str, optional): Score reported as "Prediction Drift Score". Defaults to "ks".
+
+    Raises:
+        ValueError: If the method is unknown, the step is not between 1 and the window,
+                    or the reference is empty.
+
+    Example:
+        monitor = DriftMonitor(train_proba[:, 0], train_pred, window=10_000, step=1_000)
+        for proba, pred in stream:
+            monitor.update(proba, pred)
+        monitor.results()
+    """
+    def __init__(self, reference_proba, reference_predictions, window=None, step=None,
+                 bins=N_BINS, method="ks"):
+        if method not in DRIFT_METHODS:
+            raise ValueError(f"Unknown drift method '{method}', expected one of {list(DRIFT_METHODS)}")
+        step = window if step is None else step
+        if window is not None and not 1 <= step <= window:
+            raise ValueError("The step must be between 1 and the window size")
+        self.reference = np.sort(np.asarray(reference_proba, dtype=float))
+        if len(self.reference) == 0:
+            raise ValueError("The reference predictions are empty")
+        self.classes, class_counts = np.unique(np.asarray(reference_predictions), return_counts=True)
+        self.class_proportions = class_counts / class_counts.sum()
+        self.window = window
+        self.step = step
+        self.method = method
+
+        # Interior edges of the reference quantile bins
+        self.edges = np.unique(np.quantile(self.reference, np.linspace(0, 1, bins + 1)[1:-1]))
+        self.bin_proportions = np.bincount(np.searchsorted(self.edges, self.reference, side="right"),
+                                           minlength=len(self.edges) + 1) / len(self.reference)
+
+        self._proba = np.empty(0)
+        self._codes = np.empty(0, dtype=np.int64)
+        self._offset = 0
+        self._next_start = 0
+        self._results = []
+
+    def score(self, proba, predictions):
+        """
+        Scores a whole set of predictions against the reference.
+
+        Parameters:
+            proba (array-like): Probabilities of the positive class.
+            predictions (array-like): Predicted classes.
+
+        Returns:
+            dict: The "rows", the scores by method, "class_psi" and the proportion of every
+                  predicted class.
+        """
+        proba = np.asarray(proba, dtype=float)
+        scores = self._score_windows(proba[None, :], self._class_codes(predictions)[None, :])
+        return {key: value[0] for key, value in scores.items()}
+
+    def update(self, proba, predictions):
+        """
+        Adds a chunk of the stream and scores the windows it completes.
+
+        Parameters:
+            proba (array-like): Probabilities of the positive class.
+            predictions (array-like): Predicted classes.
+
+        Returns:
+            pd.DataFrame: The completed windows, laid out as `results`.
+
+        Raises:
+            ValueError: If the monitor has no window size.
+        """
+        if self.window is None:
+            raise ValueError("Set a window size to monitor a stream")
+        self._proba = np.concatenate([self._proba, np.asarray(proba, dtype=float)])
+        self._codes = np.concatenate([self._codes, self._class_codes(predictions)])
+        end = self._offset + len(self._proba)
+
+        starts = np.arange(self._next_start, end - self.window + 1, self.step)
+        completed = pd.DataFrame()
+        if len(starts):
+            # Views of the windows, without copying their overlapping rows
+            first = int(starts[0]) - self._offset
+            proba = sliding_window_view(self._proba, self.window)[first::self.step][:len(starts)]
+            codes = sliding_window_view(self._codes, self.window)[first::self.step][:len(starts)]
+            size = max(1, MAX_WINDOW_VALUES // self.window)
+            batches = [self._score_windows(proba[i:i + size], codes[i:i + size])
+                       for i in range(0, len(starts), size)]
+            scores = {key: np.concatenate([batch[key] for batch in batches]) for key in batches[0]}
+            completed = self._table(starts, scores)
+            self._results.append(completed)
+            self._next_start = int(starts[-1]) + self.step
+
+        # Keep only the rows of the windows that are still open
+        keep = self._next_start - self._offset
+        self._proba, self._codes = self._proba[keep:], self._codes[keep:]
+        self._offset = self._next_start
+        return completed
+
+    def results(self):
+        """
+        All windows completed so far.
+
+        Returns:
+            pd.DataFrame: One row per window with its "window" number, its "start" and "end" rows
+                          in the stream, "Prediction Drift Score" (the score of `method`, as in
+                          drift_score.csv), every score and the proportion of every predicted class.
+        """
+        if not self._results:
+            return self._table(np.empty(0, dtype=np.int64), {})
+        return pd.concat(self._results, ignore_index=True)
+
+    def save(self, path):
+        """Saves the reference to a .npz file, for `load` to monitor other predictions against."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        counts = np.round(self.class_proportions * len(self.reference)).astype(np.int64)
+        np.savez(path, reference=self.reference, classes=self.classes.astype(str), class_counts=counts,
+                 bins=len(self.edges) + 1)
+
+    @classmethod
+    def load(cls, path, window=None, step=None, method="ks"):
+        """
+        Loads a reference saved with `save`.
+
+        Parameters:
+            path (str): The .npz file.
+            window (int, optional): Rows per window. Defaults to None.
+            step (int, optional): Rows between the starts of two windows. Defaults to `window`.
+            method (str, optional): Score reported as "Prediction Drift Score". Defaults to "ks".
+
+        Returns:
+            DriftMonitor: A monitor with the saved reference.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No drift reference at '{path}'")
+        with np.load(path) as saved:
+            predictions = np.repeat(saved["classes"], saved["class_counts"])
+            monitor = cls(saved["reference"], predictions, window, step, int(saved["bins"]), method)
+        return monitor
+
+    def _class_codes(self, predictions):
+        """Index of every predicted class in `classes`; -1 for classes the reference never predicted."""
+        return pd.Categorical(np.asarray(predictions), categories=self.classes).codes.astype(np.int64)
+
+    def _score_windows(self, proba, codes):
+        """Scores every row of a (windows, rows) array of probabilities and class codes."""
+        n_windows, n_rows = proba.shape
+        scores = {"rows": np.full(n_windows, n_rows), "ks": _ks_statistic(self.reference, proba)}
+
+        bins = np.searchsorted(self.edges, proba, side="right")
+        current = _row_proportions(bins, len(self.bin_proportions))
+        scores["psi"] = _psi(self.bin_proportions, current)
+        scores["js"] = _js_divergence(self.bin_proportions, current)
+
+        # Classes the reference never predicted count towards none of the proportions
+        classes = _row_proportions(np.where(codes < 0, len(self.classes), codes), len(self.classes) + 1)
+        scores["class_psi"] = _psi(self.class_proportions, classes[:, :-1])
+        for i, label in enumerate(self.classes):
+            scores[f"{label}_proportion"] = classes[:, i]
+        return scores
+
+    def _table(self, starts, scores):
+        table = pd.DataFrame({
+            "window": np.arange(len(starts)) + sum(len(done) for done in self._results),
+            "start": starts,
+            "end": starts + (self.window or 0),
+            "Prediction Drift Score": scores.get(self.method, np.empty(0))
+        })
+        for key in ["rows", *DRIFT_METHODS, "class_psi", *[f"{label}_proportion" for label in self.classes]]:
+            table[key] = scores.get(key, np.empty(0))
+        return table
+
+
+def class_proportion_deviations(labels, expected, tolerance=0.1):
+    """
+    Finds the classes whose proportion deviates from the expected one by more than a tolerance.
+
+    Parameters:
+        labels (array-like): The class labels.
+        expected (dict): Expected proportion of every class, e.g. {"red": 0.25, "white": 0.75}.
+        tolerance (float, optional): Largest allowed absolute deviation. Defaults to 0.1.
+
+    Returns:
+        pd.Series: The actual proportion of every deviating class.
+
+    Example:
+        class_proportion_deviations(wine_train["color"], {"red": 0.25, "white": 0.75})
+    """
+    expected = pd.Series(expected, dtype=float)
+    actual = pd.Series(labels).value_counts(normalize=True).reindex(expected.index, fill_value=0.0)
+    return actual[(actual - expected).abs() > tolerance]
+
+
+def _row_proportions(codes, n_codes):
+    """Proportion of every code in every row of a 2-D array of codes."""
+    n_windows, n_rows = codes.shape
+    counts = np.bincount((codes + n_codes * np.arange(n_windows)[:, None]).ravel(),
+                         minlength=n_windows * n_codes)
+    return counts.reshape(n_windows, n_codes) / max(n_rows, 1)
+
+
+def _psi(expected, actual):
+    """Population stability index of every row of `actual` against `expected`."""
+    expected = np.maximum(expected, PSI_EPSILON)
+    actual = np.maximum(actual, PSI_EPSILON)
+    return ((actual - expected) * np.log(actual / expected)).sum(axis=-1)
+
+
+def _js_divergence(expected, actual):
+    """Jensen-Shannon divergence in bits of every row of `actual` against `expected`."""
+    expected = np.broadcast_to(expected, actual.shape)
+    middle = (expected + actual) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        left = np.where(expected > 0, expected * np.log2(expected / middle), 0.0)
+        right = np.where(actual > 0, actual * np.log2(actual / middle), 0.0)
+    return np.maximum((left.sum(axis=-1) + right.sum(axis=-1)) / 2, 0.0)
+
+
+def _ks_statistic(reference, samples):
+    """
+    Two-sample Kolmogorov-Smirnov statistic of every row of `samples` against the sorted `reference`.
+
+    Between two consecutive sample values the sample CDF is constant and the reference
+    CDF only grows, so the largest gap is found at the sample values, comparing both
+    CDFs just at and just before each of them.
+    """
+    n_windows, n_rows = samples.shape
+    values = np.sort(samples, axis=1)
+    positions = np.arange(n_rows)
+    # First and last position of every run of tied values
+    new_run = np.ones(values.shape, dtype=bool)
+    new_run[:, 1:] = values[:, 1:] != values[:, :-1]
+    run_end = np.ones(values.shape, dtype=bool)
+    run_end[:, :-1] = new_run[:, 1:]
+    first = np.maximum.accumulate(np.where(new_run, positions, 0), axis=1)
+    last = np.minimum.accumulate(np.where(run_end, positions, n_rows)[:, ::-1], axis=1)[:, ::-1]
+
+    at = np.abs(np.searchsorted(reference, values, side="right") / len(reference) - (last + 1) / n_rows)
+    before = np.abs(np.searchsorted(reference, values, side="left") / len(reference) - first / n_rows)
+    return np.maximum(at, before).max(axis=1)
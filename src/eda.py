@@ -0,0 +1,161 @@
+# eda.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import numpy as np
+import pandas as pd
+
+# Grid points of every density curve
+N_BINS = 100
+
+
+def binned_densities(df, class_column="color", bins=N_BINS, bandwidth=None):
+    """
+    Estimates the density of every numeric feature within each class on a fixed grid.
+
+    All features are binned at once: each value's class, feature and bin are
+    combined into one index and counted with a single `np.bincount`, and the
+    per-class sums giving each curve's bandwidth are matrix products. The counts
+    are then smoothed with a Gaussian kernel (a binned kernel density estimate),
+    so the cost of the smoothing and the size of the result depend only on the
+    number of bins, not on the number of rows. Missing values are ignored.
+
+    Parameters:
+        df (pd.DataFrame): The data, with numeric features and a class column.
+        class_column (str, optional): The class column. Defaults to "color".
+        bins (int, optional): Number of grid points per feature, spanning its range. Defaults to N_BINS.
+        bandwidth (float, optional): Kernel standard deviation as a fraction of each curve's
+                                     standard deviation. Defaults to None (Scott's rule,
+                                     1.06 * n ** -0.2). 0 gives the histogram densities.
+
+    Returns:
+        pd.DataFrame: The long table plotted by the EDA, one row per feature, class and grid
+                      point with the columns "feature", `class_column`, "value" and "density".
+
+    Example:
+        densities = binned_densities(train_df)
+        densities[densities["feature"] == "alcohol"]
+    """
+    features = [col for col in df.columns if col != class_column and pd.api.types.is_numeric_dtype(df[col])]
+    X = df[features].to_numpy(dtype=float)
+    codes, classes = pd.factorize(df[class_column], sort=True)
+    n_features, n_classes = len(features), len(classes)
+
+    valid = ~np.isnan(X) & (codes >= 0)[:, None]
+    low, high = np.nanmin(X, axis=0), np.nanmax(X, axis=0)
+    width = np.where(high > low, (high - low) / (bins - 1), 1.0)
+    values = np.where(valid, X, low)
+
+    # Count, sum and sum of squares of every (class, feature) curve as products with the class indicators
+    indicators = (codes[:, None] == np.arange(n_classes)).astype(float)
+    n = indicators.T @ valid
+    total = indicators.T @ (values * valid)
+    squares = indicators.T @ (values ** 2 * valid)
+
+    # Nearest grid point of every value, combined with its curve into one index to count
+    index = values - low
+    index /= width
+    np.rint(index, out=index)
+    index = index.astype(np.int64)
+    index += (np.maximum(codes, 0)[:, None] * n_features + np.arange(n_features)) * bins
+    index = index[valid] if not valid.all() else index.ravel()
+    counts = np.bincount(index, minlength=n_classes * n_features * bins)
+    counts = counts.reshape(n_classes, n_features, bins).astype(float)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = np.sqrt(np.maximum(squares / n - (total / n) ** 2, 0) * n / np.maximum(n - 1, 1))
+        scale = 1.06 * n ** -0.2 if bandwidth is None else np.full(n.shape, float(bandwidth))
+
+    densities = np.zeros_like(counts)
+    for c in range(n_classes):
+        for j in range(n_features):
+            if n[c, j] == 0:
+                continue
+            sigma = np.nan_to_num(scale[c, j] * std[c, j] / width[j])
+            densities[c, j] = _smooth(counts[c, j], sigma) / (n[c, j] * width[j])
+
+    grid = low[:, None] + width[:, None] * np.arange(bins)
+    return pd.DataFrame({
+        "feature": np.tile(np.repeat(features, bins), n_classes),
+        class_column: np.repeat(np.asarray(classes, dtype=object), n_features * bins),
+        "value": np.tile(grid.ravel(), n_classes),
+        "density": densities.ravel()
+    })
+
+
+def correlation_matrix(df):
+    """
+    Computes the Pearson correlation of every pair of numeric columns with matrix products.
+
+    Pairs are computed over the rows where both values are present, as in
+    `pd.DataFrame.corr`, whose result this matches: the pairwise counts, sums
+    and sums of squares and products all come from products of the value and
+    missingness matrices.
+
+    Parameters:
+        df (pd.DataFrame): The data; non-numeric columns are left out.
+
+    Returns:
+        pd.DataFrame: The correlation matrix, indexed and labelled by the numeric columns.
+
+    Example:
+        correlation_matrix(train_df.drop(columns=["color"]))
+    """
+    numeric = df.select_dtypes("number")
+    X = numeric.to_numpy(dtype=float)
+    missing = np.isnan(X)
+    # Centering does not change the correlations but avoids cancellation in the sums
+    X = X - np.nanmean(X, axis=0)
+    if not missing.any():
+        products = X.T @ X
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scale = np.sqrt(np.diag(products))
+            correlation = np.clip(products / np.outer(scale, scale), -1, 1)
+        np.fill_diagonal(correlation, np.where(scale > 0, 1.0, np.nan))
+        return pd.DataFrame(correlation, index=numeric.columns, columns=numeric.columns)
+
+    present = (~missing).astype(float)
+    X = np.nan_to_num(X)
+    # Entry (i, j) sums over the rows where columns i and j are both present
+    n = present.T @ present
+    sums = X.T @ present
+    squares = (X ** 2).T @ present
+    products = X.T @ X
+    with np.errstate(invalid="ignore", divide="ignore"):
+        covariance = n * products - sums * sums.T
+        variance = n * squares - sums ** 2
+        correlation = covariance / np.sqrt(variance * variance.T)
+    correlation = np.clip(correlation, -1, 1)
+    np.fill_diagonal(correlation, np.where(np.diag(variance) > 0, 1.0, np.nan))
+    return pd.DataFrame(correlation, index=numeric.columns, columns=numeric.columns)
+
+
+def correlation_table(correlation):
+    """
+    Lays out a correlation matrix as one row per pair of columns, as a heatmap plots it.
+
+    Parameters:
+        correlation (pd.DataFrame): A square correlation matrix, e.g. from `correlation_matrix`.
+
+    Returns:
+        pd.DataFrame: One row per cell of the matrix with the columns "feature_1",
+                      "feature_2" and "correlation", in the matrix's row-major order.
+
+    Example:
+        correlation_table(correlation_matrix(train_df.drop(columns=["color"])))
+    """
+    table = correlation.rename_axis(index="feature_1", columns="feature_2").reset_index().melt(
+        id_vars="feature_1", value_name="correlation"
+    )
+    # melt goes column by column; sort back to the matrix's row-major order
+    order = np.arange(correlation.size).reshape(correlation.shape).T.ravel()
+    return table.iloc[np.argsort(order)].reset_index(drop=True)
+
+
+def _smooth(counts, sigma):
+    """Convolves counts with a Gaussian kernel of `sigma` grid steps."""
+    if sigma < 0.5:
+        return counts
+    half = int(np.ceil(4 * sigma))
+    kernel = np.exp(-0.5 * (np.arange(-half, half + 1) / sigma) ** 2)
+    smoothed = np.convolve(counts, kernel / kernel.sum(), mode="full")
+    return smoothed[half:half + len(counts)]
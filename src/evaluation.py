@@ -9,13 +9,17 @@ from sklearn.metrics import (
     ConfusionMatrixDisplay, PrecisionRecallDisplay, 
     recall_score, precision_score, f1_score, accuracy_score
 )
+from src.instrumentation import instrumented
+from src.prediction_cache import PredictionCache
 
-def evaluation(model, X_test, y_test, pos_label, table_to, plot_to):
+@instrumented(rows_from="X_test")
+def evaluation(model, X_test, y_test, pos_label, table_to, plot_to, cache=None):
     """
     This function performs evaluation on the test dataset including evaluating test score on 
     recall, precision, f-1, and accuracy metrics,
     plotting the confusion matrix and precision-recall curve,
     then save the results to the designated directories.
+    The test data is scored once; the scores and plots are computed from those predictions.
 
     Parameter:
         model (scikit-learn object): The model that the train data is fit on and to be evaluated.
@@ -24,6 +28,8 @@ def evaluation(model, X_test, y_test, pos_label, table_to, plot_to):
         pos_label (str): The positive label of the classification problem.
         table_to (str): The relative path to save the tables to.
         plot_to (str): The relative path to save the plots to.
+        cache (PredictionCache, optional): Cache of predictions shared with other stages.
+                                           Defaults to a new cache.
 
     Returns:
         None: This function is not returning anything as it only does side-effects
@@ -31,8 +37,12 @@ def evaluation(model, X_test, y_test, pos_label, table_to, plot_to):
     Examples:
         evalutation(random_search, X_test, y_test, 'red', 'results/tables', 'results/plots')
     """
+    # Score the test data once
+    cache = PredictionCache() if cache is None else cache
+    predictions, proba = cache.predict(model, X_test)
+    pos_index = list(model.classes_).index(pos_label)
+
     # Compute accuracy on test data
-    predictions = model.predict(X_test)
     accuracy = accuracy_score(y_test, predictions)
     precision = precision_score(y_test, predictions, pos_label=pos_label)
     recall = recall_score(y_test, predictions, pos_label=pos_label)
@@ -47,19 +57,17 @@ def evaluation(model, X_test, y_test, pos_label, table_to, plot_to):
     test_scores.to_csv(os.path.join(table_to, "test_scores.csv"), index=False)
 
     # Confusion matrix 
-    confusion_matrix = ConfusionMatrixDisplay.from_estimator(
-        model,
-        X_test,
+    confusion_matrix = ConfusionMatrixDisplay.from_predictions(
         y_test,
+        predictions,
         values_format="d"
     )
     confusion_matrix.figure_.savefig(os.path.join(plot_to, "confusion_matrix.png"))
 
     # Precision-recall Curve
-    pr_curve = PrecisionRecallDisplay.from_estimator(
-        model,
-        X_test,
+    pr_curve = PrecisionRecallDisplay.from_predictions(
         y_test,
+        proba[:, pos_index],
         pos_label=pos_label,
         name='wine_quality'
         )
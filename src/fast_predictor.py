@@ -0,0 +1,242 @@
+# fast_predictor.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import numpy as np
+
+
+class FastPredictor:
+    """
+    Array-backed version of the trained OrdinalEncoder + StandardScaler +
+    LogisticRegression pipeline.
+
+    The scaler statistics are folded into the logistic coefficients, so a
+    prediction is one dot product on the raw feature values plus a table lookup
+    per ordinal column, followed by a sigmoid. Only NumPy is used; pandas and
+    scikit-learn are not imported.
+
+    Parameters:
+        feature_names (array-like): Raw input columns, in the order expected by `predict_proba`.
+        weights (np.ndarray): Folded coefficient of every raw column (0 for ordinal columns).
+        intercept (float): Folded intercept.
+        ordinal_columns (array-like): Positions of the ordinal columns in `feature_names`.
+        ordinal_categories (list): Sorted known categories of each ordinal column.
+        ordinal_contributions (list): Logit contribution of each category of each ordinal column.
+        classes (array-like): The two class labels; the logit is for the second one.
+
+    Example:
+        fast = export_fast_predictor(random_search)
+        fast.predict_proba(np.array([[7.4, 0.7, 0.0, 1.9, 0.076, 11.0, 34.0, 0.9978, 3.51, 0.56, 9.4, 5]]))
+    """
+    def __init__(self, feature_names, weights, intercept, ordinal_columns,
+                 ordinal_categories, ordinal_contributions, classes):
+        self.feature_names = np.asarray(feature_names)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.intercept = float(intercept)
+        self.ordinal_columns = np.asarray(ordinal_columns, dtype=np.int64)
+        self.ordinal_categories = [np.asarray(c, dtype=np.float64) for c in ordinal_categories]
+        self.ordinal_contributions = [np.asarray(c, dtype=np.float64) for c in ordinal_contributions]
+        self.classes_ = np.asarray(classes)
+
+    def decision_function(self, X):
+        """
+        Computes the logit of the second class for each row.
+
+        Parameters:
+            X (np.ndarray or pd.DataFrame): Raw feature values; arrays must have the
+                                            columns in `feature_names` order.
+
+        Returns:
+            np.ndarray: One logit per row.
+
+        Raises:
+            ValueError: If a value is missing or infinite, or an ordinal column holds a
+                        category unseen during training.
+        """
+        if hasattr(X, "columns"):
+            X = X[list(self.feature_names)].to_numpy(dtype=np.float64)
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        # A NaN logit would silently predict classes_[0]
+        finite = np.isfinite(X).all(axis=0)
+        if not finite.all():
+            raise ValueError(f"Found missing or infinite values in columns "
+                             f"{self.feature_names[~finite].tolist()}")
+
+        logit = X @ self.weights + self.intercept
+        for column, categories, contributions in zip(
+                self.ordinal_columns, self.ordinal_categories, self.ordinal_contributions):
+            values = X[:, column]
+            index = np.searchsorted(categories, values).clip(max=categories.size - 1)
+            if not np.array_equal(categories[index], values):
+                unknown = np.unique(values[categories[index] != values])
+                raise ValueError(f"Found unknown categories {unknown.tolist()} "
+                                 f"in column '{self.feature_names[column]}'")
+            logit += contributions[index]
+        return logit
+
+    def predict_proba(self, X):
+        """Returns the probabilities of both classes, in `classes_` order."""
+        proba = 1.0 / (1.0 + np.exp(-self.decision_function(X)))
+        return np.column_stack([1.0 - proba, proba])
+
+    def predict(self, X):
+        """Returns the predicted class label of each row."""
+        return self.classes_[(self.decision_function(X) > 0).astype(np.int64)]
+
+    @property
+    def feature_names_in_(self):
+        """The raw input columns, named as on scikit-learn estimators."""
+        return self.feature_names
+
+    def save(self, path, source_path=None):
+        """
+        Saves the predictor as a memory-mappable model artifact.
+
+        Parameters:
+            path (str): Destination file, e.g. results/models/wine_model.artifact.
+            source_path (str, optional): The pickled model the predictor was exported from,
+                                         used to detect stale artifacts.
+        """
+        from src.model_artifact import save_artifact
+
+        arrays = {"weights": self.weights, "ordinal_columns": self.ordinal_columns}
+        for i, (categories, contributions) in enumerate(
+                zip(self.ordinal_categories, self.ordinal_contributions)):
+            arrays[f"ordinal_categories_{i}"] = categories
+            arrays[f"ordinal_contributions_{i}"] = contributions
+        metadata = {
+            "kind": "fast_predictor",
+            "feature_names": self.feature_names.tolist(),
+            "classes": self.classes_.tolist(),
+            "intercept": self.intercept
+        }
+        save_artifact(path, arrays, metadata, source_path)
+
+    @classmethod
+    def load(cls, path, check_source=False):
+        """
+        Loads a predictor saved with `save`; its arrays stay memory-mapped.
+
+        Parameters:
+            path (str): Path to the artifact.
+            check_source (bool, optional): Raise if the source model changed since export.
+                                           Defaults to False.
+
+        Returns:
+            FastPredictor: The loaded predictor.
+        """
+        from src.model_artifact import load_artifact
+
+        arrays, metadata = load_artifact(path, check_source)
+        if metadata.get("kind") != "fast_predictor":
+            raise ValueError(f"{path} does not contain a fast predictor")
+        n_ordinal = arrays["ordinal_columns"].size
+        return cls(
+            metadata["feature_names"],
+            arrays["weights"],
+            metadata["intercept"],
+            arrays["ordinal_columns"],
+            [arrays[f"ordinal_categories_{i}"] for i in range(n_ordinal)],
+            [arrays[f"ordinal_contributions_{i}"] for i in range(n_ordinal)],
+            metadata["classes"]
+        )
+
+
+def export_fast_predictor(model):
+    """
+    Folds a fitted ColumnTransformer + LogisticRegression pipeline into a `FastPredictor`.
+
+    For a standardized column the logit term `w * (x - mean) / scale` is rewritten
+    as `(w / scale) * x - w * mean / scale`, so the scaler disappears into the
+    weights and intercept. An ordinal-encoded column contributes `w * code`, which
+    is stored as one value per known category.
+
+    Parameters:
+        model (scikit-learn object): The fitted pipeline, or a fitted search object
+                                     whose `best_estimator_` is that pipeline.
+
+    Returns:
+        FastPredictor: The array-backed predictor.
+
+    Raises:
+        ValueError: If the pipeline contains steps other than OrdinalEncoder,
+                    StandardScaler, passthrough/dropped columns and a binary
+                    LogisticRegression.
+
+    Example:
+        fast = export_fast_predictor(random_search)
+    """
+    from sklearn.compose import ColumnTransformer
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.preprocessing import FunctionTransformer, OrdinalEncoder, StandardScaler
+
+    pipeline = getattr(model, "best_estimator_", model)
+    if len(pipeline.steps) != 2:
+        raise ValueError("Expected a pipeline of a ColumnTransformer and a LogisticRegression")
+    preprocessor, classifier = pipeline.steps[0][1], pipeline.steps[-1][1]
+    if not isinstance(preprocessor, ColumnTransformer) or not isinstance(classifier, LogisticRegression):
+        raise ValueError("Expected a pipeline of a ColumnTransformer and a LogisticRegression")
+    if classifier.coef_.shape[0] != 1:
+        raise ValueError("Only binary logistic regression can be exported")
+
+    feature_names = list(preprocessor.feature_names_in_)
+    coef = classifier.coef_[0]
+    weights = np.zeros(len(feature_names))
+    intercept = classifier.intercept_[0]
+    ordinal_columns, ordinal_categories, ordinal_contributions = [], [], []
+
+    position = 0
+    for _, transformer, columns in preprocessor.transformers_:
+        if transformer == "drop" or len(columns) == 0:
+            continue
+        columns = [feature_names[c] if isinstance(c, (int, np.integer)) else c for c in columns]
+        indices = [feature_names.index(c) for c in columns]
+        w = coef[position:position + len(columns)]
+        position += len(columns)
+
+        # Fitted passthrough columns are stored as an identity FunctionTransformer
+        if transformer == "passthrough" or (isinstance(transformer, FunctionTransformer)
+                                            and transformer.func is None):
+            weights[indices] += w
+        elif isinstance(transformer, StandardScaler):
+            mean = transformer.mean_ if transformer.mean_ is not None else np.zeros(len(columns))
+            scale = transformer.scale_ if transformer.scale_ is not None else np.ones(len(columns))
+            weights[indices] += w / scale
+            intercept -= np.sum(w * mean / scale)
+        elif isinstance(transformer, OrdinalEncoder):
+            for i, index in enumerate(indices):
+                categories = np.asarray(transformer.categories_[i], dtype=np.float64)
+                ordinal_columns.append(index)
+                ordinal_categories.append(categories)
+                ordinal_contributions.append(w[i] * np.arange(categories.size))
+        else:
+            raise ValueError(f"Cannot export transformer {transformer!r}")
+
+    return FastPredictor(feature_names, weights, intercept, ordinal_columns,
+                         ordinal_categories, ordinal_contributions, classifier.classes_)
+
+
+def verify_fast_predictor(fast, model, X, atol=1e-9, proba=None):
+    """
+    Checks that a `FastPredictor` reproduces the probabilities of the original model.
+
+    Parameters:
+        fast (FastPredictor): The exported predictor.
+        model (scikit-learn object): The model it was exported from.
+        X (pd.DataFrame): Raw samples to compare on.
+        atol (float, optional): Largest allowed absolute difference. Defaults to 1e-9.
+        proba (np.ndarray, optional): The model's probabilities on `X`, if already computed.
+
+    Returns:
+        float: The largest absolute difference between the probabilities.
+
+    Raises:
+        ValueError: If the difference exceeds `atol` or the classes differ.
+    """
+    if not np.array_equal(fast.classes_, model.classes_):
+        raise ValueError("The fast predictor has different classes than the model")
+    proba = model.predict_proba(X) if proba is None else proba
+    difference = float(np.max(np.abs(fast.predict_proba(X) - proba), initial=0.0))
+    if difference > atol:
+        raise ValueError(f"Fast predictor probabilities differ by up to {difference:.3g} (tolerance {atol:.3g})")
+    return difference
@@ -0,0 +1,258 @@
+# fold_cache.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import time
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import ParameterSampler, RandomizedSearchCV, check_cv
+from src.parallel import SharedArrays, uses_processes
+
+
+class FoldCache:
+    """
+    Preprocessed cross-validation folds, shared by every candidate of a search.
+
+    The preprocessing steps of a pipeline do not depend on the classifier's
+    hyperparameters, so each fold's preprocessor is fitted and applied once and
+    the transformed matrices are reused for all candidates. Matrices are kept as
+    float arrays, and string labels as a fixed-width array, which the metrics
+    handle much faster than Python objects.
+
+    Parameters:
+        preprocessor (scikit-learn object): Unfitted transformer, e.g. `wine_pipe[:-1]`.
+        cv (int or cross-validation generator, optional): Folds to use. Defaults to 5.
+
+    Example:
+        folds = FoldCache(wine_pipe[:-1]).fit(X_train, y_train)
+        for fold in folds.folds_:
+            classifier.fit(fold["X_train"], fold["y_train"])
+    """
+    def __init__(self, preprocessor, cv=5):
+        self.preprocessor = preprocessor
+        self.cv = cv
+
+    def fit(self, X, y):
+        """
+        Fits the preprocessor on the training part of every fold and transforms both parts.
+
+        Parameters:
+            X (pd.DataFrame): Training features.
+            y (pd.Series): Training labels.
+
+        Returns:
+            FoldCache: The cache, with one dictionary per fold in `folds_` (X_train, X_test,
+                       y_train, y_test and the preprocessing "time").
+        """
+        cv = check_cv(self.cv, y, classifier=True)
+        labels = y.to_numpy(dtype=str) if pd.api.types.infer_dtype(y, skipna=False) == "string" \
+            else np.asarray(y)
+        self.folds_ = []
+        for train, test in cv.split(X, y):
+            start = time.perf_counter()
+            preprocessor = clone(self.preprocessor).fit(X.iloc[train], y.iloc[train])
+            self.folds_.append({
+                "X_train": np.asarray(preprocessor.transform(X.iloc[train]), dtype=float),
+                "X_test": np.asarray(preprocessor.transform(X.iloc[test]), dtype=float),
+                "y_train": labels[train],
+                "y_test": labels[test],
+                "time": time.perf_counter() - start
+            })
+        return self
+
+
+class CachedRandomizedSearchCV(RandomizedSearchCV):
+    """
+    `RandomizedSearchCV` that preprocesses each fold once through a `FoldCache`.
+
+    Candidates are sampled and folds are split exactly as in `RandomizedSearchCV`,
+    and the results have the same layout, but only the last step of the pipeline
+    is refitted for each candidate. Every sampled parameter must therefore belong
+    to the last step. Each candidate's `mean_fit_time` includes its share of the
+    fold preprocessing time.
+
+    The candidate fits run on the active joblib executor (see `src.parallel.executor`);
+    with worker processes the fold matrices are memory-mapped once and shared.
+
+    Parameters:
+        Same as `RandomizedSearchCV`; `scoring` is a single scorer or a dictionary of
+        scorers, in which case `refit` names the metric used to pick the best candidate.
+
+    Example:
+        search = CachedRandomizedSearchCV(wine_pipe, {"logisticregression__C": loguniform(1e-1, 10)})
+        search.fit(X_train, y_train)
+    """
+    def fit(self, X, y):
+        """
+        Evaluates the sampled candidates on the cached folds and refits the best one.
+
+        Parameters:
+            X (pd.DataFrame): Training features.
+            y (pd.Series): Training labels.
+
+        Returns:
+            CachedRandomizedSearchCV: The fitted search.
+
+        Raises:
+            ValueError: If a sampled parameter does not belong to the last pipeline step,
+                        or `refit` does not name one of several metrics.
+        """
+        candidates = list(ParameterSampler(self.param_distributions, self.n_iter,
+                                           random_state=self.random_state))
+        self._check_candidates(candidates)
+        self.scorer_ = check_scorers(self.estimator, self.scoring, self.refit)
+        folds = FoldCache(self.estimator[:-1], self.cv).fit(X, y).folds_
+        # Worker processes attach to the fold matrices instead of receiving a copy per task
+        with SharedArrays(uses_processes(self.n_jobs)) as shared:
+            results = self._evaluate(candidates, [shared.share_all(fold) for fold in folds])
+
+        # Share each fold's preprocessing time between the candidates
+        for i, result in enumerate(results):
+            result["fit_time"] += folds[i % len(folds)]["time"] / len(candidates)
+        self.n_splits_ = len(folds)
+        return self._set_results(X, y, format_cv_results(candidates, results, len(folds),
+                                                         self.return_train_score))
+
+    def _check_candidates(self, candidates):
+        step_name = self.estimator.steps[-1][0]
+        for name in candidates[0]:
+            if not name.startswith(f"{step_name}__"):
+                raise ValueError(f"Parameter '{name}' does not belong to the last step "
+                                 f"'{step_name}', so the folds cannot be cached")
+
+    def _evaluate(self, candidates, folds):
+        """Fits and scores the last pipeline step for every candidate on every fold."""
+        step_name, classifier = self.estimator.steps[-1]
+        prefix = len(step_name) + 2
+        return Parallel(n_jobs=self.n_jobs)(
+            delayed(_fit_and_score_fold)(
+                clone(classifier).set_params(**{name[prefix:]: value for name, value in params.items()}),
+                fold, self.scorer_, self.return_train_score
+            )
+            for params in candidates for fold in folds
+        )
+
+    def _set_results(self, X, y, cv_results):
+        """Stores the results, picks the best candidate and refits it on all the data."""
+        self.multimetric_ = isinstance(self.scorer_, dict)
+        self.cv_results_ = cv_results
+        if self.refit:
+            set_best_candidate(self, self.cv_results_, self.refit)
+            start = time.perf_counter()
+            self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_).fit(X, y)
+            self.refit_time_ = time.perf_counter() - start
+        return self
+
+
+def check_scorers(estimator, scoring, refit=True):
+    """
+    Builds the scorer, or the dictionary of scorers, of a search.
+
+    Parameters:
+        estimator (scikit-learn object): The estimator being searched.
+        scoring (str, callable or dict): One scorer, or several scorers by metric name.
+        refit (bool or str, optional): With several scorers, the name of the metric used
+                                       to pick the best candidate. Defaults to True.
+
+    Returns:
+        callable or dict: The scorer, or the scorers by metric name.
+
+    Raises:
+        ValueError: If several scorers are given and `refit` is not one of their names.
+    """
+    if not isinstance(scoring, dict):
+        return check_scoring(estimator, scoring)
+    if refit is not False and refit not in scoring:
+        raise ValueError(f"refit must be False or one of the metrics {list(scoring)} "
+                         f"when several metrics are scored, got {refit!r}")
+    return {name: check_scoring(estimator, scorer) for name, scorer in scoring.items()}
+
+
+def score_fold(estimator, X, y, scorer):
+    """Scores a fitted estimator with one scorer, or with a dictionary of scorers."""
+    if isinstance(scorer, dict):
+        return {name: metric(estimator, X, y) for name, metric in scorer.items()}
+    return scorer(estimator, X, y)
+
+
+def format_cv_results(candidates, results, n_splits, return_train_score=False):
+    """
+    Arranges per-fold scores and times into the `cv_results_` layout of scikit-learn searches.
+
+    Parameters:
+        candidates (list): The parameter dictionary of every candidate.
+        results (list): One dictionary per candidate and fold, candidate-major, with
+                        "test_score", "fit_time", "score_time" and optionally "train_score".
+                        Scores are numbers, or dictionaries of numbers by metric name.
+        n_splits (int): Number of folds.
+        return_train_score (bool, optional): Include the train scores. Defaults to False.
+
+    Returns:
+        dict: The results, with `param_*` masked arrays, split, mean and std scores and
+              times, and the test rank of every metric (ties share the best rank). A single
+              metric uses the suffix "score", as in `split0_test_score`; several metrics use
+              their names, as in `split0_test_f1`.
+    """
+    cv_results = {}
+    for name in candidates[0]:
+        cv_results[f"param_{name}"] = np.ma.MaskedArray(
+            [params[name] for params in candidates], mask=False, dtype=object)
+    cv_results["params"] = candidates
+
+    def by_fold(values):
+        return np.array(values, dtype=float).reshape(-1, n_splits)
+
+    def by_metric(score):
+        return score if isinstance(score, dict) else {"score": score}
+
+    metrics = list(by_metric(results[0]["test_score"]))
+    for subset in ["test", "train"] if return_train_score else ["test"]:
+        for metric in metrics:
+            scores = by_fold([by_metric(result[f"{subset}_score"])[metric] for result in results])
+            for i in range(n_splits):
+                cv_results[f"split{i}_{subset}_{metric}"] = scores[:, i]
+            cv_results[f"mean_{subset}_{metric}"] = scores.mean(axis=1)
+            cv_results[f"std_{subset}_{metric}"] = scores.std(axis=1)
+    for name in ["fit_time", "score_time"]:
+        times = by_fold([result[name] for result in results])
+        cv_results[f"mean_{name}"] = times.mean(axis=1)
+        cv_results[f"std_{name}"] = times.std(axis=1)
+
+    for metric in metrics:
+        mean = cv_results[f"mean_test_{metric}"]
+        cv_results[f"rank_test_{metric}"] = np.array(
+            [1 + np.sum(mean > score) for score in mean], dtype=np.int32)
+    return cv_results
+
+
+def set_best_candidate(search, cv_results, refit=True):
+    """
+    Sets `best_index_`, `best_params_` and `best_score_` of a search from its results.
+
+    Parameters:
+        search (object): The search object to update.
+        cv_results (dict): Results in the layout of `format_cv_results`.
+        refit (bool or str, optional): The metric that picks the best candidate when
+                                       several are scored. Defaults to True.
+    """
+    metric = refit if isinstance(refit, str) else "score"
+    search.best_index_ = int(np.argmin(cv_results[f"rank_test_{metric}"]))
+    search.best_params_ = cv_results["params"][search.best_index_]
+    search.best_score_ = float(cv_results[f"mean_test_{metric}"][search.best_index_])
+
+
+def _fit_and_score_fold(classifier, fold, scorer, return_train_score):
+    """Fits a classifier on one cached fold and scores it."""
+    start = time.perf_counter()
+    classifier.fit(fold["X_train"], fold["y_train"])
+    result = {"fit_time": time.perf_counter() - start}
+
+    start = time.perf_counter()
+    result["test_score"] = score_fold(classifier, fold["X_test"], fold["y_test"], scorer)
+    if return_train_score:
+        result["train_score"] = score_fold(classifier, fold["X_train"], fold["y_train"], scorer)
+    result["score_time"] = time.perf_counter() - start
+    return result
@@ -0,0 +1,392 @@
+# instrumentation.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import cProfile
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+import pandas as pd
+from src.stage_cache import REPO_ROOT
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# JSON lines log of every span; set WINE_PERF_LOG=off to disable recording.
+# Relative paths are relative to the repository root, like the stage cache
+PERF_LOG = os.environ.get("WINE_PERF_LOG", "results/perf/perf.jsonl")
+if PERF_LOG.lower() != "off":
+    PERF_LOG = os.path.join(REPO_ROOT, PERF_LOG)
+
+# Latest span totals of every stage
+PERF_SUMMARY = os.path.join(REPO_ROOT, "results", "tables", "perf.csv")
+
+# Profiler run for every stage: "cprofile" (a .prof file for pstats or snakeviz) or
+# "sample" (collapsed stacks for flame graphs); unset to disable
+PROFILE = os.environ.get("WINE_PROFILE", "")
+
+# Directory of the profiler dumps
+PROFILE_DIR = os.path.join(REPO_ROOT, os.environ.get("WINE_PROFILE_DIR", "results/perf"))
+
+# Seconds between two memory (and stack) samples
+SAMPLE_INTERVAL = 0.005
+
+_local = threading.local()
+
+
+class Span:
+    """
+    Timing, memory and row count of one step of a stage.
+
+    Spans are created by `span`; the row count can be set once it is known,
+    e.g. `step.rows = len(df)`.
+    """
+    def __init__(self, name, path, depth, rows=None):
+        self.name = name
+        self.path = path
+        self.depth = depth
+        self.rows = rows
+        self.start = time.time()
+        self.seconds = None
+        self.rss_start_mb = None
+        self.peak_rss_mb = None
+        self.error = None
+        self.records = None
+
+    def to_dict(self):
+        """The span as a JSON-serializable dictionary."""
+        return {
+            "span": self.path,
+            "name": self.name,
+            "depth": self.depth,
+            "start": datetime.fromtimestamp(self.start).isoformat(timespec="milliseconds"),
+            "seconds": self.seconds,
+            "rows": self.rows,
+            "rows_per_second": self.rows / self.seconds if self.rows and self.seconds else None,
+            "rss_start_mb": self.rss_start_mb,
+            "peak_rss_mb": self.peak_rss_mb,
+            "error": self.error
+        }
+
+
+@contextmanager
+def span(name, rows=None):
+    """
+    Times a step of the current stage and samples its peak memory.
+
+    Spans nest: a span opened inside another is recorded as "outer/inner". Spans
+    are only recorded inside a `stage`; elsewhere, e.g. when `src` functions are
+    called from a notebook or the tests, they cost a single check.
+
+    Parameters:
+        name (str): Name of the step.
+        rows (int, optional): Number of rows the step processes; can also be set
+                              later on the yielded span. Defaults to None.
+
+    Yields:
+        Span: The running span.
+
+    Example:
+        with span("read", rows=None) as step:
+            wine = read_table(path)
+            step.rows = len(wine)
+    """
+    stack = getattr(_local, "stack", None)
+    if not stack:
+        yield Span(name, name, 0, rows)
+        return
+
+    current = Span(name, f"{stack[-1].path}/{name}", len(stack), rows)
+    try:
+        with _open(current, stack):
+            yield current
+    finally:
+        stack[0].records.append(current.to_dict())
+
+
+@contextmanager
+def stage(name, log_path=None, summary_path=None, profile=None):
+    """
+    Records a pipeline stage and all the spans opened while it runs.
+
+    When the stage ends, every span is appended to the JSON lines log and the
+    stage's totals per span replace its earlier rows in the summary table. If a
+    profiler is chosen, its dump is written to PROFILE_DIR as `<stage>.prof` or
+    `<stage>.folded`. Memory is the resident set size of this process, sampled
+    every SAMPLE_INTERVAL seconds, so worker processes are not included.
+
+    Can be used as a `with` statement or as a decorator of a script's `main`.
+
+    Parameters:
+        name (str): Name of the stage.
+        log_path (str, optional): JSON lines log; "off" disables recording. Defaults to PERF_LOG.
+        summary_path (str, optional): Summary CSV. Defaults to PERF_SUMMARY.
+        profile (str, optional): "cprofile", "sample" or "" (no profiler). Defaults to PROFILE.
+
+    Yields:
+        Span: The span of the whole stage.
+
+    Raises:
+        ValueError: If the profiler is unknown.
+
+    Example:
+        @click.command()
+        @stage("eda")
+        def main(train_file):
+            with span("density_plot"):
+                ...
+    """
+    log_path = PERF_LOG if log_path is None else log_path
+    summary_path = PERF_SUMMARY if summary_path is None else summary_path
+    profile = PROFILE if profile is None else profile
+    if profile not in ("", "cprofile", "sample"):
+        raise ValueError(f"Unknown profiler '{profile}', expected 'cprofile' or 'sample'")
+    if log_path.lower() == "off" or getattr(_local, "stack", None):
+        # Recording is disabled, or this stage runs inside another one
+        with span(name) as current:
+            yield current
+        return
+
+    stack = _local.stack = []
+    current = Span(name, name, 0)
+    current.records = []
+    profiler = _start_profiler(profile)
+    try:
+        with _open(current, stack):
+            yield current
+    finally:
+        _local.stack = None
+        if profiler is not None:
+            profiler.dump(os.path.join(PROFILE_DIR, name))
+        current.records.append(current.to_dict())
+        run = f"{name}-{time.strftime('%Y%m%dT%H%M%S', time.localtime(current.start))}-{uuid.uuid4().hex[:8]}"
+        records = [{"run": run, "stage": name, **record} for record in current.records]
+        write_log(log_path, records)
+        update_summary(summary_path, name, records)
+
+
+def instrumented(name=None, rows_from=None):
+    """
+    Decorates a function so that every call is recorded as a span.
+
+    Parameters:
+        name (str, optional): Name of the span. Defaults to the function name.
+        rows_from (str, optional): Argument whose length is the number of rows. Defaults to None.
+
+    Example:
+        @instrumented(rows_from="wine")
+        def validate_wine(wine, rules=WINE_RULES):
+            ...
+    """
+    def decorate(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not getattr(_local, "stack", None):
+                return func(*args, **kwargs)
+            rows = None
+            if rows_from is not None:
+                value = signature.bind(*args, **kwargs).arguments.get(rows_from)
+                rows = len(value) if hasattr(value, "__len__") else None
+            with span(name or func.__name__, rows):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def current_span():
+    """The innermost running span of this thread, or None outside a stage."""
+    stack = getattr(_local, "stack", None)
+    return stack[-1] if stack else None
+
+
+def record_rows(n_rows):
+    """Sets the row count of the innermost running span, if there is one."""
+    current = current_span()
+    if current is not None:
+        current.rows = int(n_rows)
+
+
+def write_log(path, records):
+    """Appends span records to a JSON lines file."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "a") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def update_summary(path, stage_name, records):
+    """
+    Replaces the rows of a stage in the summary table by the totals of its latest run.
+
+    Parameters:
+        path (str): The summary CSV.
+        stage_name (str): The stage.
+        records (list): The span records of the run.
+
+    Returns:
+        pd.DataFrame: The updated summary, with one row per stage and span (calls, rows,
+                      seconds, rows_per_second and peak_rss_mb).
+    """
+    spans = pd.DataFrame(records)
+    summary = spans.groupby("span", sort=False).agg(
+        stage=("stage", "first"), depth=("depth", "first"), start=("start", "min"),
+        calls=("span", "size"), rows=("rows", "sum"), seconds=("seconds", "sum"),
+        peak_rss_mb=("peak_rss_mb", "max")
+    ).reset_index().sort_values(["start", "depth"], kind="stable")
+    summary["rows"] = summary["rows"].where(summary["rows"] > 0).astype("Int64")
+    summary["rows_per_second"] = summary["rows"] / summary["seconds"]
+    columns = ["stage", "span", "calls", "rows", "seconds", "rows_per_second", "peak_rss_mb"]
+    summary = summary[columns]
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # Stages running in parallel update the table one at a time
+    with open(path + ".lock", "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        if os.path.exists(path):
+            previous = pd.read_csv(path, dtype={"rows": "Int64"})
+            frames = [previous[previous["stage"] != stage_name], summary]
+            # Columns without any value (e.g. no span counted rows) must not set the dtypes
+            summary = pd.concat([frame.dropna(axis=1, how="all") for frame in frames],
+                                ignore_index=True).reindex(columns=columns)
+        summary.round(4).to_csv(path, index=False)
+    return summary
+
+
+def rss_mb():
+    """Current resident set size of this process in MB."""
+    if os.path.exists("/proc/self/statm"):
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    # Elsewhere only the peak so far is available; ru_maxrss is in bytes on macOS
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 ** 2 if sys.platform == "darwin" else 1024)
+
+
+@contextmanager
+def _open(current, stack):
+    """Runs a span: pushes it on the stack, times it and samples memory while it is open."""
+    current.rss_start_mb = current.peak_rss_mb = rss_mb()
+    stack.append(current)
+    _MemorySampler.instance().add(current)
+    start = time.perf_counter()
+    try:
+        yield current
+    except BaseException as error:
+        current.error = type(error).__name__
+        raise
+    finally:
+        current.seconds = time.perf_counter() - start
+        _MemorySampler.instance().remove(current)
+        current.peak_rss_mb = max(current.peak_rss_mb, rss_mb())
+        stack.pop()
+
+
+class _MemorySampler:
+    """Background thread updating the peak memory of every open span."""
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self.spans = set()
+        self._thread = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def add(self, current):
+        with self._lock:
+            self.spans.add(current)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def remove(self, current):
+        with self._lock:
+            self.spans.discard(current)
+
+    def _run(self):
+        while True:
+            time.sleep(SAMPLE_INTERVAL)
+            rss = rss_mb()
+            with self._lock:
+                if not self.spans:
+                    self._thread = None
+                    return
+                for current in self.spans:
+                    current.peak_rss_mb = max(current.peak_rss_mb, rss)
+
+
+def _reset_after_fork():
+    # The sampler thread of the parent does not exist in a forked process
+    _MemorySampler._instance = None
+    _MemorySampler._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class _CProfiler:
+    """Deterministic profile of the stage's thread, saved in the pstats format."""
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+        self.profiler.enable()
+
+    def dump(self, stem):
+        self.profiler.disable()
+        os.makedirs(os.path.dirname(os.path.abspath(stem)), exist_ok=True)
+        self.profiler.dump_stats(stem + ".prof")
+
+
+class _StackSampler:
+    """Statistical profile of the stage's thread, saved as collapsed stacks."""
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.thread_id = threading.get_ident()
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+
+    def dump(self, stem):
+        self._stop.set()
+        self._thread.join()
+        os.makedirs(os.path.dirname(os.path.abspath(stem)), exist_ok=True)
+        # One "frame;frame;frame count" line per stack, as read by flamegraph.pl and speedscope
+        with open(stem + ".folded", "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def _start_profiler(profile):
+    if profile == "cprofile":
+        return _CProfiler()
+    if profile == "sample":
+        return _StackSampler()
+    return None
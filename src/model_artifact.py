@@ -0,0 +1,157 @@
+# model_artifact.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import json
+import struct
+import warnings
+import numpy as np
+
+# Artifact layout: MAGIC, header length (uint64), JSON header, then the array
+# blobs, each aligned to ALIGNMENT bytes so they can be viewed in place.
+MAGIC = b"WINEMDL\0"
+ARTIFACT_VERSION = 1
+ALIGNMENT = 64
+
+
+def save_artifact(path, arrays, metadata=None, source_path=None):
+    """
+    Saves NumPy arrays and metadata as a versioned, memory-mappable model artifact.
+
+    Parameters:
+        path (str): Destination file, e.g. results/models/wine_model.artifact.
+        arrays (dict): Numeric arrays to store, by name.
+        metadata (dict, optional): JSON-serializable values (feature names, classes, ...).
+        source_path (str, optional): The model file the artifact was exported from.
+                                     Its path relative to the artifact and its content
+                                     digest are stored so that a later retrained model makes
+                                     the artifact detectably stale, on any machine or checkout
+                                     where the two files keep the same layout.
+
+    Returns:
+        None
+
+    The file is written under a temporary name and then renamed over `path`, so
+    processes that have the previous artifact memory-mapped keep reading it intact.
+
+    Example:
+        save_artifact("wine_model.artifact", {"weights": w}, {"classes": ["red", "white"]})
+    """
+    from src.stage_cache import file_digest
+
+    if source_path:
+        source_path = os.path.relpath(source_path, os.path.dirname(os.path.abspath(path)))
+        source_digest = file_digest(os.path.join(os.path.dirname(os.path.abspath(path)), source_path))
+    else:
+        source_digest = None
+    entries = {}
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        if array.dtype.hasobject:
+            raise ValueError(f"Array '{name}' has object dtype; store it in the metadata instead")
+        entries[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset += _aligned(array.nbytes)
+
+    header = json.dumps({
+        "version": ARTIFACT_VERSION,
+        "source_path": source_path,
+        "source_digest": source_digest,
+        "metadata": metadata or {},
+        "arrays": entries
+    }).encode()
+    data_start = _aligned(len(MAGIC) + 8 + len(header))
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(data_start + entries[name]["offset"])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+
+
+def load_artifact(path, check_source=False):
+    """
+    Loads a model artifact without copying its arrays.
+
+    The file is memory-mapped read-only and every array is a view into the
+    mapping, so loading only parses the small JSON header, and processes that
+    load the same artifact share its pages through the OS page cache.
+
+    Parameters:
+        path (str): Path to an artifact written by `save_artifact`.
+        check_source (bool, optional): Also check that the model file the artifact was
+                                       exported from has not changed since. Defaults to False.
+
+    Returns:
+        tuple: The dictionary of read-only arrays and the metadata dictionary.
+
+    Raises:
+        ValueError: If the file is not an artifact, was written by another format
+                    version, or is stale with respect to its source model.
+
+    Warns:
+        UserWarning: If `check_source` is set but the source model cannot be found,
+                     so that staleness cannot be checked.
+
+    Example:
+        arrays, metadata = load_artifact("results/models/wine_model.artifact")
+    """
+    buffer = np.memmap(path, dtype=np.uint8, mode="r")
+    if bytes(buffer[:len(MAGIC)]) != MAGIC:
+        raise ValueError(f"{path} is not a model artifact")
+    (header_length,) = struct.unpack("<Q", bytes(buffer[len(MAGIC):len(MAGIC) + 8]))
+    header_start = len(MAGIC) + 8
+    header = json.loads(bytes(buffer[header_start:header_start + header_length]))
+
+    if header["version"] != ARTIFACT_VERSION:
+        raise ValueError(f"{path} has artifact version {header['version']}, "
+                         f"expected {ARTIFACT_VERSION}; re-export the model")
+    if check_source and header["source_path"]:
+        # The source path is relative to the artifact's directory
+        source_path = os.path.join(os.path.dirname(os.path.abspath(path)), header["source_path"])
+        if not os.path.exists(source_path):
+            warnings.warn(f"Cannot check whether {path} is stale: its source model "
+                          f"{source_path} was not found")
+        else:
+            from src.stage_cache import file_digest
+            if file_digest(source_path) != header["source_digest"]:
+                raise ValueError(f"{path} is stale: {source_path} changed since it was exported")
+
+    data_start = _aligned(header_start + header_length)
+    arrays = {}
+    for name, entry in header["arrays"].items():
+        dtype = np.dtype(entry["dtype"])
+        count = int(np.prod(entry["shape"]))
+        start = data_start + entry["offset"]
+        arrays[name] = np.frombuffer(buffer, dtype=dtype, count=count, offset=start).reshape(entry["shape"])
+    return arrays, header["metadata"]
+
+
+def load_model(path, check_source=True):
+    """
+    Loads a model for scoring from either an artifact or a pickle.
+
+    Parameters:
+        path (str): A .artifact file (loaded as a `FastPredictor`) or a pickled model.
+        check_source (bool, optional): Reject artifacts whose source model changed. Defaults to True.
+
+    Returns:
+        object: A fitted model with `classes_`, `predict` and `predict_proba`.
+    """
+    if str(path).endswith(".artifact"):
+        from src.fast_predictor import FastPredictor
+        return FastPredictor.load(path, check_source=check_source)
+
+    import pickle
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def _aligned(n_bytes):
+    return -(-n_bytes // ALIGNMENT) * ALIGNMENT
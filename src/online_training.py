@@ -0,0 +1,177 @@
+# online_training.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+from src.preprocessing import NUMERICAL_FEATURES, ORDINAL_FEATURES, make_preprocessor
+
+# Number of new batches after which the model is refit on the whole history
+DEFAULT_REFIT_EVERY = 10
+
+
+class OnlineWineModel:
+    """
+    Logistic regression on the wine features that can be updated with new batches.
+
+    The model is the counterpart of the batch pipeline (the preprocessor of
+    `make_preprocessor` and a logistic regression with balanced class weights),
+    trained by stochastic gradient descent on the same L2-regularized
+    log loss: `SGDClassifier(loss="log_loss")` with `alpha = 1 / (C * n_rows)`,
+    which is the penalty `LogisticRegression(C=C)` puts on `n_rows` rows;
+    `alpha` shrinks as batches add rows.
+
+    `fit` trains from scratch on all the history. `partial_fit` only reads a new
+    batch: the scaler's running mean and variance are updated first, and the
+    coefficients are rescaled so that the model's predictions do not change with
+    the scaling, then a few passes of SGD learn from the batch. The balanced class
+    weights come from the running class counts. `refit_due` tells when
+    `refit_every` batches have been added since the last `fit`, the safeguard
+    against the drift of many small updates.
+
+    Parameters:
+        C (float, optional): Inverse regularization strength, as in LogisticRegression. Defaults to 1.0.
+        passes (int, optional): SGD passes over every new batch. Defaults to 5.
+        refit_passes (int, optional): SGD passes over the history in `fit`. Defaults to 30.
+        refit_every (int, optional): Batches after which a full refit is due. Defaults to DEFAULT_REFIT_EVERY.
+        random_state (int, optional): Seed of the row shuffling. Defaults to 123.
+
+    Example:
+        model = OnlineWineModel(C=best_C).fit(X_train, y_train)
+        model.partial_fit(X_batch, y_batch)
+        if model.refit_due:
+            model.fit(X_history, y_history)
+    """
+    def __init__(self, C=1.0, passes=5, refit_passes=30, refit_every=DEFAULT_REFIT_EVERY, random_state=123):
+        self.C = C
+        self.passes = passes
+        self.refit_passes = refit_passes
+        self.refit_every = refit_every
+        self.random_state = random_state
+
+    def fit(self, X, y):
+        """
+        Trains the model from scratch on all the given rows.
+
+        Parameters:
+            X (pd.DataFrame): The wine features.
+            y (pd.Series): The colors.
+
+        Returns:
+            OnlineWineModel: The fitted model.
+        """
+        y = np.asarray(y)
+        self.classes_, counts = np.unique(y, return_counts=True)
+        self.class_counts_ = counts.astype(np.int64)
+        self.feature_names_in_ = np.array(ORDINAL_FEATURES + NUMERICAL_FEATURES, dtype=object)
+        self.preprocessor_ = make_preprocessor().fit(X[list(self.feature_names_in_)])
+        # The fitted scaler inside the preprocessor, updated in place by `partial_fit`
+        self.scaler_ = self.preprocessor_.named_transformers_["standardscaler"]
+        self.classifier_ = SGDClassifier(loss="log_loss", alpha=1 / (self.C * len(y)),
+                                         random_state=self.random_state)
+        self._rng = np.random.default_rng(self.random_state)
+        self._learn(self._transform(X), y, self.refit_passes)
+        self.n_rows_ = len(y)
+        self.batches_since_refit_ = 0
+        self.rows_since_refit_ = 0
+        return self
+
+    def partial_fit(self, X, y):
+        """
+        Updates the model with a new batch of rows only.
+
+        Parameters:
+            X (pd.DataFrame): The wine features of the batch.
+            y (pd.Series): The colors of the batch.
+
+        Returns:
+            OnlineWineModel: The updated model.
+
+        Raises:
+            ValueError: If the model was never fitted or the batch has an unknown class.
+        """
+        if not hasattr(self, "classifier_"):
+            raise ValueError("Fit the model on the history before adding batches")
+        y = np.asarray(y)
+        unknown = set(np.unique(y)) - set(self.classes_)
+        if unknown:
+            raise ValueError(f"Unknown classes in the batch: {sorted(unknown)}")
+        self.class_counts_ = self.class_counts_ + np.array([(y == label).sum() for label in self.classes_])
+
+        # Rescale the coefficients so that the model is the same function of the raw features
+        mean, scale = self.scaler_.mean_.copy(), self.scaler_.scale_.copy()
+        self.scaler_.partial_fit(X[NUMERICAL_FEATURES])
+        numerical = slice(len(ORDINAL_FEATURES), None)
+        raw_coef = self.classifier_.coef_[:, numerical] / scale
+        self.classifier_.intercept_ += raw_coef @ (self.scaler_.mean_ - mean)
+        self.classifier_.coef_[:, numerical] = raw_coef * self.scaler_.scale_
+
+        # Keep the penalty of LogisticRegression(C) on all the rows seen so far
+        self.n_rows_ += len(y)
+        self.classifier_.alpha = 1 / (self.C * self.n_rows_)
+        self._learn(self._transform(X), y, self.passes)
+        self.batches_since_refit_ += 1
+        self.rows_since_refit_ += len(y)
+        return self
+
+    @property
+    def refit_due(self):
+        """Whether `refit_every` batches were added since the last full refit."""
+        return self.batches_since_refit_ >= self.refit_every
+
+    def decision_function(self, X):
+        """Log-odds of the second class of `classes_`."""
+        return self.classifier_.decision_function(self._transform(X))
+
+    def predict_proba(self, X):
+        """Probability of every class of `classes_`."""
+        return self.classifier_.predict_proba(self._transform(X))
+
+    def predict(self, X):
+        """The most probable color of every row."""
+        return self.classifier_.predict(self._transform(X))
+
+    def _transform(self, X):
+        """The features as the batch pipeline outputs them: quality codes, then scaled measurements."""
+        # np.asarray also accepts the DataFrame returned under set_config(transform_output="pandas")
+        return np.asarray(self.preprocessor_.transform(X[list(self.feature_names_in_)]), dtype=float)
+
+    def _learn(self, Z, y, passes):
+        """Runs passes of SGD over shuffled rows, weighting the classes by their running counts."""
+        weights = self.class_counts_.sum() / (len(self.classes_) * self.class_counts_)
+        sample_weight = weights[np.searchsorted(self.classes_, y)]
+        for _ in range(passes):
+            order = self._rng.permutation(len(y))
+            self.classifier_.partial_fit(Z[order], y[order], classes=self.classes_,
+                                         sample_weight=sample_weight[order])
+
+
+def compare_models(models, X_test, y_test, pos_label="red"):
+    """
+    Scores models on the same test set with the metrics of test_scores.csv.
+
+    Parameters:
+        models (dict): Fitted models by name, e.g. {"online": online_model, "batch": random_search}.
+        X_test (pd.DataFrame): The test features.
+        y_test (pd.Series): The test colors.
+        pos_label (str, optional): The positive class of precision, recall and F1. Defaults to "red".
+
+    Returns:
+        pd.DataFrame: One row per model with its "model", "accuracy", "precision", "recall" and "F1 score".
+
+    Example:
+        compare_models({"online": online_model, "batch": random_search}, X_test, y_test)
+    """
+    rows = []
+    for name, model in models.items():
+        predictions = model.predict(X_test)
+        rows.append({
+            "model": name,
+            "accuracy": accuracy_score(y_test, predictions),
+            "precision": precision_score(y_test, predictions, pos_label=pos_label),
+            "recall": recall_score(y_test, predictions, pos_label=pos_label),
+            "F1 score": f1_score(y_test, predictions, pos_label=pos_label)
+        })
+    return pd.DataFrame(rows)
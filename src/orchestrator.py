@@ -0,0 +1,191 @@
+# orchestrator.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import multiprocessing
+import os
+import time
+import traceback
+from multiprocessing.connection import wait
+import pandas as pd
+from src.data_io import preload_table
+
+
+def check_dag(stages):
+    """
+    Orders the stages of a pipeline so that every stage comes after the stages it needs.
+
+    Parameters:
+        stages (dict): Stage definitions by name, each with an "after" list of stage names.
+
+    Returns:
+        list: The stage names in a valid execution order, keeping the given order where possible.
+
+    Raises:
+        ValueError: If a stage needs an unknown stage or the stages form a cycle.
+    """
+    for name, definition in stages.items():
+        unknown = set(definition.get("after", [])) - set(stages)
+        if unknown:
+            raise ValueError(f"Stage '{name}' runs after unknown stages {sorted(unknown)}")
+    order = []
+    while len(order) < len(stages):
+        ready = [name for name, definition in stages.items() if name not in order
+                 and all(dep in order for dep in definition.get("after", []))]
+        if not ready:
+            cycle = sorted(set(stages) - set(order))
+            raise ValueError(f"The stages {cycle} depend on each other in a cycle")
+        order.append(ready[0])
+    return order
+
+
+def critical_path(stages, seconds):
+    """
+    Finds the chain of dependent stages that took the longest.
+
+    No schedule can run the pipeline faster than its critical path, however many
+    workers are used; speeding up any other stage does not shorten the run.
+
+    Parameters:
+        stages (dict): Stage definitions by name, each with an "after" list of stage names.
+        seconds (dict): Duration of every stage that ran.
+
+    Returns:
+        tuple: The stage names on the critical path, in order, and its total seconds.
+    """
+    finish, previous = {}, {}
+    for name in check_dag(stages):
+        if name not in seconds:
+            continue
+        deps = [dep for dep in stages[name].get("after", []) if dep in finish]
+        previous[name] = max(deps, key=finish.get) if deps else None
+        finish[name] = seconds[name] + (finish[previous[name]] if deps else 0.0)
+    if not finish:
+        return [], 0.0
+    path = [max(finish, key=finish.get)]
+    while previous[path[-1]] is not None:
+        path.append(previous[path[-1]])
+    return path[::-1], finish[path[0]]
+
+
+def run_dag(stages, workers=None):
+    """
+    Runs the stages of a pipeline, starting every stage as soon as the stages it needs are done.
+
+    Independent stages run at the same time in up to `workers` processes. Each
+    stage's process is forked from this one when the stage starts, so it inherits
+    every module already imported and every table already loaded instead of
+    starting a new interpreter: the tables listed in a stage's "shares" are
+    loaded once here when the stage finishes, and later stages read them from
+    memory through `read_table`. Stages after a failed stage are skipped.
+
+    Where processes cannot be forked, or with a single worker, the stages run one
+    after another in this process, still sharing the imports and tables.
+
+    Parameters:
+        stages (dict): Stage definitions by name, each a dictionary with:
+            "run" (callable): Function run without arguments; raising fails the stage.
+            "after" (list, optional): Names of the stages that must finish first.
+            "shares" (list, optional): Tables written by the stage that later stages read.
+            "prepare" (callable, optional): Run here before the stage starts, e.g. to import
+                                            its modules once for all forked processes.
+        workers (int, optional): Largest number of stages running at once. Defaults to
+                                 the number of available cores.
+
+    Returns:
+        pd.DataFrame: One row per stage with its "status" ("done", "failed" or "skipped"),
+                      "start" and "end" (seconds since the pipeline started), "seconds",
+                      "critical" (whether it is on the critical path) and the "error" of
+                      a failed stage.
+
+    Raises:
+        ValueError: If the stages do not form a DAG.
+
+    Example:
+        report = run_dag({
+            "split": {"run": run_split, "shares": ["data/proc/wine_train.csv"]},
+            "eda": {"run": run_eda, "after": ["split"]},
+            "model": {"run": run_model, "after": ["split"]}
+        }, workers=2)
+    """
+    order = check_dag(stages)
+    if workers is None:
+        workers = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    forked = workers > 1 and "fork" in multiprocessing.get_all_start_methods()
+
+    origin = time.perf_counter()
+    results = {}
+    running = {}
+    while len(results) < len(order):
+        for name in order:
+            if name in results or name in running:
+                continue
+            deps = stages[name].get("after", [])
+            if any(results.get(dep, {}).get("status") in ("failed", "skipped") for dep in deps):
+                results[name] = {"status": "skipped"}
+            elif all(dep in results for dep in deps) and (len(running) < workers or not forked):
+                start = time.perf_counter() - origin
+                error = _run(stages[name]["prepare"]) if "prepare" in stages[name] else None
+                if error is None and forked:
+                    running[name] = (start, *_fork(stages[name]["run"]))
+                    continue
+                if error is None:
+                    error = _run(stages[name]["run"])
+                results[name] = _finish(stages[name], start, time.perf_counter() - origin, error)
+        if running:
+            ready = wait([conn for _, _, conn in running.values()])
+            for name in [name for name, (_, _, conn) in running.items() if conn in ready]:
+                start, process, conn = running.pop(name)
+                try:
+                    error = conn.recv()
+                except EOFError:
+                    error = None
+                process.join()
+                if process.exitcode != 0 and error is None:
+                    error = f"Stage process exited with code {process.exitcode}"
+                results[name] = _finish(stages[name], start, time.perf_counter() - origin, error)
+
+    report = pd.DataFrame([{"stage": name, **results[name]} for name in order])
+    for column in ["start", "end", "seconds", "error"]:
+        if column not in report:
+            report[column] = None
+    done = report[report["status"] == "done"]
+    path, _ = critical_path(stages, dict(zip(done["stage"], done["seconds"])))
+    report["critical"] = report["stage"].isin(path)
+    return report[["stage", "status", "start", "end", "seconds", "critical", "error"]]
+
+
+def _run(func):
+    """Runs a stage, returning None or the traceback of its error."""
+    try:
+        func()
+    except SystemExit as exit:
+        if exit.code not in (None, 0):
+            return f"Stage exited with code {exit.code}"
+    except BaseException:
+        return traceback.format_exc()
+    return None
+
+
+def _fork(func):
+    """Starts a stage in a forked process that sends back None or its error."""
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.get_context("fork").Process(target=_child, args=(func, sender))
+    process.start()
+    sender.close()
+    return process, receiver
+
+
+def _child(func, conn):
+    conn.send(_run(func))
+    conn.close()
+
+
+def _finish(definition, start, end, error):
+    """The result of a finished stage, loading the tables it shares if it succeeded."""
+    if error is None:
+        for path in definition.get("shares", []):
+            if os.path.exists(path):
+                preload_table(path)
+    return {"status": "done" if error is None else "failed", "start": start, "end": end,
+            "seconds": end - start, "error": error}
@@ -0,0 +1,107 @@
+# parallel.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import shutil
+import tempfile
+import numpy as np
+from joblib import effective_n_jobs, parallel_config
+from joblib.parallel import get_active_backend
+
+# Executors the searches can run on, and the joblib backend behind each
+BACKENDS = {"process": "loky", "thread": "threading", "serial": "sequential"}
+
+
+def executor(backend="process", n_jobs=-1):
+    """
+    Selects where the candidates and folds of a search are run.
+
+    The searches schedule their work through joblib, so every search and
+    cross-validation run inside this context uses the chosen executor.
+
+    Parameters:
+        backend (str, optional): "process" (a pool of worker processes), "thread" (a
+                                 thread pool) or "serial". Defaults to "process".
+        n_jobs (int, optional): Number of workers; -1 uses every core available to this
+                                process (respecting CPU affinity and container quotas).
+                                Defaults to -1.
+
+    Returns:
+        context manager: The joblib configuration to use in a `with` statement.
+
+    Raises:
+        ValueError: If the backend is unknown.
+
+    Example:
+        with executor("thread", n_jobs=4):
+            search.fit(X_train, y_train)
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {list(BACKENDS)}")
+    return parallel_config(backend=BACKENDS[backend], n_jobs=1 if backend == "serial" else n_jobs)
+
+
+def uses_processes(n_jobs=None):
+    """Checks whether joblib work with `n_jobs` would run in other processes."""
+    backend, _ = get_active_backend()
+    return not getattr(backend, "supports_sharedmem", False) and effective_n_jobs(n_jobs) > 1
+
+
+class SharedArrays:
+    """
+    Memory-mapped copies of arrays that worker processes attach to without copying.
+
+    Each array is written once to a file in a temporary directory and replaced by a
+    read-only memory map of that file. joblib sends a memory-mapped array to a
+    worker as a reference to its file, so every worker maps the same pages instead
+    of unpickling its own copy of the data. The files are removed on `close`.
+
+    Parameters:
+        enabled (bool, optional): Share the arrays; if False they are returned unchanged,
+                                  e.g. for thread pools, which share memory already.
+                                  Defaults to True.
+        directory (str, optional): Where to create the temporary directory, e.g. /dev/shm.
+                                   Defaults to the system temporary directory; mapped pages
+                                   stay in the shared page cache either way.
+
+    Example:
+        with SharedArrays(uses_processes(n_jobs)) as shared:
+            fold = shared.share_all(fold)
+            Parallel(n_jobs)(delayed(fit)(fold, C) for C in Cs)
+    """
+    def __init__(self, enabled=True, directory=None):
+        self.enabled = enabled
+        self._directory = tempfile.mkdtemp(prefix="wine-shared-", dir=directory) if enabled else None
+        self._count = 0
+
+    def share(self, array):
+        """
+        Returns a read-only memory-mapped copy of an array.
+
+        Arrays of Python objects cannot be mapped and are returned unchanged.
+        """
+        array = np.asarray(array)
+        if not self.enabled or array.dtype.hasobject:
+            return array
+        path = os.path.join(self._directory, f"array-{self._count}.npy")
+        self._count += 1
+        np.save(path, array)
+        return np.load(path, mmap_mode="r")
+
+    def share_all(self, arrays):
+        """Shares every array value of a dictionary, leaving the other values unchanged."""
+        return {key: self.share(value) if isinstance(value, np.ndarray) else value
+                for key, value in arrays.items()}
+
+    def close(self):
+        """Removes the files backing the shared arrays."""
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,89 @@
+# prediction_cache.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import hashlib
+import pickle
+import numpy as np
+from src.row_hash import hash_rows
+
+
+def model_fingerprint(model):
+    """
+    Computes a content fingerprint of a fitted model.
+
+    A search object and its `best_estimator_` predict identically, so both get
+    the fingerprint of the best estimator.
+
+    Parameters:
+        model (scikit-learn object): A fitted model or search object.
+
+    Returns:
+        str: The hex digest of the pickled estimator.
+    """
+    estimator = getattr(model, "best_estimator_", model)
+    return hashlib.sha256(pickle.dumps(estimator)).hexdigest()
+
+
+def dataset_fingerprint(X):
+    """
+    Computes a content fingerprint of a feature dataframe.
+
+    Parameters:
+        X (pd.DataFrame): The samples to fingerprint.
+
+    Returns:
+        str: The hex digest of the column names and the row hashes, in order.
+    """
+    digest = hashlib.sha256("\0".join(map(str, X.columns)).encode())
+    digest.update(hash_rows(X).tobytes())
+    return digest.hexdigest()
+
+
+class PredictionCache:
+    """
+    Caches the predictions of a model on a dataset, so that every dataset is
+    scored once per model however many metrics, plots and checks use it.
+
+    Entries are keyed on the model fingerprint and the dataset fingerprint.
+    Labels are taken from the same `predict_proba` call as the probabilities.
+
+    Example:
+        cache = PredictionCache()
+        labels, proba = cache.predict(random_search, X_test)
+        evaluation(random_search, X_test, y_test, "red", table_to, plot_to, cache=cache)
+    """
+    def __init__(self):
+        self._entries = {}
+        self._fingerprints = {}
+        self.hits = 0
+        self.misses = 0
+
+    def predict(self, model, X):
+        """
+        Returns the predicted labels and class probabilities of a model on a dataset.
+
+        Parameters:
+            model (scikit-learn object): A fitted classifier or search object with `predict_proba`.
+            X (pd.DataFrame): The samples to score.
+
+        Returns:
+            tuple: The array of predicted labels and the array of class probabilities
+                   (columns in `model.classes_` order).
+        """
+        key = (self._model_fingerprint(model), dataset_fingerprint(X))
+        if key in self._entries:
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        proba = model.predict_proba(X)
+        labels = np.asarray(model.classes_)[proba.argmax(axis=1)]
+        self._entries[key] = (labels, proba)
+        return labels, proba
+
+    def _model_fingerprint(self, model):
+        # Pickling the model is the expensive part of the key, so do it once per model object
+        if id(model) not in self._fingerprints:
+            self._fingerprints[id(model)] = (model, model_fingerprint(model))
+        return self._fingerprints[id(model)][1]
@@ -0,0 +1,39 @@
+# preprocessing.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+from sklearn.compose import make_column_transformer
+from sklearn.preprocessing import OrdinalEncoder, StandardScaler
+from src.validation import WINE_RULES
+
+# Features of the wine model by how they are preprocessed, shared by the batch and online models
+ORDINAL_FEATURES = ["quality"]
+NUMERICAL_FEATURES = [
+    'fixed_acidity', 'volatile_acidity', 'citric_acid', 'residual_sugar', 'chlorides',
+    'free_sulfur_dioxide', 'total_sulfur_dioxide', 'density', 'pH', 'sulphates', 'alcohol'
+]
+
+# Categories of the quality, in the order of their codes; every valid quality gets a code
+# even if the training rows lack it, so that online updates can bring new qualities
+QUALITY_CATEGORIES = list(range(WINE_RULES["quality"]["range"][0], WINE_RULES["quality"]["range"][1] + 1))
+
+
+def make_preprocessor():
+    """
+    Builds the preprocessor of the wine model.
+
+    The quality is ordinal-encoded with QUALITY_CATEGORIES, and the measurements are
+    standard-scaled; the output has the quality code first, then the scaled
+    measurements in NUMERICAL_FEATURES order.
+
+    Returns:
+        ColumnTransformer: The unfitted preprocessor.
+
+    Example:
+        wine_pipe = make_pipeline(make_preprocessor(), LogisticRegression())
+    """
+    return make_column_transformer(
+        (OrdinalEncoder(categories=[QUALITY_CATEGORIES], dtype=int), ORDINAL_FEATURES),
+        (StandardScaler(), NUMERICAL_FEATURES),
+        remainder='passthrough'
+    )
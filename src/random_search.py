@@ -1,9 +1,15 @@
 import pickle
-from sklearn.model_selection import RandomizedSearchCV
 from sklearn.metrics import make_scorer, f1_score
 from scipy.stats import loguniform
+from src.adaptive_search import BayesianSearchCV, SuccessiveHalvingSearchCV
+from src.fold_cache import CachedRandomizedSearchCV
+from src.instrumentation import instrumented
+from src.parallel import executor
+from src.regularization_path import RegularizationPathSearchCV
 
-def perform_random_search(wine_pipe, X_train, y_train, seed, output_path):
+@instrumented(rows_from="X_train")
+def perform_random_search(wine_pipe, X_train, y_train, seed, output_path, strategy="random",
+                          scoring=None, refit=True, backend="process", n_jobs=-1, time_budget=None):
     """
     Performs a randomized search for hyperparameter optimization on a given pipeline,
     saves the trained model to a specified
@@ -14,28 +20,80 @@ def perform_random_search(wine_pipe, X_train, y_train, seed, output_path):
         y_train: Training labels.
         seed: Random seed for reproducibility.
         output_path: Path to save the trained RandomizedSearchCV object (default is './results/models/wine_random_search.pickle').
+        strategy: "random" samples 10 values of C from loguniform(1e-1, 10), preprocessing each
+            fold once for all of them; "path" evaluates a dense grid of C over the same range
+            with a warm-started regularization path per fold; "halving" starts 30 candidates on
+            a subset of the training rows and gives more rows only to the best third of them
+            in each round; "bayes" chooses each of up to 20 candidates with a Gaussian process
+            fitted to the earlier results (default is "random").
+        scoring: Scorer used to rank the candidates, or a dictionary of scorers to collect
+            several metrics in the same cross-validation (default is F1 with 'red' as positive label).
+        refit: With a dictionary of scorers, the name of the metric that picks the best
+            candidate (default is True, for a single scorer).
+        backend: Executor of the candidate fits: "process", "thread" or "serial" (default is "process").
+            With processes, the preprocessed folds are memory-mapped once and shared by the workers.
+        n_jobs: Number of workers; -1 uses all available cores (default is -1).
+        time_budget: Seconds after which the "halving" and "bayes" strategies stop starting
+            new rounds or candidates (default is None, no limit).
 
     Returns:
-        The fitted RandomizedSearchCV object.
+        The fitted search object (with RandomizedSearchCV's cv_results_ layout) and its best estimator.
     """
+    if scoring is None:
+        scoring = make_scorer(f1_score, pos_label="red")
+
     # Define parameter grid
     param_grid = {
         "logisticregression__C": loguniform(1e-1, 10)
     }
 
-    # Set up RandomizedSearchCV
-    random_search = RandomizedSearchCV(
-        wine_pipe,
-        param_grid,
-        n_iter=10,
-        n_jobs=-1,
-        random_state=seed,
-        return_train_score=True,
-        scoring=make_scorer(f1_score, pos_label="red")
-    )
-
-    # Fit RandomizedSearchCV
-    random_search.fit(X_train, y_train)
+    if strategy == "random":
+        # Set up RandomizedSearchCV, sharing each fold's preprocessing between the candidates
+        random_search = CachedRandomizedSearchCV(
+            wine_pipe,
+            param_grid,
+            n_iter=10,
+            random_state=seed,
+            return_train_score=True,
+            scoring=scoring,
+            refit=refit
+        )
+    elif strategy == "path":
+        random_search = RegularizationPathSearchCV(
+            wine_pipe,
+            return_train_score=True,
+            scoring=scoring,
+            refit=refit
+        )
+    elif strategy == "halving":
+        random_search = SuccessiveHalvingSearchCV(
+            wine_pipe,
+            param_grid,
+            n_candidates=30,
+            time_budget=time_budget,
+            random_state=seed,
+            return_train_score=True,
+            scoring=scoring,
+            refit=refit
+        )
+    elif strategy == "bayes":
+        random_search = BayesianSearchCV(
+            wine_pipe,
+            param_grid,
+            n_iter=20,
+            time_budget=time_budget,
+            random_state=seed,
+            return_train_score=True,
+            scoring=scoring,
+            refit=refit
+        )
+    else:
+        raise ValueError(f"Unknown search strategy '{strategy}', expected 'random', 'path', "
+                         "'halving' or 'bayes'")
+
+    # Fit RandomizedSearchCV on the chosen executor
+    with executor(backend, n_jobs):
+        random_search.fit(X_train, y_train)
 
     print(random_search.best_score_)
 
@@ -0,0 +1,138 @@
+# regularization_path.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import time
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import BaseEstimator, clone
+from src.fold_cache import FoldCache, check_scorers, format_cv_results, score_fold, set_best_candidate
+from src.parallel import SharedArrays, uses_processes
+
+# Default grid: 50 values spanning the range sampled by the random search
+DEFAULT_CS = np.logspace(-1, 1, 50)
+
+
+class RegularizationPathSearchCV(BaseEstimator):
+    """
+    Cross-validated search over the regularization strength C of a pipeline
+    ending in a LogisticRegression.
+
+    Each fold is preprocessed once through a `FoldCache`, then the classifier is
+    fitted along the whole grid of C values in increasing order, warm-starting
+    every solve from the coefficients of the previous one. The results have the
+    same layout as `RandomizedSearchCV` (`cv_results_`, `best_params_`,
+    `best_estimator_`, ...), so they can be used in its place.
+
+    Parameters:
+        estimator (Pipeline): The unfitted pipeline; its last step must support `warm_start`.
+        Cs (array-like, optional): Values of C to evaluate. Defaults to DEFAULT_CS.
+        param_name (str, optional): Name of the C parameter in the pipeline.
+                                    Defaults to "logisticregression__C".
+        scoring (str, callable or dict, optional): Scorer used to rank the values, or several
+                                                   scorers by metric name. Defaults to the
+                                                   classifier's accuracy.
+        refit (bool or str, optional): Refit the best C on all the data; with several scorers,
+                                       the name of the metric that picks it. Defaults to True.
+        cv (int or cross-validation generator, optional): Folds to use. Defaults to 5.
+        n_jobs (int, optional): Number of folds fitted in parallel. Defaults to None, which
+                                uses the active joblib executor (see `src.parallel.executor`).
+        return_train_score (bool, optional): Also score the training folds. Defaults to False.
+
+    Example:
+        search = RegularizationPathSearchCV(wine_pipe, scoring=make_scorer(f1_score, pos_label="red"))
+        search.fit(X_train, y_train)
+    """
+    def __init__(self, estimator, Cs=None, param_name="logisticregression__C", scoring=None,
+                 refit=True, cv=5, n_jobs=None, return_train_score=False):
+        self.estimator = estimator
+        self.Cs = Cs
+        self.param_name = param_name
+        self.scoring = scoring
+        self.refit = refit
+        self.cv = cv
+        self.n_jobs = n_jobs
+        self.return_train_score = return_train_score
+
+    def fit(self, X, y):
+        """
+        Runs the cross-validated path on every fold and refits the best C on all the data.
+
+        Parameters:
+            X (pd.DataFrame): Training features.
+            y (pd.Series): Training labels.
+
+        Returns:
+            RegularizationPathSearchCV: The fitted search.
+        """
+        Cs = np.sort(np.asarray(DEFAULT_CS if self.Cs is None else self.Cs, dtype=float))
+        step_name, classifier = self.estimator.steps[-1]
+        self.scorer_ = check_scorers(self.estimator, self.scoring, self.refit)
+
+        folds = FoldCache(self.estimator[:-1], self.cv).fit(X, y).folds_
+        with SharedArrays(uses_processes(self.n_jobs)) as shared:
+            paths = Parallel(n_jobs=self.n_jobs)(
+                delayed(_fit_path)(clone(classifier), shared.share_all(fold),
+                                   self.param_name[len(step_name) + 2:], Cs,
+                                   self.scorer_, self.return_train_score)
+                for fold in folds
+            )
+        # Spread each fold's preprocessing time over its path so fit times stay comparable
+        for fold, path in zip(folds, paths):
+            for result in path:
+                result["fit_time"] += fold["time"] / len(Cs)
+
+        candidates = [{self.param_name: float(C)} for C in Cs]
+        results = [path[i] for i in range(len(Cs)) for path in paths]
+        self.n_splits_ = len(folds)
+        self.multimetric_ = isinstance(self.scorer_, dict)
+        self.cv_results_ = format_cv_results(candidates, results, len(folds), self.return_train_score)
+        if self.refit:
+            set_best_candidate(self, self.cv_results_, self.refit)
+            start = time.perf_counter()
+            self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_).fit(X, y)
+            self.refit_time_ = time.perf_counter() - start
+        return self
+
+    @property
+    def classes_(self):
+        return self.best_estimator_.classes_
+
+    @property
+    def feature_names_in_(self):
+        return self.best_estimator_.feature_names_in_
+
+    def predict(self, X):
+        """Predicts with the refitted best pipeline."""
+        return self.best_estimator_.predict(X)
+
+    def predict_proba(self, X):
+        """Predicts class probabilities with the refitted best pipeline."""
+        return self.best_estimator_.predict_proba(X)
+
+    def decision_function(self, X):
+        """Computes decision values with the refitted best pipeline."""
+        return self.best_estimator_.decision_function(X)
+
+    def score(self, X, y):
+        """Scores the refitted best pipeline with the search's (refit) scorer."""
+        scorer = self.scorer_[self.refit] if self.multimetric_ else self.scorer_
+        return scorer(self.best_estimator_, X, y)
+
+
+def _fit_path(classifier, fold, param, Cs, scorer, return_train_score):
+    """Fits a classifier along the path of Cs on one cached fold, warm-starting each fit."""
+    classifier.set_params(warm_start=True)
+    path = []
+    for C in Cs:
+        start = time.perf_counter()
+        classifier.set_params(**{param: C}).fit(fold["X_train"], fold["y_train"])
+        result = {"fit_time": time.perf_counter() - start}
+
+        start = time.perf_counter()
+        result["test_score"] = score_fold(classifier, fold["X_test"], fold["y_test"], scorer)
+        if return_train_score:
+            result["train_score"] = score_fold(classifier, fold["X_train"], fold["y_train"], scorer)
+        result["score_time"] = time.perf_counter() - start
+        path.append(result)
+    return path
@@ -0,0 +1,139 @@
+# row_hash.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import glob
+import numpy as np
+import pandas as pd
+
+
+def hash_rows(df, hash_key=None):
+    """
+    Computes a 64-bit content hash for every row of a dataframe.
+
+    Numeric columns are hashed as float64 so that the same row hashes identically
+    whether a chunk of a CSV file was parsed with an integer or a float dtype.
+
+    Parameters:
+        df (pd.DataFrame): The rows to hash.
+        hash_key (str, optional): 16 character key used to seed the hash. Defaults to None
+                                  (the pandas default key).
+
+    Returns:
+        np.ndarray: An array of uint64 hashes, one per row.
+    """
+    numeric = df.select_dtypes(include="number").columns
+    normalized = df.astype({col: "float64" for col in numeric})
+    kwargs = {} if hash_key is None else {"hash_key": hash_key}
+    return pd.util.hash_pandas_object(normalized, index=False, **kwargs).to_numpy()
+
+
+class RowHashSet:
+    """
+    A compact set of uint64 row hashes used to detect duplicate rows across chunks.
+
+    Hashes are kept in a few sorted NumPy runs (8 bytes per distinct row) instead of a
+    Python set; runs of similar size are merged so lookups stay logarithmic.
+
+    Example:
+        seen = RowHashSet()
+        for chunk in chunks:
+            chunk = chunk[seen.add_new(hash_rows(chunk))]
+    """
+    def __init__(self):
+        self._runs = []
+
+    def __len__(self):
+        return sum(run.size for run in self._runs)
+
+    def values(self):
+        """Returns all hashes in the set as one uint64 array."""
+        if not self._runs:
+            return np.empty(0, dtype=np.uint64)
+        return np.concatenate(self._runs)
+
+    def contains(self, hashes):
+        """
+        Checks which of the given hashes are already in the set.
+
+        Parameters:
+            hashes (np.ndarray): Array of uint64 hashes.
+
+        Returns:
+            np.ndarray: Boolean mask, True where the hash was seen before.
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        found = np.zeros(hashes.shape, dtype=bool)
+        for run in self._runs:
+            position = np.searchsorted(run, hashes).clip(max=run.size - 1)
+            found |= run[position] == hashes
+        return found
+
+    def add_new(self, hashes):
+        """
+        Adds hashes to the set and reports which rows are new.
+
+        A row is new if its hash was not in the set and it is the first
+        occurrence of that hash within `hashes`.
+
+        Parameters:
+            hashes (np.ndarray): Array of uint64 hashes.
+
+        Returns:
+            np.ndarray: Boolean mask, True for the rows that should be kept.
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        unique, first_index = np.unique(hashes, return_index=True)
+        unseen = ~self.contains(unique)
+        is_new = np.zeros(hashes.shape, dtype=bool)
+        is_new[first_index[unseen]] = True
+        self.add(unique[unseen])
+        return is_new
+
+    @classmethod
+    def load(cls, directory):
+        """
+        Loads a set saved with `save`. Runs are memory-mapped, so only the pages
+        touched by lookups are read from disk.
+
+        Parameters:
+            directory (str): Directory containing the saved runs.
+
+        Returns:
+            RowHashSet: The loaded set.
+        """
+        seen = cls()
+        runs = [np.load(path, mmap_mode="r") for path in glob.glob(os.path.join(directory, "run-*.npy"))]
+        seen._runs = sorted(runs, key=lambda run: run.size, reverse=True)
+        return seen
+
+    def save(self, directory):
+        """
+        Saves the set as one .npy file per run. Runs that are already on disk are
+        not rewritten, so saving after adding a batch only writes the merged runs.
+
+        Parameters:
+            directory (str): Directory to save the runs to.
+        """
+        os.makedirs(directory, exist_ok=True)
+        keep = set()
+        for run in self._runs:
+            path = os.path.join(directory, f"run-{run.size}-{int(run[0]):016x}-{int(run[-1]):016x}.npy")
+            keep.add(path)
+            if not os.path.exists(path):
+                np.save(path, np.asarray(run))
+        for path in glob.glob(os.path.join(directory, "run-*.npy")):
+            if path not in keep:
+                os.remove(path)
+
+    def add(self, hashes):
+        """Adds an array of hashes that are not yet in the set."""
+        run = np.unique(np.asarray(hashes, dtype=np.uint64))
+        if run.size == 0:
+            return
+        self._runs.append(run)
+        # Merge runs of similar size, keeping O(log n) sorted runs
+        while len(self._runs) > 1 and self._runs[-2].size <= 2 * self._runs[-1].size:
+            last = self._runs.pop()
+            self._runs[-1] = np.union1d(self._runs[-1], last)
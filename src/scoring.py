@@ -0,0 +1,64 @@
+# scoring.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import time
+import numpy as np
+import pandas as pd
+from src.data_io import iter_table, TableWriter
+from src.instrumentation import instrumented, record_rows
+
+
+@instrumented()
+def score_table(model, input_path, output_path, chunksize=100_000, pos_label="red",
+                compression=None, progress=None, monitor=None):
+    """
+    Scores a table of wine samples in chunks and writes the predictions incrementally.
+
+    Each chunk is scored with a single `predict_proba` call; the predicted class is
+    taken from the same probabilities, so every row is scored once. Only the feature
+    columns the model was fitted on are read from the input.
+
+    Parameters:
+        model (scikit-learn object): A fitted classifier or search object with `predict_proba`.
+        input_path (str): Path to a .csv, .parquet or .arrow file of wine samples.
+        output_path (str): Path of the predictions file (.csv, .parquet or .arrow).
+        chunksize (int, optional): Number of rows scored at a time. Defaults to 100,000.
+        pos_label (str, optional): The class whose probability is written. Defaults to "red".
+        compression (str, optional): Compression codec for columnar outputs. Defaults to None.
+        progress (callable, optional): Called with the running totals dictionary after each chunk.
+        monitor (DriftMonitor, optional): Monitor updated with the predictions of every chunk,
+                                          whose reference is the probability of `pos_label`.
+
+    Returns:
+        dict: The number of "rows" scored, the elapsed "seconds" and "rows_per_second".
+
+    Example:
+        score_table(random_search, "data/raw/nightly_feed.parquet", "results/nightly_predictions.parquet")
+    """
+    classes = np.asarray(model.classes_)
+    pos_index = list(classes).index(pos_label)
+    columns = list(model.feature_names_in_) if hasattr(model, "feature_names_in_") else None
+
+    start = time.perf_counter()
+    totals = {"rows": 0, "seconds": 0.0, "rows_per_second": 0.0}
+    with TableWriter(output_path, compression) as writer:
+        for chunk in iter_table(input_path, chunksize, columns=columns):
+            proba = model.predict_proba(chunk)
+            prediction = classes[proba.argmax(axis=1)]
+            writer.write(pd.DataFrame({
+                "row": np.arange(totals["rows"], totals["rows"] + len(chunk)),
+                "prediction": prediction,
+                f"{pos_label}_probability": proba[:, pos_index]
+            }))
+            if monitor is not None:
+                monitor.update(proba[:, pos_index], prediction)
+
+            totals["rows"] += len(chunk)
+            totals["seconds"] = time.perf_counter() - start
+            totals["rows_per_second"] = totals["rows"] / totals["seconds"] if totals["seconds"] else 0.0
+            if progress is not None:
+                progress(totals)
+
+    record_rows(totals["rows"])
+    return totals
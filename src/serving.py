@@ -0,0 +1,252 @@
+# serving.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numbers
+import numpy as np
+import pandas as pd
+from src.validation import WINE_RULES
+
+# Number of recent request latencies kept for the percentiles
+LATENCY_WINDOW = 10_000
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent prediction requests into micro-batches.
+
+    Requests are queued; a worker thread takes the first waiting request, keeps
+    collecting requests until `max_batch_size` rows are gathered or
+    `max_latency_ms` has passed since that first request, and scores them all
+    with one `predict_proba` call. This spreads the fixed pandas/ColumnTransformer
+    overhead of a call over every request in the batch. Requests are validated
+    before they are queued, and if a batch still fails, its requests are scored
+    one by one so that only the failing request gets the error.
+
+    Parameters:
+        model (scikit-learn object): A fitted classifier or search object with `predict_proba`.
+        max_batch_size (int, optional): Maximum number of rows per batch. Defaults to 256.
+        max_latency_ms (float, optional): Longest time a request waits for others to join
+                                          its batch. Defaults to 5 ms.
+        pos_label (str, optional): The class whose probability is returned. Defaults to "red".
+
+    Example:
+        batcher = MicroBatcher(random_search).start()
+        batcher.predict([{"fixed_acidity": 7.4, ..., "quality": 5}])
+    """
+    def __init__(self, model, max_batch_size=256, max_latency_ms=5.0, pos_label="red"):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000
+        self.pos_label = pos_label
+        self.classes = np.asarray(model.classes_)
+        self.pos_index = list(self.classes).index(pos_label)
+        self.features = list(model.feature_names_in_) if hasattr(model, "feature_names_in_") else None
+
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._counters = {"requests": 0, "rows": 0, "batches": 0, "errors": 0}
+        self._started = None
+
+    def start(self):
+        """Starts the batching thread and returns the batcher."""
+        self._started = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the batching thread once the queued requests are scored."""
+        self._stop.set()
+        self._thread.join()
+
+    def submit(self, records):
+        """
+        Queues a request without waiting for its result.
+
+        Parameters:
+            records (list): Wine samples as dictionaries of feature values.
+
+        Returns:
+            concurrent.futures.Future: Resolves to one result dictionary per record.
+
+        Raises:
+            ValueError: If there are no records, or a record is missing one of the model's
+                        features or has a value that is not a finite number (or, for an
+                        integer feature such as quality, not a whole number in its valid range).
+        """
+        if not isinstance(records, list) or not records:
+            raise ValueError("A request needs a non-empty list of instances")
+        for record in records:
+            _check_record(record, self.features)
+        future = Future()
+        self._queue.put((records, future, time.perf_counter()))
+        return future
+
+    def predict(self, records, timeout=None):
+        """Queues a request and waits for its predictions."""
+        return self.submit(records).result(timeout)
+
+    def metrics(self):
+        """
+        Returns the latency percentiles (in milliseconds) of recent requests and
+        the request, row and batch counters since the batcher started.
+        """
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000
+            metrics = dict(self._counters)
+        uptime = time.perf_counter() - self._started if self._started else 0.0
+        metrics.update({
+            "p50_latency_ms": float(np.percentile(latencies, 50)) if latencies.size else None,
+            "p99_latency_ms": float(np.percentile(latencies, 99)) if latencies.size else None,
+            "mean_batch_rows": metrics["rows"] / metrics["batches"] if metrics["batches"] else None,
+            "requests_per_second": metrics["requests"] / uptime if uptime else 0.0,
+            "rows_per_second": metrics["rows"] / uptime if uptime else 0.0
+        })
+        return metrics
+
+    def _run(self):
+        while not (self._stop.is_set() and self._queue.empty()):
+            try:
+                first = self._queue.get(timeout=0.05)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            n_rows = len(first[0])
+            deadline = first[2] + self.max_latency
+            while n_rows < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                n_rows += len(item[0])
+
+            self._score(batch)
+
+    def _score(self, batch):
+        """Scores a batch of requests with one call and resolves their futures."""
+        records = [record for request, _, _ in batch for record in request]
+        try:
+            X = pd.DataFrame.from_records(records, columns=self.features)
+            proba = self.model.predict_proba(X)
+        except Exception as e:
+            if len(batch) > 1:
+                # Find the failing requests instead of failing every request of the batch
+                for item in batch:
+                    self._score([item])
+                return
+            batch[0][1].set_exception(e)
+            with self._lock:
+                self._counters["errors"] += 1
+            return
+
+        predictions = self.classes[proba.argmax(axis=1)]
+        start = 0
+        done = time.perf_counter()
+        for request, future, submitted in batch:
+            stop = start + len(request)
+            future.set_result([
+                {"prediction": str(label), f"{self.pos_label}_probability": float(p)}
+                for label, p in zip(predictions[start:stop], proba[start:stop, self.pos_index])
+            ])
+            start = stop
+            with self._lock:
+                self._latencies.append(done - submitted)
+
+        with self._lock:
+            self._counters["requests"] += len(batch)
+            self._counters["rows"] += len(records)
+            self._counters["batches"] += 1
+
+
+def _check_record(record, features):
+    """Raises a ValueError if a record cannot be scored."""
+    if not isinstance(record, dict):
+        raise ValueError(f"An instance must be an object of feature values, not {type(record).__name__}")
+    if features is None:
+        return
+    missing = [col for col in features if col not in record]
+    if missing:
+        raise ValueError(f"Missing features: {missing}")
+    for col in features:
+        value = record[col]
+        if isinstance(value, bool) or not isinstance(value, numbers.Real) or not np.isfinite(value):
+            raise ValueError(f"Feature '{col}' must be a finite number, not {value!r}")
+        rule = WINE_RULES.get(col, {})
+        if rule.get("dtype") == "int":
+            low, high = rule["range"]
+            if value != int(value) or not low <= value <= high:
+                raise ValueError(f"Feature '{col}' must be a whole number from {low} to {high}, not {value!r}")
+
+
+def make_server(batcher, host="127.0.0.1", port=8000):
+    """
+    Creates the HTTP prediction server around a started `MicroBatcher`.
+
+    Endpoints:
+        POST /predict: body {"instances": [{feature: value, ...}, ...]} or a single
+                       instance; returns {"predictions": [...]}.
+        GET /metrics: latency percentiles and throughput counters.
+        GET /health: {"status": "ok"}.
+
+    Parameters:
+        batcher (MicroBatcher): The started batcher that scores the requests.
+        host (str, optional): Interface to listen on. Defaults to localhost.
+        port (int, optional): Port to listen on; 0 picks a free port. Defaults to 8000.
+
+    Returns:
+        ThreadingHTTPServer: The server; call `serve_forever()` to start handling requests.
+    """
+    class PredictionHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                self._reply(200, batcher.metrics())
+            elif self.path == "/health":
+                self._reply(200, {"status": "ok"})
+            else:
+                self._reply(404, {"error": f"Unknown endpoint: {self.path}"})
+
+        def do_POST(self):
+            if self.path != "/predict":
+                self._reply(404, {"error": f"Unknown endpoint: {self.path}"})
+                return
+            try:
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                records = body["instances"] if isinstance(body, dict) and "instances" in body else body
+                records = [records] if isinstance(records, dict) else records
+                future = batcher.submit(records)
+            except (ValueError, TypeError) as e:
+                self._reply(400, {"error": str(e)})
+                return
+            try:
+                self._reply(200, {"predictions": future.result()})
+            except Exception as e:
+                self._reply(500, {"error": str(e)})
+
+        def _reply(self, status, content):
+            body = json.dumps(content).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ThreadingHTTPServer((host, port), PredictionHandler)
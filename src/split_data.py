@@ -1,10 +1,27 @@
 import os
+import json
+import math
+import shutil
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from sklearn.model_selection import train_test_split
 from sklearn import set_config
+from src.data_io import FORMAT_EXTENSIONS, write_table, iter_table, TableWriter
+from src.instrumentation import instrumented, record_rows
+from src.row_hash import hash_rows, RowHashSet
+from src.streaming_stats import StreamingSummary
 
-def clean_n_split(raw_data_path, output_dir=None, test_size=0.3, random_state=123):
+# Sub-directory of the split outputs holding the row hashes and parameters of a hash split
+INDEX_DIR = ".split_index"
+
+# Summary statistics of the train set of a hash split, kept up to date by `append_split`
+TRAIN_SUMMARY = "train_summary.json"
+DEFAULT_CHUNKSIZE = 1_000_000
+
+@instrumented()
+def clean_n_split(raw_data_path, output_dir=None, test_size=0.3, random_state=123,
+                  output_format="csv", compression=None, chunksize=None, split_method="shuffle"):
     """
     Cleans raw data and splits it into test and train sets, 
     which are put into data/proc/ directory
@@ -12,7 +29,7 @@ def clean_n_split(raw_data_path, output_dir=None, test_size=0.3, random_state=12
     This function reads the raw wine data from a CSV file, removes any duplicate rows, 
     and splits the data into training and testing sets. The proportions of the training 
     and testing sets are controlled by the `test_size` parameter. The resulting datasets 
-    are then saved as CSV files in a specified directory.
+    are then saved as CSV, Parquet or Arrow IPC files in a specified directory.
 
     Parameters:
         raw_data_path (str): The file path to the raw data CSV file that needs to be processed.
@@ -20,16 +37,62 @@ def clean_n_split(raw_data_path, output_dir=None, test_size=0.3, random_state=12
                                       Defaults to 0.3 (30% test set, 70% train set).
         random_state (int, optional): A seed for the random number generator to ensure reproducibility. 
                                       Defaults to 123.
+        output_format (str, optional): Storage format of the outputs, one of "csv", "parquet" 
+                                      or "feather" (Arrow IPC). Defaults to "csv".
+        compression (str, optional): Compression codec for the columnar formats. Defaults to None.
+        chunksize (int, optional): If given, the raw file is streamed in chunks of this many rows 
+                                      instead of being loaded at once (see `_stream_split`). 
+                                      Defaults to None.
+        split_method (str, optional): "shuffle" to split with a seeded shuffle as before, or "hash" 
+                                      to assign every row from a seeded hash of its content, so 
+                                      that new batches can later be added with `append_split`. 
+                                      A hash split must be written as CSV, the only format 
+                                      that can be appended to. Defaults to "shuffle".
 
     Returns:
-        None: The function does not return any values. It saves the processed datasets as CSV files.
+        None: The function does not return any values. It saves the processed datasets to files.
+
+    Raises:
+        ValueError: If the output format or split method is unsupported, or a hash split 
+                    is not written as CSV.
     
     Example:
         clean_n_split("data/raw/wine_data.csv")
     """
+    if output_format not in FORMAT_EXTENSIONS:
+        raise ValueError(f"Unsupported output format: '{output_format}'")
+    if split_method not in ("shuffle", "hash"):
+        raise ValueError(f"Unsupported split method: '{split_method}'")
+    if split_method == "hash" and output_format != "csv":
+        raise ValueError(f"A hash split must be written as CSV to be appended to, not {output_format}")
+    extension = FORMAT_EXTENSIONS[output_format]
+
+    if output_dir is None:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        output_dir = os.path.join(os.path.dirname(script_dir), "data/proc")
+    train_path = os.path.join(output_dir, "wine_train" + extension)
+    test_path = os.path.join(output_dir, "wine_test" + extension)
+    shutil.rmtree(os.path.join(output_dir, INDEX_DIR), ignore_errors=True)
+
+    if split_method == "hash":
+        seen = RowHashSet()
+        summary = StreamingSummary()
+        _stream_split(raw_data_path, train_path, test_path, test_size, random_state,
+                      chunksize or DEFAULT_CHUNKSIZE, compression, split_method, seen, summary=summary)
+        _save_index(output_dir, seen, test_size, random_state, output_format)
+        summary.save(os.path.join(output_dir, INDEX_DIR, TRAIN_SUMMARY), source=train_path)
+        return
+
+    if chunksize is not None:
+        _stream_split(raw_data_path, train_path, test_path, test_size, random_state,
+                      chunksize, compression)
+        return
+
     set_config(transform_output="pandas")
     
-    wine = pd.read_csv(raw_data_path).drop_duplicates()
+    wine = pd.read_csv(raw_data_path)
+    record_rows(len(wine))
+    wine = wine.drop_duplicates()
     
     train_df, test_df = train_test_split(
         wine, 
@@ -37,11 +100,153 @@ def clean_n_split(raw_data_path, output_dir=None, test_size=0.3, random_state=12
         shuffle=True, 
         random_state=random_state
     )
+
+    write_table(train_df, train_path, compression)
+    write_table(test_df, test_path, compression)
+
+
+@instrumented()
+def append_split(batch_path, output_dir=None, chunksize=None):
+    """
+    Adds a new batch of raw data to an existing hash split.
+
+    Rows of the batch that are already in the split (or repeated within the batch) 
+    are dropped, and the remaining rows are appended to the train and test CSV files 
+    using the same seeded hash assignment as the original `clean_n_split` call. 
+    Only the batch is read, so the time taken is proportional to the batch size 
+    rather than to the size of the existing split. The saved summary statistics 
+    of the train set are updated with the appended rows (see `load_train_summary`).
+
+    Parameters:
+        batch_path (str): The file path to the new batch of raw data.
+        output_dir (str, optional): Directory holding the split created with 
+                                    `clean_n_split(..., split_method="hash")`. 
+                                    Defaults to data/proc.
+        chunksize (int, optional): Number of rows of the batch processed at a time. 
+                                   Defaults to DEFAULT_CHUNKSIZE.
+
+    Returns:
+        None: The function does not return any values. It appends to the split files.
+
+    Example:
+        append_split("data/raw/wine_batch_2025_01.csv")
+    """
     if output_dir is None:
         script_dir = os.path.dirname(os.path.abspath(__file__))
         output_dir = os.path.join(os.path.dirname(script_dir), "data/proc")
+    index_dir = os.path.join(output_dir, INDEX_DIR)
+    params_path = os.path.join(index_dir, "params.json")
+    if not os.path.exists(params_path):
+        raise FileNotFoundError(
+            f"No hash split found in {output_dir}; run clean_n_split with split_method='hash' first"
+        )
+    with open(params_path) as f:
+        params = json.load(f)
+
+    extension = FORMAT_EXTENSIONS[params["output_format"]]
+    train_path = os.path.join(output_dir, "wine_train" + extension)
+    seen = RowHashSet.load(index_dir)
+    summary_path = os.path.join(index_dir, TRAIN_SUMMARY)
+    # A summary that no longer describes the train file is left out of date rather than made wrong
+    summary = load_train_summary(train_path)
+    _stream_split(batch_path, train_path,
+                  os.path.join(output_dir, "wine_test" + extension),
+                  params["test_size"], params["random_state"], chunksize or DEFAULT_CHUNKSIZE, None,
+                  "hash", seen, append=True, summary=summary)
+    seen.save(index_dir)
+    if summary is not None:
+        summary.save(summary_path, source=train_path)
+
+
+def load_train_summary(train_path):
+    """
+    Loads the summary statistics saved with a hash split, if they describe its current train set.
+
+    Parameters:
+        train_path (str): The train file of the split.
+
+    Returns:
+        StreamingSummary: The summary of every row of the train file, or None if there is
+                          none or the file changed since it was saved.
+
+    Example:
+        summary = load_train_summary("data/proc/wine_train.csv")
+    """
+    summary_path = os.path.join(os.path.dirname(os.path.abspath(train_path)), INDEX_DIR, TRAIN_SUMMARY)
+    if not os.path.exists(summary_path):
+        return None
+    summary = StreamingSummary.load(summary_path)
+    return summary if summary.is_current(train_path) else None
+
+
+def _hash_key(random_state):
+    """Turns a seed into the 16 character key expected by the row hash."""
+    return str(random_state).zfill(16)[-16:]
+
+
+def _save_index(output_dir, seen, test_size, random_state, output_format):
+    """Saves the row hashes and split parameters that `append_split` needs."""
+    index_dir = os.path.join(output_dir, INDEX_DIR)
+    seen.save(index_dir)
+    with open(os.path.join(index_dir, "params.json"), "w") as f:
+        json.dump({
+            "test_size": test_size,
+            "random_state": random_state,
+            "output_format": output_format
+        }, f)
+
+
+def _stream_split(raw_data_path, train_path, test_path, test_size, random_state,
+                  chunksize, compression, split_method="shuffle", seen=None, append=False,
+                  summary=None):
+    """
+    Out-of-core version of `clean_n_split` that never holds more than one chunk in memory.
+
+    Duplicates are removed across chunks with a `RowHashSet` (8 bytes per distinct row).
+    With the "shuffle" method the deduplicated rows of each chunk are shuffled, and the 
+    first rows of the shuffle go to the test set so that after `n` distinct rows the test 
+    set holds exactly `ceil(test_size * n)` rows, the same count `train_test_split` produces. 
+    With the "hash" method a row goes to the test set when its seeded hash falls in the 
+    lowest `test_size` fraction of the hash range, which does not depend on any other row. 
+    Both outputs are written incrementally, and the train rows are added to `summary` if given.
+    """
+    if not 0 < test_size < 1:
+        raise ValueError("test_size must be a fraction between 0 and 1 when streaming")
+
+    rng = np.random.default_rng(random_state)
+    seen = RowHashSet() if seen is None else seen
+    hash_key = _hash_key(random_state) if split_method == "hash" else None
+    test_threshold = np.uint64(int(test_size * 2**64))
+    n_rows = 0
+    n_test = 0
+    n_read = 0
+
+    with TableWriter(train_path, compression, append) as train_out, \
+            TableWriter(test_path, compression, append) as test_out:
+        for chunk in iter_table(raw_data_path, chunksize):
+            n_read += len(chunk)
+            hashes = hash_rows(chunk, hash_key)
+            keep = seen.add_new(hashes)
+            chunk = chunk[keep]
+
+            if split_method == "hash":
+                is_test = hashes[keep] < test_threshold
+                test_out.write(chunk[is_test])
+                train_out.write(chunk[~is_test])
+                if summary is not None:
+                    summary.update(chunk[~is_test])
+                continue
+
+            chunk = chunk.iloc[rng.permutation(len(chunk))]
+
+            n_rows += len(chunk)
+            n_chunk_test = math.ceil(test_size * n_rows) - n_test
+            n_test += n_chunk_test
 
-    train_df.to_csv(os.path.join(output_dir, "wine_train.csv"), index=False)
-    test_df.to_csv(os.path.join(output_dir, "wine_test.csv"), index=False)
+            test_out.write(chunk.iloc[:n_chunk_test])
+            train_out.write(chunk.iloc[n_chunk_test:])
+            if summary is not None:
+                summary.update(chunk.iloc[n_chunk_test:])
+    record_rows(n_read)
     
 
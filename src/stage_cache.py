@@ -0,0 +1,195 @@
+# stage_cache.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import ast
+import os
+import json
+import hashlib
+
+# Root of the repository, which the cache directory and the src modules are relative to
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Directory holding the stage manifests; set WINE_STAGE_CACHE=off to disable caching
+CACHE_DIR = os.environ.get("WINE_STAGE_CACHE", "results/.stage_cache")
+if CACHE_DIR.lower() != "off":
+    CACHE_DIR = os.path.join(REPO_ROOT, CACHE_DIR)
+
+_BLOCK_SIZE = 1 << 20
+
+
+def file_digest(path, memo=None):
+    """
+    Computes the SHA-256 digest of a file's content, or of every .py file in a directory.
+
+    Parameters:
+        path (str): Path to a file or directory.
+        memo (dict, optional): Cache of earlier digests with the size and modification
+                               time of each file, so unchanged files are not re-read.
+
+    Returns:
+        str: The hex digest.
+    """
+    if os.path.isdir(path):
+        digest = hashlib.sha256()
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".py"):
+                digest.update(name.encode())
+                digest.update(file_digest(os.path.join(path, name), memo).encode())
+        return digest.hexdigest()
+
+    stat = os.stat(path)
+    memo_key = os.path.abspath(path)
+    if memo is not None and memo.get(memo_key, [None, None])[:2] == [stat.st_size, stat.st_mtime_ns]:
+        return memo[memo_key][2]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_BLOCK_SIZE), b""):
+            digest.update(block)
+    if memo is not None:
+        memo[memo_key] = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+    return digest.hexdigest()
+
+
+def code_files(path, package="src"):
+    """
+    Lists a source file and every module of the package it imports, directly or through other modules.
+
+    Keying a stage on these files rather than on the whole package means that editing
+    a module only invalidates the stages that run it.
+
+    Parameters:
+        path (str): Path to the script of the stage.
+        package (str, optional): Top-level package of the repository's modules. Defaults to "src".
+
+    Returns:
+        list: `path` followed by the sorted paths of the imported modules.
+
+    Example:
+        cache.key(inputs=[raw_data], code=code_files(__file__))
+    """
+    found, pending = set(), [path]
+    while pending:
+        with open(pending.pop(), "rb") as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                # `from src import x` imports the module src.x
+                names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            for name in names:
+                parts = name.split(".")
+                if parts[0] != package or len(parts) < 2:
+                    continue
+                module_path = os.path.join(REPO_ROOT, *parts) + ".py"
+                if os.path.exists(module_path) and module_path not in found:
+                    found.add(module_path)
+                    pending.append(module_path)
+    return [path] + sorted(found)
+
+
+class StageCache:
+    """
+    Content-addressed cache of a pipeline stage.
+
+    A stage is keyed on the content of its input files, its parameters and the
+    source code it runs. When the key and the content of the recorded outputs are
+    unchanged, the stage can be skipped; touching a file without changing it
+    does not invalidate the cache.
+
+    Parameters:
+        stage (str): Name of the stage, used for its manifest file.
+        cache_dir (str, optional): Directory of the manifests. Defaults to CACHE_DIR.
+
+    Example:
+        cache = StageCache("split")
+        key = cache.key(inputs=[raw_data], params={"seed": 123}, code=code_files(__file__))
+        if not cache.is_fresh(key, outputs):
+            ...
+            cache.record(key, outputs)
+    """
+    def __init__(self, stage, cache_dir=None):
+        self.stage = stage
+        self.cache_dir = CACHE_DIR if cache_dir is None else cache_dir
+        self.enabled = self.cache_dir.lower() != "off"
+        self._memo_path = os.path.join(self.cache_dir, "digests.json")
+        self._manifest_path = os.path.join(self.cache_dir, f"{stage}.json")
+        self._memo = self._load(self._memo_path)
+
+    def key(self, inputs=(), params=None, code=()):
+        """
+        Computes the cache key of a stage run.
+
+        Parameters:
+            inputs (list, optional): Paths of the input files.
+            params (dict, optional): Parameters of the run (seed, test size, output paths, ...).
+            code (list, optional): Paths of the source files or directories the stage runs.
+
+        Returns:
+            str: The hex digest identifying the run.
+        """
+        digest = hashlib.sha256()
+        for path in inputs:
+            digest.update(file_digest(path, self._memo).encode())
+        digest.update(json.dumps(params or {}, sort_keys=True, default=str).encode())
+        for path in code:
+            digest.update(file_digest(path, self._memo).encode())
+        self._save(self._memo_path, self._memo)
+        return digest.hexdigest()
+
+    def is_fresh(self, key, outputs=()):
+        """
+        Checks whether a stage run with this key already produced the given outputs.
+
+        Parameters:
+            key (str): The key returned by `key`.
+            outputs (list, optional): Paths of the files the stage writes.
+
+        Returns:
+            bool: True if the stage can be skipped.
+        """
+        if not self.enabled:
+            return False
+        manifest = self._load(self._manifest_path)
+        if manifest.get("key") != key or sorted(manifest.get("outputs", {})) != sorted(outputs):
+            return False
+        for path, expected in manifest["outputs"].items():
+            if not os.path.exists(path) or file_digest(path, self._memo) != expected:
+                return False
+        return True
+
+    def record(self, key, outputs=()):
+        """
+        Records that a stage run with this key produced the given outputs.
+
+        Parameters:
+            key (str): The key returned by `key`.
+            outputs (list, optional): Paths of the files the stage wrote.
+        """
+        if not self.enabled:
+            return
+        self._save(self._manifest_path, {
+            "key": key,
+            "outputs": {path: file_digest(path, self._memo) for path in outputs}
+        })
+        self._save(self._memo_path, self._memo)
+
+    def _load(self, path):
+        if not self.enabled or not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def _save(self, path, content):
+        if not self.enabled:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write to a temporary file first so that stages running in parallel never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(content, f, indent=2)
+        os.replace(tmp_path, path)
@@ -0,0 +1,347 @@
+# streaming_stats.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import json
+import os
+import numpy as np
+import pandas as pd
+from src.data_io import iter_table
+
+# Rows read at a time by `summarize_table`
+DEFAULT_CHUNKSIZE = 1_000_000
+
+# Largest number of distinct values a quantile sketch keeps exactly
+DEFAULT_SKETCH_SIZE = 10_000
+
+# Quantiles reported by `describe`, as in `pd.DataFrame.describe`
+DEFAULT_PERCENTILES = (0.25, 0.5, 0.75)
+
+
+class QuantileSketch:
+    """
+    Mergeable summary of a distribution answering quantile queries.
+
+    The sketch holds the distinct values seen with their counts, so as long as
+    there are at most `max_size` of them its quantiles are exact (the wine
+    measurements have a few hundred distinct values each). Beyond that, runs of
+    adjacent values of about equal total count are replaced by their weighted
+    mean, which bounds the error of any quantile to about 1 / `max_size` of the
+    rows. Two sketches merge into the sketch of all their values.
+
+    Parameters:
+        max_size (int, optional): Largest number of values kept. Defaults to DEFAULT_SKETCH_SIZE.
+
+    Example:
+        sketch = QuantileSketch().update(chunk["alcohol"].dropna().to_numpy())
+        sketch.quantile([0.25, 0.5, 0.75])
+    """
+    def __init__(self, max_size=DEFAULT_SKETCH_SIZE):
+        self.max_size = max_size
+        self.values = np.empty(0)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.exact = True
+
+    def update(self, values):
+        """Adds an array of values without missing values."""
+        values, counts = np.unique(np.asarray(values, dtype=float), return_counts=True)
+        return self._add(values, counts)
+
+    def merge(self, other):
+        """Adds the values of another sketch."""
+        exact = self.exact and other.exact
+        self._add(other.values, other.counts)
+        self.exact = self.exact and exact
+        return self
+
+    def quantile(self, q):
+        """
+        Computes quantiles with linear interpolation, as `np.percentile` and pandas do.
+
+        Parameters:
+            q (array-like): Quantiles between 0 and 1.
+
+        Returns:
+            np.ndarray: The quantiles; NaN if the sketch is empty.
+        """
+        q = np.asarray(q, dtype=float)
+        n = int(self.counts.sum())
+        if n == 0:
+            return np.full(q.shape, np.nan)
+        # Same virtual index and interpolation as np.percentile's "linear" method, which
+        # pandas calls with percentages
+        q = q * 100 / 100
+        position = n * q + (1 + q * -1) - 1
+        below = np.floor(position)
+        gamma = position - below
+        cumulative = np.cumsum(self.counts)
+        low = self.values[np.searchsorted(cumulative, np.clip(below, 0, n - 1), side="right")]
+        high = self.values[np.searchsorted(cumulative, np.clip(below + 1, 0, n - 1), side="right")]
+        diff = high - low
+        return np.where(gamma >= 0.5, high - diff * (1 - gamma), low + diff * gamma)
+
+    def _add(self, values, counts):
+        if len(self.values):
+            values, inverse = np.unique(np.concatenate([self.values, values]), return_inverse=True)
+            counts = np.bincount(inverse, weights=np.concatenate([self.counts, counts])).astype(np.int64)
+        self.values, self.counts = values, counts
+        if len(self.values) > self.max_size:
+            self._compress()
+        return self
+
+    def _compress(self):
+        """Replaces runs of adjacent values by their weighted mean, keeping the extremes."""
+        cumulative = np.cumsum(self.counts)
+        groups = ((cumulative - self.counts) * (self.max_size - 2) // cumulative[-1]).astype(np.int64) + 1
+        groups[0], groups[-1] = 0, self.max_size - 1
+        counts = np.bincount(groups, weights=self.counts, minlength=self.max_size)
+        sums = np.bincount(groups, weights=self.values * self.counts, minlength=self.max_size)
+        kept = counts > 0
+        self.values = sums[kept] / counts[kept]
+        self.counts = counts[kept].astype(np.int64)
+        self.exact = False
+
+
+class StreamingSummary:
+    """
+    Summary statistics of a table, accumulated one chunk at a time.
+
+    For every column the summary keeps the number of rows and of non-missing
+    values and the dtype; for numeric columns also the mean and sum of squared
+    deviations (merged with Welford's and Chan's updates), the minimum and
+    maximum and a `QuantileSketch`. Summaries of separate chunks, partitions or
+    new batches merge into the summary of all their rows, so a table only has to
+    be read once and an appended batch only adds its own rows. `describe` and
+    `datatypes` give the EDA tables; on a single chunk they are identical to
+    `DataFrame.describe` and the per-column non-null counts, and the quantiles
+    stay exact while every column has at most `sketch_size` distinct values.
+
+    Parameters:
+        percentiles (tuple, optional): Quantiles reported by `describe`. Defaults to DEFAULT_PERCENTILES.
+        sketch_size (int, optional): Size of the quantile sketches. Defaults to DEFAULT_SKETCH_SIZE.
+
+    Example:
+        summary = StreamingSummary()
+        for chunk in iter_table("data/proc/wine_train.csv", chunksize=100_000):
+            summary.update(chunk)
+        summary.describe()
+    """
+    def __init__(self, percentiles=DEFAULT_PERCENTILES, sketch_size=DEFAULT_SKETCH_SIZE):
+        self.percentiles = tuple(percentiles)
+        self.sketch_size = sketch_size
+        self.rows = 0
+        self.columns = {}
+        self.source = None
+
+    def update(self, df):
+        """
+        Adds the rows of a chunk.
+
+        Parameters:
+            df (pd.DataFrame): The chunk; its columns are added to the summary if new.
+
+        Returns:
+            StreamingSummary: The updated summary.
+        """
+        chunk = StreamingSummary(self.percentiles, self.sketch_size)
+        chunk.rows = len(df)
+        numeric = [col for col in df.columns if _is_numeric(df[col].dtype)]
+        for col in df.columns:
+            chunk.columns[col] = {"dtype": df[col].dtype, "non_null": int(df[col].notna().sum())}
+
+        # One row per column, so that every sum runs over contiguous values as in pandas
+        X = np.ascontiguousarray(df[numeric].to_numpy(dtype=float).T)
+        present = ~np.isnan(X)
+        n = present.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(present, X, 0).sum(axis=1) / n
+            m2 = np.where(present, (X - mean[:, None]) ** 2, 0).sum(axis=1)
+        for i, col in enumerate(numeric):
+            values = X[i][present[i]]
+            chunk.columns[col].update({
+                "mean": mean[i] if n[i] else np.nan,
+                "m2": m2[i] if n[i] else 0.0,
+                "min": values.min() if n[i] else np.nan,
+                "max": values.max() if n[i] else np.nan,
+                "sketch": QuantileSketch(self.sketch_size).update(values)
+            })
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """
+        Adds the rows summarized by another summary, e.g. of another partition or batch.
+
+        Parameters:
+            other (StreamingSummary): The other summary.
+
+        Returns:
+            StreamingSummary: The updated summary.
+        """
+        for col, theirs in other.columns.items():
+            ours = self.columns.get(col)
+            if ours is None:
+                # A column missing from the earlier rows counts them as missing
+                self.columns[col] = dict(theirs)
+                if "sketch" in theirs:
+                    self.columns[col]["sketch"] = QuantileSketch(self.sketch_size).merge(theirs["sketch"])
+                continue
+            ours["dtype"] = _merge_dtypes(ours["dtype"], theirs["dtype"])
+            na, nb = ours["non_null"], theirs["non_null"]
+            ours["non_null"] = na + nb
+            if "mean" not in ours or "mean" not in theirs:
+                for key in ("mean", "m2", "min", "max", "sketch"):
+                    ours.pop(key, None)
+                continue
+            if nb == 0:
+                continue
+            if na == 0:
+                ours.update(mean=theirs["mean"], m2=theirs["m2"], min=theirs["min"], max=theirs["max"])
+            else:
+                # Chan et al.'s pairwise update of the mean and sum of squared deviations
+                delta = theirs["mean"] - ours["mean"]
+                ours["mean"] = ours["mean"] + delta * nb / (na + nb)
+                ours["m2"] = ours["m2"] + theirs["m2"] + delta ** 2 * na * nb / (na + nb)
+                ours["min"] = min(ours["min"], theirs["min"])
+                ours["max"] = max(ours["max"], theirs["max"])
+            ours["sketch"].merge(theirs["sketch"])
+        self.rows += other.rows
+        return self
+
+    def null_counts(self):
+        """The number of missing values of every column."""
+        return pd.Series({col: self.rows - stats["non_null"] for col, stats in self.columns.items()},
+                         dtype="int64")
+
+    def describe(self):
+        """
+        The summary table of the numeric columns, laid out as `pd.DataFrame.describe`.
+
+        Returns:
+            pd.DataFrame: Count, mean, std, min, the percentiles and max of every numeric column.
+        """
+        numeric = {col: stats for col, stats in self.columns.items() if "mean" in stats}
+        labels = [f"{100 * q:g}%" for q in self.percentiles]
+        table = {}
+        for col, stats in numeric.items():
+            n = stats["non_null"]
+            std = np.sqrt(stats["m2"] / (n - 1)) if n > 1 else np.nan
+            table[col] = [float(n), stats["mean"] if n else np.nan, std, stats["min"],
+                          *stats["sketch"].quantile(self.percentiles), stats["max"]]
+        return pd.DataFrame(table, index=["count", "mean", "std", "min", *labels, "max"],
+                            columns=list(numeric), dtype=float)
+
+    def datatypes(self):
+        """
+        The non-null count and dtype of every column.
+
+        Returns:
+            pd.DataFrame: One row per column with "Column", "Non-Null Count" and "Data Type".
+        """
+        return pd.DataFrame({
+            "Column": list(self.columns),
+            "Non-Null Count": [stats["non_null"] for stats in self.columns.values()],
+            "Data Type": [stats["dtype"] for stats in self.columns.values()]
+        })
+
+    def save(self, path, source=None):
+        """
+        Saves the summary as JSON, to be loaded and updated with later batches.
+
+        Parameters:
+            path (str): The JSON file.
+            source (str, optional): The table summarized; its size and modification time are
+                                    saved so that `is_current` can tell if it changed since.
+                                    Defaults to None.
+        """
+        columns = {}
+        for col, stats in self.columns.items():
+            saved = {key: value for key, value in stats.items() if key != "sketch"}
+            saved["dtype"] = str(stats["dtype"])
+            if "sketch" in stats:
+                sketch = stats["sketch"]
+                saved["sketch"] = {"values": sketch.values.tolist(), "counts": sketch.counts.tolist(),
+                                   "exact": sketch.exact}
+            columns[col] = saved
+        state = {"percentiles": self.percentiles, "sketch_size": self.sketch_size,
+                 "rows": self.rows, "columns": columns,
+                 "source": _source_state(source) if source is not None else None}
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(state, f, default=float)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads a summary saved with `save`.
+
+        Parameters:
+            path (str): The JSON file.
+
+        Returns:
+            StreamingSummary: The summary.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No saved summary at '{path}'")
+        with open(path) as f:
+            state = json.load(f)
+        summary = cls(state["percentiles"], state["sketch_size"])
+        summary.rows = state["rows"]
+        summary.source = state["source"]
+        for col, stats in state["columns"].items():
+            stats["dtype"] = np.dtype(stats["dtype"])
+            if "sketch" in stats:
+                saved = stats["sketch"]
+                sketch = QuantileSketch(summary.sketch_size)
+                sketch.values = np.array(saved["values"], dtype=float)
+                sketch.counts = np.array(saved["counts"], dtype=np.int64)
+                sketch.exact = saved["exact"]
+                stats["sketch"] = sketch
+            summary.columns[col] = stats
+        return summary
+
+    def is_current(self, path):
+        """Whether the summary was saved for `path` and the file has not changed since."""
+        return self.source is not None and os.path.exists(path) and self.source == _source_state(path)
+
+
+def summarize_table(path, chunksize=DEFAULT_CHUNKSIZE, columns=None, **kwargs):
+    """
+    Summarizes a table read one chunk at a time.
+
+    Parameters:
+        path (str): Path to a .csv, .parquet or .arrow file.
+        chunksize (int, optional): Rows read at a time. Defaults to DEFAULT_CHUNKSIZE.
+        columns (list, optional): Columns to summarize. Defaults to None (all columns).
+        **kwargs: Passed to `StreamingSummary`.
+
+    Returns:
+        StreamingSummary: The summary of the whole table.
+
+    Example:
+        summarize_table("data/synthetic/wine_10m.parquet").describe()
+    """
+    summary = StreamingSummary(**kwargs)
+    for chunk in iter_table(path, chunksize, columns=columns):
+        summary.update(chunk)
+    return summary
+
+
+def _is_numeric(dtype):
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def _merge_dtypes(a, b):
+    """The dtype of a column whose chunks had dtypes `a` and `b`, as `pd.concat` gives."""
+    if a == b:
+        return a
+    if _is_numeric(a) and _is_numeric(b):
+        return np.result_type(a, b)
+    return np.dtype(object)
+
+
+def _source_state(path):
+    stat = os.stat(path)
+    return [os.path.abspath(path), stat.st_size, stat.st_mtime_ns]
@@ -0,0 +1,174 @@
+# synthetic.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr, ndtri
+from src.data_io import TableWriter, coerce_dtypes
+from src.validation import WINE_RULES
+
+# Rows generated at a time when writing synthetic data to disk
+DEFAULT_CHUNKSIZE = 1_000_000
+
+
+class WineSynthesizer:
+    """
+    Generates synthetic wine data with the distributions of the real data.
+
+    A Gaussian copula is fitted separately to each class (wine color): every
+    numeric column keeps the empirical distribution of that class, and the
+    columns are tied together by the correlation of their normal scores. New rows
+    are drawn from the correlated normal distribution and mapped back through
+    each column's empirical quantiles, so every value lies within the range seen
+    for its class, and integer columns such as quality stay integers. The classes
+    appear in the proportion of the real data unless `class_fractions` is given.
+    Real rows outside the valid ranges of `rules` are left out of the fit, so the
+    synthetic rows always pass `validate_wine`.
+
+    Parameters:
+        class_column (str, optional): The column holding the class. Defaults to "color".
+        rules (dict, optional): Column rules whose "range" bounds the fitted rows.
+                                Defaults to WINE_RULES.
+        class_fractions (dict, optional): Fraction of the rows of each class, e.g.
+                                          {"red": 0.25, "white": 0.75}. Defaults to None
+                                          (the fractions of the fitted data).
+        random_state (int, optional): Seed of the generated rows. Defaults to None.
+
+    Example:
+        synthesizer = WineSynthesizer(random_state=123).fit(pd.read_csv("data/raw/wine.csv"))
+        synthesizer.sample(1_000_000)
+    """
+    def __init__(self, class_column="color", rules=WINE_RULES, class_fractions=None,
+                 random_state=None):
+        self.class_column = class_column
+        self.rules = rules
+        self.class_fractions = class_fractions
+        self.random_state = random_state
+
+    def fit(self, wine):
+        """
+        Fits the marginal distributions and the correlation of every class.
+
+        Parameters:
+            wine (pd.DataFrame): The real wine data; rows with missing or out-of-range
+                                 values are ignored.
+
+        Returns:
+            WineSynthesizer: The fitted synthesizer.
+
+        Raises:
+            ValueError: If `class_fractions` names an unknown class or does not sum to 1.
+        """
+        wine = wine.dropna()
+        for col, rule in self.rules.items():
+            if "range" in rule and col in wine.columns:
+                wine = wine[wine[col].between(*rule["range"])]
+        self.columns_ = list(wine.columns)
+        self.dtypes_ = wine.dtypes
+        self.numeric_columns_ = [col for col in self.columns_ if col != self.class_column]
+        self.integer_columns_ = [self.numeric_columns_.index(col) for col in self.numeric_columns_
+                                 if pd.api.types.is_integer_dtype(wine[col])]
+
+        counts = wine[self.class_column].value_counts(sort=False)
+        if self.class_fractions is None:
+            self.class_fractions_ = (counts / counts.sum()).to_dict()
+        else:
+            unknown = set(self.class_fractions) - set(counts.index)
+            if unknown:
+                raise ValueError(f"Unknown classes in class_fractions: {sorted(unknown)}")
+            if not np.isclose(sum(self.class_fractions.values()), 1):
+                raise ValueError("class_fractions must sum to 1")
+            self.class_fractions_ = dict(self.class_fractions)
+
+        self.quantiles_, self.cholesky_ = {}, {}
+        for label, rows in wine.groupby(self.class_column, sort=False):
+            values = rows[self.numeric_columns_].to_numpy(dtype=float)
+            # Normal scores of the ranks; ties get their average rank
+            ranks = rows[self.numeric_columns_].rank().to_numpy()
+            scores = ndtri(ranks / (len(rows) + 1))
+            correlation = np.atleast_2d(np.corrcoef(scores, rowvar=False))
+            correlation = np.nan_to_num(correlation) + 1e-9 * np.eye(len(self.numeric_columns_))
+            self.quantiles_[label] = np.sort(values, axis=0)
+            self.cholesky_[label] = np.linalg.cholesky(correlation)
+        return self
+
+    def sample(self, n_rows, random_state=None):
+        """
+        Generates synthetic rows with the columns and dtypes of the fitted data.
+
+        Parameters:
+            n_rows (int): Number of rows.
+            random_state (int or np.random.Generator, optional): Seed or generator of the rows.
+                                                                 Defaults to `self.random_state`.
+
+        Returns:
+            pd.DataFrame: The rows, with the classes shuffled together.
+        """
+        rng = np.random.default_rng(self.random_state if random_state is None else random_state)
+        labels = list(self.class_fractions_)
+        counts = rng.multinomial(n_rows, [self.class_fractions_[label] for label in labels])
+
+        values = np.concatenate([self._sample_class(label, count, rng)
+                                 for label, count in zip(labels, counts)])
+        classes = np.repeat(np.array(labels, dtype=object), counts)
+        order = rng.permutation(n_rows)
+
+        synthetic = pd.DataFrame(values[order], columns=self.numeric_columns_)
+        synthetic[self.class_column] = classes[order]
+        synthetic = synthetic[self.columns_].astype(self.dtypes_.to_dict())
+        return coerce_dtypes(synthetic)
+
+    def iter_samples(self, n_rows, chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Generates synthetic rows in chunks, so that any number of rows fits in memory.
+
+        The same seed and chunk size always give the same rows.
+
+        Parameters:
+            n_rows (int): Total number of rows.
+            chunksize (int, optional): Maximum number of rows per chunk. Defaults to DEFAULT_CHUNKSIZE.
+
+        Yields:
+            pd.DataFrame: The next chunk of rows.
+        """
+        rng = np.random.default_rng(self.random_state)
+        for start in range(0, n_rows, chunksize):
+            yield self.sample(min(chunksize, n_rows - start), random_state=rng)
+
+    def write(self, path, n_rows, chunksize=DEFAULT_CHUNKSIZE, compression=None):
+        """
+        Writes synthetic rows to a .csv, .parquet or .arrow file one chunk at a time.
+
+        Parameters:
+            path (str): Destination file; the format is taken from the extension.
+            n_rows (int): Total number of rows.
+            chunksize (int, optional): Rows generated and written at a time. Defaults to DEFAULT_CHUNKSIZE.
+            compression (str, optional): Compression codec for columnar formats. Defaults to None.
+
+        Returns:
+            int: The number of rows written.
+
+        Example:
+            synthesizer.write("data/synthetic/wine_10m.parquet", 10_000_000, compression="zstd")
+        """
+        with TableWriter(path, compression=compression) as writer:
+            for chunk in self.iter_samples(n_rows, chunksize):
+                writer.write(chunk)
+        return writer.rows_written
+
+    def _sample_class(self, label, n_rows, rng):
+        """Draws rows of one class from its copula and maps them to its empirical quantiles."""
+        quantiles = self.quantiles_[label]
+        normal = rng.standard_normal((n_rows, quantiles.shape[1])) @ self.cholesky_[label].T
+        # Linear interpolation between the sorted values of each column
+        position = ndtr(normal) * (len(quantiles) - 1)
+        lower = np.clip(position.astype(int), 0, max(len(quantiles) - 2, 0))
+        upper = np.minimum(lower + 1, len(quantiles) - 1)
+        weight = position - lower
+        values = (np.take_along_axis(quantiles, lower, axis=0) * (1 - weight)
+                  + np.take_along_axis(quantiles, upper, axis=0) * weight)
+        # Rounding in the interpolation must not step outside the observed range
+        values = np.clip(values, quantiles[0], quantiles[-1])
+        values[:, self.integer_columns_] = np.round(values[:, self.integer_columns_])
+        return values
@@ -0,0 +1,264 @@
+# validation.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import numpy as np
+import pandas as pd
+from src.data_io import iter_table
+from src.instrumentation import instrumented, record_rows
+from src.row_hash import hash_rows, RowHashSet
+
+# Expected type and valid values of every wine column
+WINE_RULES = {
+    "fixed_acidity": {"dtype": "float", "range": (3.5, 16)},
+    "volatile_acidity": {"dtype": "float", "range": (0.08, 1.6)},
+    "citric_acid": {"dtype": "float", "range": (0.0, 1)},
+    "residual_sugar": {"dtype": "float", "range": (0.5, 66)},
+    "chlorides": {"dtype": "float", "range": (0.01, 0.7)},
+    "free_sulfur_dioxide": {"dtype": "float", "range": (0, 200)},
+    "total_sulfur_dioxide": {"dtype": "float", "range": (0, 400)},
+    "density": {"dtype": "float", "range": (0.985, 1.04)},
+    "pH": {"dtype": "float", "range": (2.5, 4.0)},
+    "sulphates": {"dtype": "float", "range": (0.2, 1.8)},
+    "alcohol": {"dtype": "float", "range": (8.0, 15.0)},
+    "quality": {"dtype": "int", "range": (3, 9)},
+    "color": {"dtype": "str", "categories": ["red", "white"]}
+}
+
+# Maximum fraction of missing values allowed in a column
+MAX_NULL_FRACTION = 0.05
+
+# Number of offending row positions kept per failed check
+N_EXAMPLES = 5
+
+_DTYPE_CHECKS = {
+    "float": pd.api.types.is_float_dtype,
+    "int": pd.api.types.is_integer_dtype,
+    "str": lambda dtype: pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+}
+
+
+@instrumented(rows_from="wine")
+def validate_wine(wine, rules=WINE_RULES, max_null_fraction=MAX_NULL_FRACTION):
+    """
+    Validates the wine data against all type, missingness, range, category,
+    empty-row and duplicate rules in one vectorized pass.
+
+    The null mask of the whole frame and the range checks of all numeric columns
+    are computed on 2-D NumPy arrays at once, instead of validating the frame
+    once per pandera schema.
+
+    Parameters:
+        wine (pd.DataFrame): The data to validate.
+        rules (dict, optional): Per-column rules with a "dtype" ("float", "int" or "str")
+                                and either a "range" (inclusive bounds) or "categories".
+                                Defaults to WINE_RULES.
+        max_null_fraction (float, optional): Maximum fraction of nulls per column.
+                                             Defaults to MAX_NULL_FRACTION.
+
+    Returns:
+        pd.DataFrame: One row per rule with the columns "check", "column", "failures"
+                      (number of failing values, rows or the null count), "passed" and
+                      "examples" (positions of up to N_EXAMPLES failing rows).
+
+    Example:
+        report = validate_wine(pd.read_csv("data/raw/wine.csv"))
+        report[~report["passed"]]
+    """
+    return ValidationState(rules, max_null_fraction).update(wine).report()
+
+
+@instrumented()
+def validate_wine_file(path, chunksize, rules=WINE_RULES, max_null_fraction=MAX_NULL_FRACTION):
+    """
+    Validates a wine data file chunk by chunk without loading it into memory.
+
+    Each chunk is checked as it is read, and the rules that depend on the whole
+    file (missingness fraction, duplicates across chunks, column types) are
+    accumulated in a `ValidationState`, so the report is the same as
+    `validate_wine(pd.read_csv(path))`.
+
+    Parameters:
+        path (str): Path to a .csv, .parquet or .arrow file.
+        chunksize (int): Number of rows validated at a time.
+        rules (dict, optional): Per-column rules. Defaults to WINE_RULES.
+        max_null_fraction (float, optional): Maximum fraction of nulls per column.
+                                             Defaults to MAX_NULL_FRACTION.
+
+    Returns:
+        pd.DataFrame: The validation report, as returned by `validate_wine`.
+
+    Example:
+        report = validate_wine_file("data/raw/wine.csv", chunksize=1_000_000)
+    """
+    state = ValidationState(rules, max_null_fraction)
+    n_rows = 0
+    for chunk in iter_table(path, chunksize):
+        state.update(chunk)
+        n_rows += len(chunk)
+    record_rows(n_rows)
+    return state.report()
+
+
+class ValidationState:
+    """
+    Mergeable state of a validation run.
+
+    Per-row rules (ranges, categories, empty rows) are evaluated on each chunk
+    and only their failure counts and first failing positions are kept. Rules
+    over the whole data keep compact running state: null counts per column, the
+    dtype a full read would infer and a `RowHashSet` of the rows seen so far
+    (8 bytes per distinct row) to find duplicates across chunks.
+
+    Parameters:
+        rules (dict, optional): Per-column rules. Defaults to WINE_RULES.
+        max_null_fraction (float, optional): Maximum fraction of nulls per column.
+                                             Defaults to MAX_NULL_FRACTION.
+
+    Example:
+        state = ValidationState()
+        for chunk in pd.read_csv("data/raw/wine.csv", chunksize=100_000):
+            state.update(chunk)
+        report = state.report()
+    """
+    def __init__(self, rules=WINE_RULES, max_null_fraction=MAX_NULL_FRACTION):
+        self.rules = rules
+        self.max_null_fraction = max_null_fraction
+        self.n_rows = 0
+        self.dtypes = {}
+        self.null_counts = {}
+        # (check, column) -> (number of failures, positions of the first failures)
+        self.failures = {}
+        self.seen = RowHashSet()
+
+    def update(self, chunk):
+        """
+        Validates the next chunk of rows and adds its results to the state.
+
+        Parameters:
+            chunk (pd.DataFrame): The rows following the ones already validated.
+
+        Returns:
+            ValidationState: The state itself, to allow chaining.
+        """
+        rules = self.rules
+        columns = [col for col in rules if col in chunk.columns]
+        n_rows = len(chunk)
+
+        for col in columns:
+            self.dtypes[col] = _merge_dtype(self.dtypes.get(col), chunk[col].dtype)
+
+        # Missingness and empty rows from one null mask of the chunk
+        null_mask = chunk.isna().to_numpy()
+        null_counts = null_mask.sum(axis=0)
+        for i, col in enumerate(chunk.columns):
+            if col in rules:
+                self.null_counts[col] = self.null_counts.get(col, 0) + int(null_counts[i])
+
+        empty_rows = null_mask.all(axis=1) if null_mask.shape[1] else np.zeros(n_rows, dtype=bool)
+        self._add_failures("empty_rows", None, empty_rows)
+
+        # Range checks of all numeric columns as one 2-D comparison; nulls fail
+        range_cols = [col for col in columns if "range" in rules[col]]
+        if range_cols:
+            values = np.column_stack([
+                pd.to_numeric(chunk[col], errors="coerce").to_numpy(dtype=float) for col in range_cols
+            ])
+            low = np.array([rules[col]["range"][0] for col in range_cols])
+            high = np.array([rules[col]["range"][1] for col in range_cols])
+            outside = ~((values >= low) & (values <= high))
+            for i, col in enumerate(range_cols):
+                self._add_failures("range", col, outside[:, i])
+
+        # Category checks; nulls fail
+        for col in columns:
+            if "categories" in rules[col]:
+                invalid = ~chunk[col].isin(rules[col]["categories"]).to_numpy()
+                self._add_failures("category", col, invalid)
+
+        # Duplicate rows from their content hashes, across all chunks so far
+        duplicated = ~self.seen.add_new(hash_rows(chunk))
+        self._add_failures("duplicates", None, duplicated)
+
+        self.n_rows += n_rows
+        return self
+
+    def merge(self, other):
+        """
+        Combines the state of another partition of the data into this one.
+
+        `other` is treated as the rows following the ones of this state. Counts
+        and pass/fail results are exact; rows of `other` that duplicate rows of
+        this state are counted but have no example positions.
+
+        Parameters:
+            other (ValidationState): State of the next partition, with the same rules.
+
+        Returns:
+            ValidationState: The state itself, to allow chaining.
+        """
+        for col, dtype in other.dtypes.items():
+            self.dtypes[col] = _merge_dtype(self.dtypes.get(col), dtype)
+        for col, count in other.null_counts.items():
+            self.null_counts[col] = self.null_counts.get(col, 0) + count
+        for key, (count, examples) in other.failures.items():
+            self._add_counts(key, count, [self.n_rows + i for i in examples])
+
+        other_hashes = other.seen.values()
+        cross_duplicates = self.seen.contains(other_hashes)
+        self._add_counts(("duplicates", None), int(cross_duplicates.sum()), [])
+        self.seen.add(other_hashes[~cross_duplicates])
+
+        self.n_rows += other.n_rows
+        return self
+
+    def report(self):
+        """
+        Builds the validation report from the accumulated state.
+
+        Returns:
+            pd.DataFrame: One row per rule, as returned by `validate_wine`.
+        """
+        columns = [col for col in self.rules if col in self.dtypes]
+        report = []
+
+        for col in columns:
+            passed = _DTYPE_CHECKS[self.rules[col]["dtype"]](self.dtypes[col])
+            report.append(("dtype", col, int(not passed), passed, []))
+
+        for col in self.null_counts:
+            fraction = self.null_counts[col] / self.n_rows if self.n_rows else 0.0
+            report.append(("missingness", col, self.null_counts[col],
+                           bool(fraction <= self.max_null_fraction), []))
+
+        keys = [("empty_rows", None)]
+        keys += [("range", col) for col in columns if "range" in self.rules[col]]
+        keys += [("category", col) for col in columns if "categories" in self.rules[col]]
+        keys += [("duplicates", None)]
+        for check, col in keys:
+            count, examples = self.failures.get((check, col), (0, []))
+            report.append((check, col, count, count == 0, examples))
+
+        return pd.DataFrame(report, columns=["check", "column", "failures", "passed", "examples"])
+
+    def _add_failures(self, check, column, failed):
+        """Adds a boolean mask of failing rows of the current chunk to the state."""
+        positions = self.n_rows + np.flatnonzero(failed)[:N_EXAMPLES]
+        self._add_counts((check, column), int(failed.sum()), positions.tolist())
+
+    def _add_counts(self, key, count, examples):
+        total, kept = self.failures.get(key, (0, []))
+        self.failures[key] = (total + count, (kept + examples)[:N_EXAMPLES])
+
+
+def _merge_dtype(current, dtype):
+    """
+    Combines the dtypes of one column across chunks into the dtype a single
+    read of the whole file would give: any non-numeric chunk makes the column
+    object, otherwise the NumPy result type (e.g. int and float give float).
+    """
+    if current is None:
+        return dtype
+    if pd.api.types.is_numeric_dtype(current) and pd.api.types.is_numeric_dtype(dtype):
+        return np.result_type(current, dtype)
+    return np.dtype(object)
@@ -0,0 +1,88 @@
+# test_adaptive_search.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import loguniform
+from sklearn.compose import make_column_transformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import make_scorer, f1_score
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import OrdinalEncoder, StandardScaler
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.adaptive_search import BayesianSearchCV, SuccessiveHalvingSearchCV
+
+# Create data to test
+rng = np.random.default_rng(3)
+X_data = pd.DataFrame({
+    'fixed_acidity': rng.normal(7.5, 1.0, 400),
+    'alcohol': rng.normal(10.5, 1.0, 400),
+    'quality': rng.integers(4, 8, 400)
+})
+y_data = pd.Series(np.where(X_data['fixed_acidity'] + rng.normal(0, 0.8, 400) > 7.5, 'red', 'white'))
+
+pipeline = make_pipeline(
+    make_column_transformer(
+        (OrdinalEncoder(dtype=int), ['quality']),
+        (StandardScaler(), ['fixed_acidity', 'alcohol'])
+    ),
+    LogisticRegression(max_iter=1000, class_weight="balanced")
+)
+param_grid = {"logisticregression__C": loguniform(1e-3, 10)}
+scoring = make_scorer(f1_score, pos_label="red")
+table_columns = ["mean_train_score", "mean_test_score", "param_logisticregression__C",
+                 "mean_fit_time", "rank_test_score"]
+
+
+def test_halving_rounds():
+    """
+    Tests that each round keeps a third of the candidates on three times more rows,
+    and that the best candidate comes from the last round on all rows.
+    """
+    search = SuccessiveHalvingSearchCV(pipeline, param_grid, n_candidates=9, scoring=scoring,
+                                       random_state=0, return_train_score=True).fit(X_data, y_data)
+    assert search.n_candidates_ == [9, 3, 1]
+    assert search.n_resources_[-1] == 320
+    assert search.n_resources_[1] == 3 * search.n_resources_[0]
+    results = pd.DataFrame(search.cv_results_)
+    best = results.loc[search.best_index_]
+    assert best["iter"] == 2 and best["rank_test_score"] == 1
+    # Survivors are the best candidates of the previous round
+    first = results[results["iter"] == 0].nlargest(3, "mean_test_score")["params"].tolist()
+    assert sorted(map(str, first)) == sorted(map(str, results[results["iter"] == 1]["params"]))
+    assert results[table_columns].set_index("rank_test_score").sort_index().T.shape == (4, 13)
+
+
+def test_halving_time_budget():
+    """
+    Tests that no round is started once the time budget is spent.
+    """
+    search = SuccessiveHalvingSearchCV(pipeline, param_grid, n_candidates=9, scoring=scoring,
+                                       time_budget=0, random_state=0).fit(X_data, y_data)
+    assert search.n_candidates_ == [9]
+    assert search.best_params_ in search.cv_results_["params"]
+
+
+def test_bayesian_search():
+    """
+    Tests that the Bayesian search evaluates up to n_iter candidates within the distribution
+    and finds a candidate at least as good as its random start.
+    """
+    search = BayesianSearchCV(pipeline, param_grid, n_iter=8, n_initial=3, scoring=scoring,
+                              random_state=0, return_train_score=True).fit(X_data, y_data)
+    values = np.array([params["logisticregression__C"] for params in search.cv_results_["params"]])
+    assert len(values) == 8
+    assert np.all((values >= 1e-3) & (values <= 10))
+    assert search.best_score_ >= search.cv_results_["mean_test_score"][:3].max()
+    assert pd.DataFrame(search.cv_results_)[table_columns].shape == (8, 5)
+
+    budgeted = BayesianSearchCV(pipeline, param_grid, n_iter=8, scoring=scoring, time_budget=0,
+                                random_state=0).fit(X_data, y_data)
+    assert len(budgeted.cv_results_["params"]) == 1
+
+    with pytest.raises(ValueError):
+        BayesianSearchCV(pipeline, {"logisticregression__C": "large"}).fit(X_data, y_data)
@@ -0,0 +1,47 @@
+# test_benchmarking.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.benchmarking import compare_to_baseline, read_results, run_isolated, write_results
+
+def setup_allocation(n_values):
+    """Returns the arguments of `allocate` and the number of rows it processes."""
+    return (n_values,), n_values
+
+
+def allocate(n_values):
+    """Allocates and fills an array of n_values floats."""
+    np.ones(n_values).sum()
+
+
+def test_run_isolated_measures_stage():
+    """
+    Tests that a stage run in its own process reports time, throughput and its peak memory.
+    """
+    result = run_isolated(setup_allocation, allocate, 20_000_000)
+    assert result["rows"] == 20_000_000
+    assert result["seconds"] > 0
+    assert result["rows_per_second"] > 0
+    # The 160 MB array raises the peak above the memory in use before the stage
+    assert result["peak_rss_mb"] - result["startup_rss_mb"] > 100
+
+
+def test_compare_to_baseline(tmp_path):
+    """
+    Tests that slower or larger runs of the same stage and size are flagged.
+    """
+    baseline = [{"stage": "split", "dataset_rows": 6497, "seconds": 1.0, "peak_rss_mb": 200.0},
+                {"stage": "search", "dataset_rows": 6497, "seconds": 2.0, "peak_rss_mb": 300.0}]
+    write_results(tmp_path / "baseline.json", baseline)
+    current = [{"stage": "split", "dataset_rows": 6497, "seconds": 1.5, "peak_rss_mb": 210.0},
+               {"stage": "search", "dataset_rows": 6497, "seconds": 1.0, "peak_rss_mb": 300.0},
+               {"stage": "search", "dataset_rows": 65000, "seconds": 9.0, "peak_rss_mb": 400.0}]
+
+    comparison = compare_to_baseline(current, read_results(tmp_path / "baseline.json"), tolerance=0.25)
+    assert len(comparison) == 4
+    regressions = comparison[comparison["regression"]]
+    assert regressions[["stage", "metric"]].values.tolist() == [["split", "seconds"]]
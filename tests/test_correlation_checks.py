@@ -0,0 +1,109 @@
+# test_correlation_checks.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import f1_score
+from sklearn.model_selection import StratifiedKFold, cross_val_score
+from sklearn.tree import DecisionTreeClassifier
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.correlation_checks import feature_feature_check, feature_label_check, pps_scores, spearman_matrix
+from src.parallel import executor
+
+# Create data to test
+rng = np.random.default_rng(2)
+n_red, n_white = 400, 1200
+color = np.array(['red'] * n_red + ['white'] * n_white)
+X = pd.DataFrame({
+    'chlorides': np.concatenate([rng.normal(0.09, 0.02, n_red), rng.normal(0.045, 0.015, n_white)]),
+    'alcohol': rng.normal(10.5, 1.2, n_red + n_white),
+    'quality': rng.integers(3, 9, n_red + n_white)
+})
+X['density'] = 1.0 - 0.001 * X['alcohol'] + rng.normal(0, 0.0002, n_red + n_white)
+y = pd.Series(color, name='color')
+
+
+def test_spearman_matrix_matches_pandas():
+    """
+    Tests that the rank correlation matches pandas, ties and missing values included.
+    """
+    data = X.copy()
+    data.loc[::7, 'alcohol'] = np.nan
+    expected = data.corr(method='spearman')
+    pd.testing.assert_frame_equal(spearman_matrix(data), expected, atol=1e-12)
+
+
+def test_feature_feature_check():
+    """
+    Tests that strongly correlated pairs fail the check, whatever the sign of their correlation.
+    """
+    passed, pairs = feature_feature_check(X)
+    assert not passed
+    assert pairs[['feature_1', 'feature_2']].values.tolist() == [['alcohol', 'density']]
+    assert pairs['correlation'].iloc[0] < -0.8
+
+    passed, pairs = feature_feature_check(X.drop(columns=['density']))
+    assert passed
+    assert pairs.empty
+    assert feature_feature_check(X, n_pairs=1)[0]
+
+
+def test_pps_scores_match_reference():
+    """
+    Tests that the scores are the normalized cross-validated F1 of a tree on each feature.
+    """
+    scores = pps_scores(X, y, cv=4, random_state=0).set_index('feature')
+    codes = pd.factorize(y)[0]
+    baseline = f1_score(codes, np.full(len(codes), np.bincount(codes).argmax()), average='weighted')
+    folds = StratifiedKFold(4, shuffle=True, random_state=0)
+    for feature in X.columns:
+        f1 = cross_val_score(DecisionTreeClassifier(random_state=0), X[[feature]], codes,
+                             cv=folds, scoring='f1_weighted').mean()
+        expected = max((f1 - baseline) / (1 - baseline), 0)
+        assert scores.loc[feature, 'pps'] == pytest.approx(expected)
+        assert scores.loc[feature, 'pps_low'] <= scores.loc[feature, 'pps'] <= scores.loc[feature, 'pps_high']
+    assert scores['pps'].idxmax() == 'chlorides'
+    assert scores.loc['quality', 'pps'] < 0.1
+
+
+def test_pps_scores_same_on_every_executor():
+    """
+    Tests that scoring the features in worker processes gives the same result as serially.
+    """
+    with executor('serial'):
+        serial = pps_scores(X, y)
+    with executor('process', n_jobs=2):
+        parallel = pps_scores(X, y)
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_pps_scores_sample():
+    """
+    Tests that a stratified sample gives scores close to the full data, with wider bounds.
+    """
+    full = pps_scores(X, y).set_index('feature')
+    sampled = pps_scores(X, y, sample_size=400).set_index('feature')
+    assert (sampled['pps_std_error'].mean() > full['pps_std_error'].mean())
+    assert (sampled['pps'] - full['pps']).abs().max() < 0.15
+    # The baseline F1 only depends on the class proportions, which the sample keeps
+    assert sampled['baseline_f1'].iloc[0] == pytest.approx(full['baseline_f1'].iloc[0], abs=1e-3)
+
+
+def test_feature_label_check():
+    """
+    Tests that a feature predicting the label too well fails the check.
+    """
+    passed, scores = feature_label_check(X, y)
+    assert passed
+    assert list(scores.columns) == ['feature', 'pps', 'pps_std_error', 'pps_low', 'pps_high',
+                                    'model_f1', 'baseline_f1']
+
+    leaky = X.assign(is_red=(y == 'red').astype(int))
+    passed, scores = feature_label_check(leaky, y)
+    assert not passed
+    assert scores['feature'].iloc[0] == 'is_red'
+    assert scores['pps'].iloc[0] == pytest.approx(1.0)
@@ -0,0 +1,95 @@
+# test_data_io.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import pandas as pd
+import pytest
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.data_io import table_format, write_table, read_table, find_table, preload_table
+
+# Create data to test
+sample_df = pd.DataFrame({
+    'fixed_acidity': [7.4, 7.8, 7.4],
+    'alcohol': [9.4, 9.8, 9.8],
+    'quality': [5, 5, 6],
+    'color': ['red', 'red', 'white']
+})
+
+
+@pytest.mark.parametrize("file_name", ["wine.csv", "wine.parquet", "wine.arrow"])
+def test_round_trip(tmp_path, file_name):
+    """
+    Tests that a table written in each format is read back unchanged.
+    """
+    path = tmp_path / file_name
+    write_table(sample_df, path)
+    pd.testing.assert_frame_equal(read_table(path), sample_df)
+
+
+@pytest.mark.parametrize("file_name", ["wine.csv", "wine.parquet", "wine.arrow"])
+def test_column_projection(tmp_path, file_name):
+    """
+    Tests that only the requested columns are returned, in the requested order.
+    """
+    path = tmp_path / file_name
+    write_table(sample_df, path)
+    projected = read_table(path, columns=["color", "alcohol"])
+    assert list(projected.columns) == ["color", "alcohol"], "Projected columns are wrong."
+
+
+def test_typed_schema(tmp_path):
+    """
+    Tests that columnar outputs are written with the wine schema dtypes.
+    """
+    path = tmp_path / "wine.parquet"
+    write_table(sample_df.astype({'quality': 'int32'}), path, compression="zstd")
+    assert read_table(path)['quality'].dtype == 'int64', "Quality was not stored as int64."
+
+
+def test_unsupported_format():
+    """
+    Tests that an unknown extension raises a ValueError.
+    """
+    with pytest.raises(ValueError, match="Unsupported table format"):
+        table_format("wine.xlsx")
+
+
+def test_find_table(tmp_path):
+    """
+    Tests that a csv path resolves to the columnar file written with the same stem.
+    """
+    write_table(sample_df, tmp_path / "wine_train.parquet")
+    assert find_table(str(tmp_path / "wine_train.csv")) == str(tmp_path / "wine_train.parquet")
+    with pytest.raises(FileNotFoundError):
+        find_table(str(tmp_path / "wine_test.csv"))
+
+
+def test_find_table_prefers_newest(tmp_path):
+    """
+    Tests that a stale table in another format is not returned over the newest one.
+    """
+    csv_path, parquet_path = str(tmp_path / "wine_train.csv"), str(tmp_path / "wine_train.parquet")
+    write_table(sample_df, csv_path)
+    write_table(sample_df, parquet_path)
+    os.utime(csv_path, ns=(1_000_000_000, 1_000_000_000))
+    assert find_table(csv_path) == parquet_path
+    os.utime(parquet_path, ns=(500_000_000, 500_000_000))
+    assert find_table(csv_path) == csv_path
+
+
+def test_preload_table(tmp_path):
+    """
+    Tests that a preloaded table is served from memory until the file changes.
+    """
+    path = tmp_path / "wine.csv"
+    write_table(sample_df, path)
+    preload_table(path)
+    table = read_table(path)
+    table.loc[0, "alcohol"] = 0.0
+    pd.testing.assert_frame_equal(read_table(path), sample_df)
+    pd.testing.assert_frame_equal(read_table(path, columns=["color"]), sample_df[["color"]])
+
+    write_table(sample_df.head(2), path)
+    assert len(read_table(path)) == 2
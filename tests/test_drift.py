@@ -0,0 +1,143 @@
+# test_drift.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.spatial.distance import jensenshannon
+from scipy.stats import ks_2samp
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import src.drift
+from src.drift import DriftMonitor, class_proportion_deviations
+
+# Create data to test
+rng = np.random.default_rng(4)
+reference_proba = rng.beta(2, 5, 4000)
+reference_pred = np.where(reference_proba > 0.5, 'red', 'white')
+same_proba = rng.beta(2, 5, 2000)
+shifted_proba = rng.beta(4, 4, 2000)
+
+
+def predictions(proba):
+    return np.where(proba > 0.5, 'red', 'white')
+
+
+def test_scores_match_reference_implementations():
+    """
+    Tests KS against scipy (ties included), JS against scipy and PSI against its definition.
+    """
+    monitor = DriftMonitor(reference_proba, reference_pred)
+    tied = np.round(shifted_proba, 2)
+    for proba in [same_proba, shifted_proba, tied]:
+        scores = monitor.score(proba, predictions(proba))
+        assert scores['ks'] == pytest.approx(ks_2samp(reference_proba, proba).statistic, abs=1e-12)
+
+        bins = np.searchsorted(monitor.edges, proba, side='right')
+        actual = np.bincount(bins, minlength=len(monitor.bin_proportions)) / len(proba)
+        assert scores['js'] == pytest.approx(jensenshannon(monitor.bin_proportions, actual, base=2) ** 2)
+        expected = np.maximum(monitor.bin_proportions, 1e-4)
+        actual = np.maximum(actual, 1e-4)
+        assert scores['psi'] == pytest.approx(((actual - expected) * np.log(actual / expected)).sum())
+        assert scores['red_proportion'] == pytest.approx((proba > 0.5).mean())
+
+
+def test_scores_detect_shift():
+    """
+    Tests that a shifted distribution scores higher than a sample of the reference distribution.
+    """
+    monitor = DriftMonitor(reference_proba, reference_pred)
+    same = monitor.score(same_proba, predictions(same_proba))
+    shifted = monitor.score(shifted_proba, predictions(shifted_proba))
+    for key in ['ks', 'psi', 'js', 'class_psi']:
+        assert shifted[key] > same[key]
+    assert same['psi'] < 0.1 < shifted['psi']
+    # The reference decile bins hold a tenth of the reference each
+    np.testing.assert_allclose(monitor.bin_proportions, 0.1, atol=1e-3)
+
+
+@pytest.mark.parametrize("window, step", [(500, 500), (500, 125)])
+def test_windows_match_scores(window, step):
+    """
+    Tests that tumbling and sliding windows over a chunked stream score like each window alone.
+    """
+    stream = np.concatenate([same_proba, shifted_proba])
+    monitor = DriftMonitor(reference_proba, reference_pred, window=window, step=step)
+    for chunk in np.array_split(stream, 7):
+        monitor.update(chunk, predictions(chunk))
+    results = monitor.results()
+
+    assert results['start'].tolist() == list(range(0, len(stream) - window + 1, step))
+    assert results['window'].tolist() == list(range(len(results)))
+    assert (results['end'] - results['start'] == window).all()
+    assert (results['Prediction Drift Score'] == results['ks']).all()
+    single = DriftMonitor(reference_proba, reference_pred)
+    for i in range(0, len(results), 3):
+        start, end = results.loc[i, 'start'], results.loc[i, 'end']
+        expected = single.score(stream[start:end], predictions(stream[start:end]))
+        for key in ['ks', 'psi', 'js', 'class_psi', 'red_proportion']:
+            assert results.loc[i, key] == pytest.approx(expected[key])
+    # Windows over the shifted half drift more than windows over the first half
+    first = results[results['end'] <= len(same_proba)]
+    second = results[results['start'] >= len(same_proba)]
+    assert first['ks'].max() < second['ks'].min()
+
+
+def test_sliding_windows_in_batches(monkeypatch):
+    """
+    Tests that scoring the windows of a chunk in several batches gives the same results.
+    """
+    stream = np.concatenate([same_proba, shifted_proba])
+    results = {}
+    for max_values in [10 ** 9, 1200]:
+        monkeypatch.setattr(src.drift, "MAX_WINDOW_VALUES", max_values)
+        monitor = DriftMonitor(reference_proba, reference_pred, window=500, step=7)
+        for chunk in np.array_split(stream, 3):
+            monitor.update(chunk, predictions(chunk))
+        results[max_values] = monitor.results()
+    pd.testing.assert_frame_equal(results[10 ** 9], results[1200])
+    assert len(results[1200]) == len(range(0, len(stream) - 500 + 1, 7))
+
+
+def test_unknown_class_and_invalid_settings():
+    """
+    Tests that classes unseen in the reference do not count and that invalid settings raise.
+    """
+    monitor = DriftMonitor(reference_proba, reference_pred)
+    scores = monitor.score(same_proba[:4], ['red', 'white', 'rose', 'white'])
+    assert scores['red_proportion'] == 0.25
+    assert scores['white_proportion'] == 0.5
+
+    with pytest.raises(ValueError):
+        DriftMonitor(reference_proba, reference_pred, method='emd')
+    with pytest.raises(ValueError):
+        DriftMonitor(reference_proba, reference_pred, window=10, step=20)
+    with pytest.raises(ValueError):
+        monitor.update(same_proba, predictions(same_proba))
+
+
+def test_save_load(tmp_path):
+    """
+    Tests that a saved reference loads as a monitor giving the same scores.
+    """
+    monitor = DriftMonitor(reference_proba, reference_pred)
+    monitor.save(tmp_path / "drift_reference.npz")
+    loaded = DriftMonitor.load(tmp_path / "drift_reference.npz", window=1000)
+    assert loaded.score(shifted_proba, predictions(shifted_proba)) == pytest.approx(
+        monitor.score(shifted_proba, predictions(shifted_proba)))
+    assert loaded.results().empty
+    assert 'Prediction Drift Score' in loaded.results().columns
+    with pytest.raises(FileNotFoundError):
+        DriftMonitor.load(tmp_path / "missing.npz")
+
+
+def test_class_proportion_deviations():
+    """
+    Tests that only the classes further than the tolerance from their expected proportion are reported.
+    """
+    labels = pd.Series(['red'] * 10 + ['white'] * 90)
+    deviations = class_proportion_deviations(labels, {'red': 0.25, 'white': 0.75})
+    assert deviations.to_dict() == pytest.approx({'red': 0.1, 'white': 0.9})
+    assert class_proportion_deviations(labels, {'red': 0.15, 'white': 0.85}).empty
@@ -0,0 +1,91 @@
+# test_eda.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import gaussian_kde
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.eda import binned_densities, correlation_matrix, correlation_table
+
+# Create data to test
+rng = np.random.default_rng(1)
+n_red, n_white = 300, 900
+wine = pd.DataFrame({
+    'alcohol': np.concatenate([rng.normal(10.5, 1.0, n_red), rng.normal(11.5, 1.2, n_white)]),
+    'pH': np.concatenate([rng.normal(3.3, 0.15, n_red), rng.normal(3.2, 0.15, n_white)]),
+    'quality': rng.integers(3, 9, n_red + n_white),
+    'color': ['red'] * n_red + ['white'] * n_white
+})
+wine['density'] = 1.0 - 0.001 * wine['alcohol'] + rng.normal(0, 0.0005, n_red + n_white)
+
+
+def test_binned_densities_layout():
+    """
+    Tests that there is one density curve per feature and class on the requested grid.
+    """
+    densities = binned_densities(wine, bins=50)
+    assert list(densities.columns) == ['feature', 'color', 'value', 'density']
+    assert len(densities) == 4 * 2 * 50
+    curves = densities.groupby(['feature', 'color'])
+    assert (curves.size() == 50).all()
+    alcohol = densities[densities['feature'] == 'alcohol']
+    assert alcohol['value'].min() == pytest.approx(wine['alcohol'].min())
+    assert alcohol['value'].max() == pytest.approx(wine['alcohol'].max())
+
+
+def test_binned_densities_match_kernel_density():
+    """
+    Tests that the densities integrate to about 1 and are close to an exact Gaussian KDE.
+    """
+    densities = binned_densities(wine, bins=200)
+    # Quality has much of its mass at the ends of its range, where the curves are cut off
+    continuous = densities[densities['feature'] != 'quality']
+    for (feature, color), curve in continuous.groupby(['feature', 'color']):
+        assert np.trapz(curve['density'], curve['value']) == pytest.approx(1, abs=0.05)
+    red = densities[(densities['feature'] == 'alcohol') & (densities['color'] == 'red')]
+    exact = gaussian_kde(wine.loc[wine['color'] == 'red', 'alcohol'])(red['value'])
+    np.testing.assert_allclose(red['density'], exact, atol=0.02)
+
+
+def test_binned_densities_ignore_missing_values():
+    """
+    Tests that missing values and rows without a class are left out of the counts.
+    """
+    with_missing = wine.copy()
+    with_missing.loc[::10, 'pH'] = np.nan
+    with_missing.loc[5, 'color'] = None
+    densities = binned_densities(with_missing, bandwidth=0)
+    assert not densities['density'].isna().any()
+    histogram = densities[(densities['feature'] == 'pH') & (densities['color'] == 'white')]
+    step = histogram['value'].diff().iloc[1]
+    assert (histogram['density'] * step).sum() == pytest.approx(1)
+
+
+def test_correlation_matrix_matches_pandas():
+    """
+    Tests that the correlations equal those of pandas, with and without missing values.
+    """
+    features = wine.drop(columns=['color'])
+    pd.testing.assert_frame_equal(correlation_matrix(wine), features.corr())
+    features.loc[::7, 'alcohol'] = np.nan
+    features.loc[::5, 'quality'] = np.nan
+    pd.testing.assert_frame_equal(correlation_matrix(features), features.corr())
+
+
+def test_correlation_table_matches_matrix():
+    """
+    Tests that the plotted table holds every value of the correlation matrix, missing ones included.
+    """
+    features = wine.drop(columns=['color'])
+    features['constant'] = 1.0
+    correlation = correlation_matrix(features)
+    table = correlation_table(correlation)
+    assert list(table.columns) == ['feature_1', 'feature_2', 'correlation']
+    assert len(table) == correlation.size
+    pivoted = table.pivot(index='feature_1', columns='feature_2', values='correlation')
+    pd.testing.assert_frame_equal(pivoted.loc[correlation.index, correlation.columns], correlation,
+                                  check_names=False)
@@ -0,0 +1,90 @@
+# test_fast_predictor.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import make_column_transformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import OrdinalEncoder, StandardScaler
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.fast_predictor import FastPredictor, export_fast_predictor, verify_fast_predictor
+
+# Create data to test
+X_data = pd.DataFrame({
+    'fixed_acidity': [7.4, 7.8, 6.3, 6.6, 8.1, 6.0, 7.1, 6.9],
+    'alcohol': [9.4, 9.8, 11.0, 12.2, 10.1, 11.5, 9.6, 12.0],
+    'pH': [3.51, 3.20, 3.1, 3.0, 3.4, 3.2, 3.3, 3.05],
+    'quality': [5, 5, 6, 7, 5, 6, 4, 7]
+})
+y_data = pd.Series(['red', 'red', 'white', 'white', 'red', 'white', 'red', 'white'])
+
+# Create a fitted pipeline shaped like the one built in scripts/preprocessing.py
+pipeline = make_pipeline(
+    make_column_transformer(
+        (OrdinalEncoder(dtype=int), ['quality']),
+        (StandardScaler(), ['fixed_acidity', 'alcohol']),
+        remainder='passthrough'
+    ),
+    LogisticRegression(max_iter=1000, class_weight="balanced")
+).fit(X_data, y_data)
+
+
+def test_matches_pipeline():
+    """
+    Tests that the exported predictor reproduces the pipeline's probabilities and labels.
+    """
+    fast = export_fast_predictor(pipeline)
+
+    assert verify_fast_predictor(fast, pipeline, X_data) <= 1e-9
+    assert (fast.predict(X_data) == pipeline.predict(X_data)).all()
+    raw = X_data[list(fast.feature_names)].to_numpy()
+    np.testing.assert_allclose(fast.predict_proba(raw), pipeline.predict_proba(X_data), atol=1e-12)
+
+
+def test_unknown_category():
+    """
+    Tests that an unseen ordinal category raises like the OrdinalEncoder does.
+    """
+    fast = export_fast_predictor(pipeline)
+    with pytest.raises(ValueError, match="unknown categories"):
+        fast.predict(X_data.assign(quality=10))
+
+
+def test_non_finite_values():
+    """
+    Tests that missing or infinite values raise instead of predicting the first class.
+    """
+    fast = export_fast_predictor(pipeline)
+    bad = X_data.astype({'quality': float})
+    bad.loc[0, 'alcohol'] = np.nan
+    bad.loc[1, 'pH'] = np.inf
+    bad.loc[2, 'quality'] = np.nan
+    with pytest.raises(ValueError, match="'alcohol'") as error:
+        fast.predict(bad)
+    assert "'pH'" in str(error.value) and "'quality'" in str(error.value)
+    assert "'fixed_acidity'" not in str(error.value)
+    with pytest.raises(ValueError, match="infinite"):
+        fast.predict_proba(bad.to_numpy()[1])
+
+
+def test_save_and_load(tmp_path):
+    """
+    Tests that a saved predictor loads back with the same predictions.
+    """
+    fast = export_fast_predictor(pipeline)
+    fast.save(tmp_path / "wine_model.artifact")
+    loaded = FastPredictor.load(tmp_path / "wine_model.artifact")
+    np.testing.assert_array_equal(loaded.predict_proba(X_data), fast.predict_proba(X_data))
+
+
+def test_rejects_other_models():
+    """
+    Tests that pipelines that cannot be folded into an affine model are rejected.
+    """
+    with pytest.raises(ValueError):
+        export_fast_predictor(make_pipeline(StandardScaler(), LogisticRegression()).fit(X_data, y_data))
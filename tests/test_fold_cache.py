@@ -0,0 +1,104 @@
+# test_fold_cache.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import loguniform
+from sklearn.compose import make_column_transformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import make_scorer, f1_score, precision_score, recall_score
+from sklearn.model_selection import RandomizedSearchCV
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import OrdinalEncoder, StandardScaler
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.fold_cache import CachedRandomizedSearchCV, FoldCache
+
+# Create data to test
+rng = np.random.default_rng(1)
+X_data = pd.DataFrame({
+    'fixed_acidity': rng.normal(7.5, 1.0, 200),
+    'alcohol': rng.normal(10.5, 1.0, 200),
+    'quality': rng.integers(4, 8, 200)
+})
+y_data = pd.Series(np.where(X_data['fixed_acidity'] + rng.normal(0, 0.8, 200) > 7.5, 'red', 'white'))
+
+pipeline = make_pipeline(
+    make_column_transformer(
+        (OrdinalEncoder(dtype=int), ['quality']),
+        (StandardScaler(), ['fixed_acidity', 'alcohol'])
+    ),
+    LogisticRegression(max_iter=1000, class_weight="balanced")
+)
+param_grid = {"logisticregression__C": loguniform(1e-2, 10)}
+scoring = make_scorer(f1_score, pos_label="red")
+
+
+def test_fold_cache_preprocesses_each_fold():
+    """
+    Tests that every fold holds the preprocessed matrices of its own train and test rows.
+    """
+    folds = FoldCache(pipeline[:-1], cv=4).fit(X_data, y_data).folds_
+    assert len(folds) == 4
+    assert sum(len(fold["y_test"]) for fold in folds) == len(X_data)
+    for fold in folds:
+        assert fold["X_train"].shape == (len(fold["y_train"]), 3)
+        assert fold["X_train"].dtype == np.float64
+        # The scaler was fitted on the fold's training rows only
+        np.testing.assert_allclose(fold["X_train"][:, 1:].mean(axis=0), 0, atol=1e-9)
+
+
+def test_matches_randomized_search():
+    """
+    Tests that caching the folds gives the same candidates, scores and best model.
+    """
+    kwargs = dict(n_iter=5, random_state=42, scoring=scoring, return_train_score=True)
+    expected = RandomizedSearchCV(pipeline, param_grid, **kwargs).fit(X_data, y_data)
+    cached = CachedRandomizedSearchCV(pipeline, param_grid, **kwargs).fit(X_data, y_data)
+
+    assert cached.best_params_ == expected.best_params_
+    for key in ["mean_test_score", "mean_train_score", "split0_test_score", "rank_test_score"]:
+        np.testing.assert_allclose(cached.cv_results_[key], expected.cv_results_[key], atol=1e-9)
+    np.testing.assert_allclose(cached.predict_proba(X_data), expected.predict_proba(X_data))
+
+
+def test_rejects_preprocessing_parameters():
+    """
+    Tests that candidates changing the preprocessing cannot use the cached folds.
+    """
+    search = CachedRandomizedSearchCV(
+        pipeline, {"columntransformer__standardscaler__with_mean": [True, False]}, n_iter=2
+    )
+    with pytest.raises(ValueError):
+        search.fit(X_data, y_data)
+
+
+def test_multimetric_matches_randomized_search():
+    """
+    Tests that several metrics are collected in one search, with the best candidate picked by `refit`.
+    """
+    metrics = {
+        "accuracy": "accuracy",
+        "precision": make_scorer(precision_score, pos_label="red"),
+        "recall": make_scorer(recall_score, pos_label="red"),
+        "f1": scoring
+    }
+    kwargs = dict(n_iter=5, random_state=42, scoring=metrics, refit="f1")
+    expected = RandomizedSearchCV(pipeline, param_grid, **kwargs).fit(X_data, y_data)
+    cached = CachedRandomizedSearchCV(pipeline, param_grid, **kwargs).fit(X_data, y_data)
+
+    assert cached.multimetric_
+    assert cached.best_index_ == expected.best_index_
+    assert cached.best_score_ == pytest.approx(expected.best_score_)
+    for metric in metrics:
+        np.testing.assert_allclose(cached.cv_results_[f"mean_test_{metric}"],
+                                   expected.cv_results_[f"mean_test_{metric}"], atol=1e-9)
+        np.testing.assert_array_equal(cached.cv_results_[f"rank_test_{metric}"],
+                                      expected.cv_results_[f"rank_test_{metric}"])
+    assert cached.score(X_data, y_data) == pytest.approx(expected.score(X_data, y_data))
+
+    with pytest.raises(ValueError):
+        CachedRandomizedSearchCV(pipeline, param_grid, n_iter=2, scoring=metrics).fit(X_data, y_data)
@@ -0,0 +1,132 @@
+# test_instrumentation.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import json
+import os
+import time
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.instrumentation import PERF_LOG, PERF_SUMMARY, PROFILE_DIR, instrumented, record_rows, span, stage
+from src.stage_cache import REPO_ROOT
+
+# Create data to test
+wine = pd.DataFrame({
+    'alcohol': [9.4, 9.8, 12.2, 10.1],
+    'color': ['red', 'red', 'white', 'white']
+})
+
+
+@instrumented(rows_from="df")
+def allocate(df, n_values):
+    """Allocates an array of n_values floats per call."""
+    time.sleep(0.02)
+    return np.ones(n_values).sum()
+
+
+@instrumented()
+def count(df):
+    """Records the rows it counts itself."""
+    record_rows(len(df) * 2)
+
+
+def read_log(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_stage_records_nested_spans(tmp_path):
+    """
+    Tests that the spans of a stage are logged with their time, rows and peak memory.
+    """
+    log, summary = tmp_path / "perf.jsonl", tmp_path / "perf.csv"
+    with stage("eda", log_path=str(log), summary_path=str(summary), profile=""):
+        with span("read") as step:
+            step.rows = len(wine)
+            allocate(wine, 25_000_000)
+        count(wine)
+
+    records = {record["span"]: record for record in read_log(log)}
+    assert set(records) == {"eda", "eda/read", "eda/read/allocate", "eda/count"}
+    assert records["eda/read/allocate"]["depth"] == 2
+    assert records["eda/read"]["rows"] == 4
+    assert records["eda/count"]["rows"] == 8
+    assert records["eda/read/allocate"]["seconds"] >= 0.02
+    assert records["eda"]["seconds"] >= records["eda/read"]["seconds"]
+    # The 200 MB array is caught by the memory sampler
+    allocation = records["eda/read/allocate"]
+    assert allocation["peak_rss_mb"] - allocation["rss_start_mb"] > 150
+
+    table = pd.read_csv(summary)
+    assert table["span"].tolist() == ["eda", "eda/read", "eda/read/allocate", "eda/count"]
+    assert (table["calls"] == 1).all()
+
+
+def test_summary_keeps_other_stages(tmp_path):
+    """
+    Tests that a stage's rows in the summary are replaced and other stages are kept.
+    """
+    log, summary = str(tmp_path / "perf.jsonl"), str(tmp_path / "perf.csv")
+    for name in ["split", "eda", "split"]:
+        with stage(name, log_path=log, summary_path=summary, profile=""):
+            for _ in range(3):
+                count(wine)
+
+    table = pd.read_csv(summary)
+    assert table["stage"].tolist() == ["eda", "eda", "split", "split"]
+    assert table.loc[table["span"] == "split/count", "calls"].item() == 3
+    assert table.loc[table["span"] == "split/count", "rows"].item() == 24
+    assert len({record["run"] for record in read_log(log)}) == 3
+
+
+def test_failed_span_is_recorded(tmp_path):
+    """
+    Tests that a span that raises is recorded with the error, and the error is re-raised.
+    """
+    log = tmp_path / "perf.jsonl"
+    with pytest.raises(ValueError):
+        with stage("split", log_path=str(log), summary_path=str(tmp_path / "perf.csv"), profile=""):
+            with span("write"):
+                raise ValueError("disk full")
+    errors = {record["span"]: record["error"] for record in read_log(log)}
+    assert errors == {"split/write": "ValueError", "split": "ValueError"}
+
+
+@pytest.mark.parametrize("profile, extension", [("cprofile", ".prof"), ("sample", ".folded")])
+def test_profiler_dump(tmp_path, monkeypatch, profile, extension):
+    """
+    Tests that the chosen profiler writes its dump for the stage.
+    """
+    monkeypatch.setattr("src.instrumentation.PROFILE_DIR", str(tmp_path))
+    with stage("model", log_path=str(tmp_path / "perf.jsonl"),
+               summary_path=str(tmp_path / "perf.csv"), profile=profile):
+        allocate(wine, 1000)
+    assert os.path.getsize(tmp_path / f"model{extension}") > 0
+
+
+def test_spans_outside_a_stage_are_not_recorded(tmp_path):
+    """
+    Tests that instrumented functions work unchanged outside a stage, and that unknown
+    profilers are rejected.
+    """
+    assert allocate(wine, 10) == 10
+    with span("read") as step:
+        step.rows = 3
+    with pytest.raises(ValueError):
+        with stage("eda", log_path=str(tmp_path / "perf.jsonl"), profile="perf"):
+            pass
+    assert not os.path.exists(tmp_path / "perf.jsonl")
+
+
+def test_default_paths_are_in_repository():
+    """
+    Tests that the performance records do not depend on the working directory.
+    """
+    assert PERF_SUMMARY == os.path.join(REPO_ROOT, "results", "tables", "perf.csv")
+    if "WINE_PROFILE_DIR" not in os.environ:
+        assert PROFILE_DIR == os.path.join(REPO_ROOT, "results", "perf")
+    if "WINE_PERF_LOG" not in os.environ:
+        assert PERF_LOG == os.path.join(REPO_ROOT, "results", "perf", "perf.jsonl")
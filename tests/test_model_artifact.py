@@ -0,0 +1,130 @@
+# test_model_artifact.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import json
+import pickle
+import struct
+import numpy as np
+import pytest
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.model_artifact import ALIGNMENT, MAGIC, load_artifact, load_model, save_artifact
+from src.fast_predictor import FastPredictor
+
+# Create arrays to test
+arrays = {
+    "weights": np.array([0.5, -1.25, 3.0]),
+    "ordinal_columns": np.array([2], dtype=np.int64),
+    "counts": np.arange(7, dtype=np.int32)
+}
+metadata = {"kind": "test", "classes": ["red", "white"]}
+
+
+def test_round_trip(tmp_path):
+    """
+    Tests that arrays and metadata load back unchanged.
+    """
+    path = tmp_path / "model.artifact"
+    save_artifact(path, arrays, metadata)
+    loaded, loaded_metadata = load_artifact(path)
+    assert loaded_metadata == metadata
+    for name, array in arrays.items():
+        np.testing.assert_array_equal(loaded[name], array)
+        assert loaded[name].dtype == array.dtype
+
+
+def test_arrays_are_aligned_read_only_views(tmp_path):
+    """
+    Tests that loaded arrays are aligned, read-only views of the memory-mapped file.
+    """
+    path = tmp_path / "model.artifact"
+    save_artifact(path, arrays, metadata)
+    loaded, _ = load_artifact(path)
+    for array in loaded.values():
+        assert isinstance(array.base, np.memmap) or isinstance(array.base.base, np.memmap)
+        assert array.ctypes.data % ALIGNMENT == 0
+        assert not array.flags.writeable
+
+
+def test_rejects_other_files_and_versions(tmp_path):
+    """
+    Tests that non-artifacts and artifacts of another format version are rejected.
+    """
+    other = tmp_path / "model.pickle"
+    other.write_bytes(pickle.dumps({"not": "an artifact"}))
+    with pytest.raises(ValueError):
+        load_artifact(other)
+
+    header = json.dumps({"version": 99, "source_path": None, "source_digest": None,
+                         "metadata": {}, "arrays": {}}).encode()
+    newer = tmp_path / "newer.artifact"
+    newer.write_bytes(MAGIC + struct.pack("<Q", len(header)) + header)
+    with pytest.raises(ValueError, match="version"):
+        load_artifact(newer)
+
+
+def test_detects_stale_source(tmp_path):
+    """
+    Tests that an artifact is rejected once the model it was exported from changes.
+    """
+    source = tmp_path / "model.pickle"
+    source.write_bytes(b"model v1")
+    path = tmp_path / "model.artifact"
+    save_artifact(path, arrays, metadata, source_path=str(source))
+    load_artifact(path, check_source=True)
+
+    source.write_bytes(b"model v2")
+    load_artifact(path)
+    with pytest.raises(ValueError, match="stale"):
+        load_artifact(path, check_source=True)
+
+
+def test_source_follows_the_artifact(tmp_path, monkeypatch):
+    """
+    Tests that the source is found relative to the artifact, from any working directory
+    or copy of both files, and that a missing source is reported.
+    """
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("build/models")
+    (tmp_path / "build" / "models" / "model.pickle").write_bytes(b"model v1")
+    save_artifact("build/models/model.artifact", arrays, metadata, source_path="build/models/model.pickle")
+
+    # Loading from another working directory, or from another checkout, still finds the source
+    monkeypatch.chdir(tmp_path.parent)
+    load_artifact(tmp_path / "build" / "models" / "model.artifact", check_source=True)
+    os.rename(tmp_path / "build", tmp_path / "checkout")
+    load_artifact(tmp_path / "checkout" / "models" / "model.artifact", check_source=True)
+
+    os.remove(tmp_path / "checkout" / "models" / "model.pickle")
+    with pytest.warns(UserWarning, match="not found"):
+        load_artifact(tmp_path / "checkout" / "models" / "model.artifact", check_source=True)
+
+
+def test_save_keeps_mapped_artifact(tmp_path):
+    """
+    Tests that saving over an artifact leaves the arrays of an earlier load unchanged.
+    """
+    path = tmp_path / "model.artifact"
+    save_artifact(path, arrays, metadata)
+    loaded, _ = load_artifact(path)
+    save_artifact(path, {name: array * 2 for name, array in arrays.items()}, metadata)
+    for name, array in arrays.items():
+        np.testing.assert_array_equal(loaded[name], array)
+    assert os.listdir(tmp_path) == ["model.artifact"]
+
+
+def test_load_model_dispatches_on_extension(tmp_path):
+    """
+    Tests that .artifact paths load as a FastPredictor and other paths are unpickled.
+    """
+    fast = FastPredictor(["a", "b"], [1.0, -1.0], 0.5, [], [], [], ["red", "white"])
+    fast.save(tmp_path / "wine_model.artifact")
+    loaded = load_model(tmp_path / "wine_model.artifact")
+    assert isinstance(loaded, FastPredictor)
+    np.testing.assert_array_equal(loaded.predict_proba([[1.0, 2.0]]), fast.predict_proba([[1.0, 2.0]]))
+
+    with open(tmp_path / "model.pickle", "wb") as f:
+        pickle.dump({"model": 1}, f)
+    assert load_model(tmp_path / "model.pickle") == {"model": 1}
@@ -0,0 +1,110 @@
+# test_online_training.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.online_training import OnlineWineModel, compare_models
+from src.preprocessing import NUMERICAL_FEATURES, QUALITY_CATEGORIES, make_preprocessor
+from src.synthetic import WineSynthesizer
+
+# Create data to test
+synthesizer = WineSynthesizer(random_state=5).fit(
+    pd.read_csv(os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'wine.csv'))
+)
+wine = synthesizer.sample(6000)
+train, test = wine.iloc[:4000], wine.iloc[4000:]
+X_train, y_train = train.drop(columns=['color']), train['color']
+X_test, y_test = test.drop(columns=['color']), test['color']
+
+
+def batch_model(X=X_train, y=y_train):
+    """The pipeline built by scripts/preprocessing.py, fitted on the given training rows."""
+    pipe = make_pipeline(
+        make_preprocessor(),
+        LogisticRegression(random_state=123, max_iter=1000, class_weight='balanced')
+    )
+    return pipe.fit(X, y)
+
+
+def test_transform_matches_batch_transform():
+    """
+    Tests that the online model sees the same features as the batch pipeline, with the
+    shared quality codes even when the training rows lack some qualities.
+    """
+    for X, y in [(X_train, y_train), (X_train[X_train['quality'] > 4], y_train[X_train['quality'] > 4])]:
+        online = OnlineWineModel().fit(X, y)
+        batch = batch_model(X, y)
+        np.testing.assert_allclose(online._transform(X_test), batch[:-1].transform(X_test))
+        codes = online._transform(X_test)[:, 0]
+        np.testing.assert_array_equal(codes, X_test['quality'] - QUALITY_CATEGORIES[0])
+
+
+def test_fit_matches_batch_model():
+    """
+    Tests that the online model fitted on all the rows scores like the logistic regression pipeline.
+    """
+    online = OnlineWineModel().fit(X_train, y_train)
+    batch = batch_model()
+    comparison = compare_models({'online': online, 'batch': batch}, X_test, y_test)
+
+    assert comparison['model'].tolist() == ['online', 'batch']
+    assert list(comparison.columns) == ['model', 'accuracy', 'precision', 'recall', 'F1 score']
+    assert abs(comparison.loc[0, 'accuracy'] - comparison.loc[1, 'accuracy']) < 0.01
+    assert (online.predict(X_test) == batch.predict(X_test)).mean() > 0.98
+    np.testing.assert_array_equal(online.classes_, batch.classes_)
+    assert online.predict_proba(X_test).shape == (len(X_test), 2)
+
+
+def test_partial_fit_reads_only_batches():
+    """
+    Tests that updating with batches gives a model close to the batch model, and counts the batches.
+    """
+    parts = np.array_split(np.arange(len(X_train)), 5)
+    online = OnlineWineModel(refit_every=4).fit(X_train.iloc[parts[0]], y_train.iloc[parts[0]])
+    for i, part in enumerate(parts[1:], start=1):
+        assert not online.refit_due
+        online.partial_fit(X_train.iloc[part], y_train.iloc[part])
+        assert online.batches_since_refit_ == i
+
+    assert online.refit_due
+    assert online.n_rows_ == len(X_train)
+    assert online.classifier_.alpha == pytest.approx(1 / (online.C * len(X_train)))
+    assert online.class_counts_.tolist() == y_train.value_counts().sort_index().tolist()
+    np.testing.assert_allclose(online.scaler_.mean_, X_train[NUMERICAL_FEATURES].mean(), rtol=1e-10)
+    accuracy = compare_models({'online': online, 'batch': batch_model()}, X_test, y_test)['accuracy']
+    assert accuracy[1] - accuracy[0] < 0.02
+
+    online.fit(X_train, y_train)
+    assert not online.refit_due
+    assert online.batches_since_refit_ == 0
+
+
+def test_scaler_update_keeps_predictions():
+    """
+    Tests that updating the running scaler statistics alone does not change the model.
+    """
+    online = OnlineWineModel(passes=0).fit(X_train.iloc[:500], y_train.iloc[:500])
+    before = online.decision_function(X_test)
+    online.partial_fit(X_train.iloc[500:], y_train.iloc[500:])
+    assert online.scaler_.n_samples_seen_ == len(X_train)
+    np.testing.assert_allclose(online.decision_function(X_test), before, atol=1e-10)
+
+
+def test_invalid_updates():
+    """
+    Tests that updating an unfitted model, an unknown class or an unknown quality raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        OnlineWineModel().partial_fit(X_train, y_train)
+    online = OnlineWineModel().fit(X_train, y_train)
+    with pytest.raises(ValueError):
+        online.partial_fit(X_train.iloc[:5], ['rose'] * 5)
+    with pytest.raises(ValueError):
+        online.predict(X_test.iloc[:5].assign(quality=12))
@@ -0,0 +1,103 @@
+# test_orchestrator.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import time
+import pandas as pd
+import pytest
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src import data_io
+from src.orchestrator import check_dag, critical_path, run_dag
+
+# Create data to test
+wine = pd.DataFrame({
+    'alcohol': [9.4, 9.8, 12.2],
+    'color': ['red', 'red', 'white']
+})
+
+
+def sleep(seconds):
+    return lambda: time.sleep(seconds)
+
+
+def fail():
+    raise ValueError("no data")
+
+
+def test_check_dag():
+    """
+    Tests that stages are ordered after their dependencies, and that cycles are rejected.
+    """
+    stages = {"eda": {"after": ["split", "validate"]}, "split": {}, "validate": {}}
+    assert check_dag(stages) == ["split", "validate", "eda"]
+    with pytest.raises(ValueError):
+        check_dag({"a": {"after": ["b"]}, "b": {"after": ["a"]}})
+    with pytest.raises(ValueError):
+        check_dag({"a": {"after": ["download"]}})
+
+
+def test_critical_path():
+    """
+    Tests that the critical path is the longest chain of dependent stages.
+    """
+    stages = {"split": {}, "model": {}, "eda": {"after": ["split"]},
+              "evaluate": {"after": ["split", "model"]}}
+    seconds = {"split": 1.0, "model": 3.0, "eda": 5.0, "evaluate": 2.0}
+    assert critical_path(stages, seconds) == (["split", "eda"], 6.0)
+    seconds["evaluate"] = 4.0
+    assert critical_path(stages, seconds) == (["model", "evaluate"], 7.0)
+
+
+def test_independent_stages_run_in_parallel():
+    """
+    Tests that independent stages run at the same time, after the stage they need.
+    """
+    stages = {"split": {"run": sleep(0.1)},
+              "eda": {"run": sleep(0.5), "after": ["split"]},
+              "model": {"run": sleep(0.5), "after": ["split"]}}
+    start = time.perf_counter()
+    report = run_dag(stages, workers=2).set_index("stage")
+    assert time.perf_counter() - start < 1.0
+    assert (report["status"] == "done").all()
+    assert report.loc["eda", "start"] >= report.loc["split", "end"]
+    assert report.loc["model", "start"] < report.loc["eda", "end"]
+    assert report.loc["split", "critical"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_failed_stage_skips_dependents(workers):
+    """
+    Tests that the stages after a failed stage are skipped and the others still run.
+    """
+    stages = {"split": {"run": fail}, "model": {"run": sleep(0)},
+              "eda": {"run": sleep(0), "after": ["split"]},
+              "evaluate": {"run": sleep(0), "after": ["eda", "model"]}}
+    report = run_dag(stages, workers=workers).set_index("stage")
+    assert report["status"].to_dict() == {"split": "failed", "model": "done",
+                                          "eda": "skipped", "evaluate": "skipped"}
+    assert "ValueError: no data" in report.loc["split", "error"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_shared_tables_are_read_from_memory(tmp_path, workers):
+    """
+    Tests that the tables shared by a stage are loaded once and read from memory by later stages.
+    """
+    path = str(tmp_path / "wine_train.csv")
+    preloaded = str(tmp_path / "preloaded.txt")
+
+    def check_preloaded():
+        table = data_io.read_table(path, columns=["color"])
+        pd.testing.assert_frame_equal(table, wine[["color"]])
+        with open(preloaded, "w") as f:
+            f.write(str(os.path.abspath(path) in data_io._preloaded))
+
+    stages = {"split": {"run": lambda: wine.to_csv(path, index=False), "shares": [path]},
+              "eda": {"run": check_preloaded, "after": ["split"]}}
+    report = run_dag(stages, workers=workers)
+    assert (report["status"] == "done").all()
+    with open(preloaded) as f:
+        assert f.read() == "True"
+    data_io._preloaded.clear()
@@ -0,0 +1,83 @@
+# test_parallel.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from joblib import Parallel, delayed
+from scipy.stats import loguniform
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.parallel import SharedArrays, executor, uses_processes
+from src.fold_cache import CachedRandomizedSearchCV
+
+# Create data to test
+rng = np.random.default_rng(2)
+X_data = pd.DataFrame({'alcohol': rng.normal(10.5, 1.0, 120), 'pH': rng.normal(3.2, 0.2, 120)})
+y_data = pd.Series(np.where(X_data['alcohol'] + rng.normal(0, 0.8, 120) > 10.5, 'red', 'white'))
+pipeline = make_pipeline(StandardScaler(), LogisticRegression())
+
+
+def describe(array):
+    """Returns how an array was received by a worker."""
+    return type(array).__name__, getattr(array, "filename", None), os.getpid()
+
+
+def test_shared_arrays_are_read_only_maps():
+    """
+    Tests that shared arrays are read-only memory maps whose files are removed on close.
+    """
+    array = np.arange(12.0).reshape(3, 4)
+    with SharedArrays() as shared:
+        fold = shared.share_all({"X_train": array, "y_train": np.array(["red", "white", "red"]), "time": 0.5})
+        assert isinstance(fold["X_train"], np.memmap)
+        assert not fold["X_train"].flags.writeable
+        np.testing.assert_array_equal(fold["X_train"], array)
+        np.testing.assert_array_equal(fold["y_train"], ["red", "white", "red"])
+        assert fold["time"] == 0.5
+        filename = fold["X_train"].filename
+        assert os.path.exists(filename)
+    assert not os.path.exists(filename)
+
+    assert SharedArrays(enabled=False).share(array) is array
+
+
+def test_workers_attach_to_shared_file():
+    """
+    Tests that worker processes receive a map of the shared file rather than a copy.
+    """
+    with executor("process", n_jobs=2):
+        assert uses_processes()
+        with SharedArrays(uses_processes()) as shared:
+            array = shared.share(np.ones((50, 4)))
+            received = Parallel()(delayed(describe)(array) for _ in range(4))
+    assert all(kind == "memmap" and filename == array.filename for kind, filename, _ in received)
+    assert any(pid != os.getpid() for _, _, pid in received)
+
+    with executor("thread", n_jobs=2):
+        assert not uses_processes()
+    with pytest.raises(ValueError):
+        executor("cluster")
+
+
+@pytest.mark.parametrize("backend", ["process", "thread"])
+def test_search_results_match_serial(backend):
+    """
+    Tests that a search gives the same results on every executor.
+    """
+    def fit():
+        return CachedRandomizedSearchCV(
+            pipeline, {"logisticregression__C": loguniform(1e-2, 10)}, n_iter=4, random_state=0
+        ).fit(X_data, y_data)
+
+    with executor("serial"):
+        expected = fit()
+    with executor(backend, n_jobs=2):
+        search = fit()
+    np.testing.assert_allclose(search.cv_results_["mean_test_score"], expected.cv_results_["mean_test_score"])
+    assert search.best_params_ == expected.best_params_
@@ -0,0 +1,60 @@
+# test_prediction_cache.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.prediction_cache import PredictionCache, dataset_fingerprint, model_fingerprint
+
+# Create data to test
+X_data = pd.DataFrame({
+    'fixed_acidity': [7.4, 7.8, 6.3, 6.6, 8.1, 6.0],
+    'alcohol': [9.4, 9.8, 11.0, 12.2, 10.1, 11.5],
+    'quality': [5, 5, 6, 7, 5, 6]
+})
+y_data = pd.Series(['red', 'red', 'white', 'white', 'red', 'white'])
+
+
+class CountingModel(LogisticRegression):
+    """LogisticRegression that counts its predict_proba calls."""
+    calls = 0
+
+    def predict_proba(self, X):
+        CountingModel.calls += 1
+        return super().predict_proba(X)
+
+
+def test_scores_each_dataset_once():
+    """
+    Tests that repeated requests for the same model and data do not score again.
+    """
+    model = CountingModel().fit(X_data, y_data)
+    CountingModel.calls = 0
+    cache = PredictionCache()
+    labels, proba = cache.predict(model, X_data)
+    cache.predict(model, X_data.copy())
+    cache.predict(model, X_data.iloc[:3])
+
+    assert CountingModel.calls == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+    np.testing.assert_array_equal(labels, model.predict(X_data))
+    np.testing.assert_array_equal(proba, model.predict_proba(X_data))
+
+
+def test_fingerprints_follow_content():
+    """
+    Tests that the fingerprints change with the data and the fitted parameters only.
+    """
+    changed = X_data.copy()
+    changed.loc[0, 'alcohol'] = 9.5
+    assert dataset_fingerprint(X_data) == dataset_fingerprint(X_data.copy())
+    assert dataset_fingerprint(X_data) != dataset_fingerprint(changed)
+    assert dataset_fingerprint(X_data) != dataset_fingerprint(X_data[['alcohol', 'fixed_acidity', 'quality']])
+
+    model = LogisticRegression().fit(X_data, y_data)
+    assert model_fingerprint(model) == model_fingerprint(LogisticRegression().fit(X_data, y_data))
+    assert model_fingerprint(model) != model_fingerprint(LogisticRegression(C=0.01).fit(X_data, y_data))
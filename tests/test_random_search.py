@@ -108,3 +108,35 @@ def test_model_saving(setup_data, tmp_path):
 
     # Assert that the model file was saved
     assert os.path.exists(output_path), f"Model file not saved at {output_path}."
+
+
+def test_path_strategy(setup_data, tmp_path):
+    """
+    Test that the "path" strategy returns a search with the same results layout.
+
+    Args:
+        setup_data: The Pytest fixture providing data and pipeline.
+        tmp_path: Pytest's built-in fixture for creating a temporary directory.
+
+    Asserts:
+        - More values of C than the random search are evaluated.
+        - The results contain the columns saved to random_search.csv.
+        - An unknown strategy raises a ValueError.
+    """
+    wine_pipe, X_train, y_train, _, _ = setup_data
+    output_path = tmp_path / "wine_random_search.pickle"
+
+    path_search, best_estimator = perform_random_search(
+        wine_pipe, X_train, y_train, seed=42, output_path=output_path, strategy="path"
+    )
+
+    assert len(path_search.cv_results_["params"]) > 10, "The path evaluated too few values of C."
+    for column in ["mean_train_score", "mean_test_score", "param_logisticregression__C",
+                   "mean_fit_time", "rank_test_score"]:
+        assert column in path_search.cv_results_, f"'{column}' is missing from the results."
+    assert best_estimator is path_search.best_estimator_
+    assert 0 <= path_search.best_score_ <= 1, "Best score is not within valid range."
+
+    with pytest.raises(ValueError):
+        perform_random_search(wine_pipe, X_train, y_train, seed=42, output_path=output_path,
+                              strategy="grid")
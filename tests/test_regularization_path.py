@@ -0,0 +1,65 @@
+# test_regularization_path.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import make_column_transformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import make_scorer, f1_score
+from sklearn.model_selection import cross_validate
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import OrdinalEncoder, StandardScaler
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.regularization_path import RegularizationPathSearchCV
+
+# Create data to test
+rng = np.random.default_rng(0)
+X_data = pd.DataFrame({
+    'fixed_acidity': rng.normal(7.5, 1.0, 200),
+    'alcohol': rng.normal(10.5, 1.0, 200),
+    'quality': rng.integers(4, 8, 200)
+})
+y_data = pd.Series(np.where(X_data['fixed_acidity'] + rng.normal(0, 0.8, 200) > 7.5, 'red', 'white'))
+
+pipeline = make_pipeline(
+    make_column_transformer(
+        (OrdinalEncoder(dtype=int), ['quality']),
+        (StandardScaler(), ['fixed_acidity', 'alcohol'])
+    ),
+    LogisticRegression(max_iter=1000, class_weight="balanced")
+)
+scoring = make_scorer(f1_score, pos_label="red")
+Cs = [0.1, 0.5, 2.0, 10.0]
+
+
+def test_matches_independent_fits():
+    """
+    Tests that the warm-started path scores every C like a pipeline fitted from scratch.
+    """
+    search = RegularizationPathSearchCV(pipeline, Cs=Cs, scoring=scoring).fit(X_data, y_data)
+    for i, C in enumerate(Cs):
+        scores = cross_validate(pipeline.set_params(logisticregression__C=C), X_data, y_data,
+                                scoring=scoring)["test_score"]
+        assert search.cv_results_["mean_test_score"][i] == pytest.approx(scores.mean(), abs=1e-6)
+
+
+def test_results_like_random_search():
+    """
+    Tests that the results have the columns used for random_search.csv and a refitted best model.
+    """
+    search = RegularizationPathSearchCV(pipeline, Cs=Cs, scoring=scoring,
+                                        return_train_score=True).fit(X_data, y_data)
+    table = pd.DataFrame(search.cv_results_)[
+        ["mean_train_score", "mean_test_score", "param_logisticregression__C",
+         "mean_fit_time", "rank_test_score"]
+    ].set_index("rank_test_score").sort_index().T
+    assert table.shape == (4, len(Cs))
+    assert search.cv_results_["rank_test_score"][search.best_index_] == 1
+    assert search.best_params_["logisticregression__C"] in Cs
+    assert search.best_estimator_[-1].C == search.best_params_["logisticregression__C"]
+    assert not search.best_estimator_[-1].warm_start
+    assert search.predict_proba(X_data).shape == (len(X_data), 2)
@@ -0,0 +1,56 @@
+# test_row_hash.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.row_hash import hash_rows, RowHashSet
+
+
+def test_hash_rows_ignores_numeric_dtype():
+    """
+    Tests that a row hashes the same whether it was parsed as int or float.
+    """
+    int_df = pd.DataFrame({'quality': [5, 6], 'color': ['red', 'white']})
+    float_df = int_df.astype({'quality': float})
+    assert (hash_rows(int_df) == hash_rows(float_df)).all(), "Hashes depend on the numeric dtype."
+
+
+def test_hash_rows_key():
+    """
+    Tests that a different hash key gives different hashes.
+    """
+    df = pd.DataFrame({'quality': [5, 6], 'color': ['red', 'white']})
+    assert (hash_rows(df) != hash_rows(df, hash_key="0000000000000042")).all()
+
+
+def test_add_new_across_batches():
+    """
+    Tests that duplicates within and across batches are only kept once.
+    """
+    seen = RowHashSet()
+    first = seen.add_new(np.array([1, 2, 2, 3], dtype=np.uint64))
+    second = seen.add_new(np.array([3, 4, 1, 4], dtype=np.uint64))
+
+    assert first.tolist() == [True, True, False, True]
+    assert second.tolist() == [False, True, False, False]
+    assert len(seen) == 4
+
+
+def test_runs_stay_sorted_and_compact():
+    """
+    Tests that many small batches are merged into few runs without losing hashes.
+    """
+    seen = RowHashSet()
+    rng = np.random.default_rng(0)
+    hashes = rng.choice(2**40, size=5000, replace=False).astype(np.uint64)
+    for batch in np.array_split(hashes, 100):
+        seen.add_new(batch)
+
+    assert len(seen) == 5000
+    assert seen.contains(hashes).all()
+    assert not seen.contains(hashes + np.uint64(2**41)).any()
+    assert len(seen._runs) <= 2 * np.log2(100)
@@ -0,0 +1,76 @@
+# test_scoring.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.drift import DriftMonitor
+from src.scoring import score_table
+
+# Create data to test
+X_data = pd.DataFrame({
+    'fixed_acidity': [7.4, 7.8, 6.3, 6.6, 8.1],
+    'alcohol': [9.4, 9.8, 11.0, 12.2, 10.1],
+    'quality': [5, 5, 6, 7, 5]
+})
+y_data = pd.Series(['red', 'red', 'white', 'white', 'red'])
+
+# Create a fitted model
+model = LogisticRegression(max_iter=1000, class_weight="balanced")
+model.fit(X_data, y_data)
+
+
+@pytest.mark.parametrize("output_name", ["predictions.csv", "predictions.parquet"])
+def test_matches_model(tmp_path, output_name):
+    """
+    Tests that chunked scoring gives the same predictions and probabilities as the model.
+    """
+    input_path = tmp_path / "samples.csv"
+    X_data.assign(color=y_data).to_csv(input_path, index=False)
+    output_path = tmp_path / output_name
+
+    totals = score_table(model, input_path, output_path, chunksize=2)
+    predictions = pd.read_csv(output_path) if output_name.endswith(".csv") else pd.read_parquet(output_path)
+
+    assert totals["rows"] == len(X_data)
+    assert list(predictions.columns) == ["row", "prediction", "red_probability"]
+    assert predictions["row"].tolist() == list(range(len(X_data)))
+    assert (predictions["prediction"] == model.predict(X_data)).all()
+    np.testing.assert_allclose(predictions["red_probability"], model.predict_proba(X_data)[:, 0])
+
+
+def test_progress_reports_throughput(tmp_path):
+    """
+    Tests that progress is reported once per chunk with a positive throughput.
+    """
+    input_path = tmp_path / "samples.csv"
+    X_data.to_csv(input_path, index=False)
+    reports = []
+
+    score_table(model, input_path, tmp_path / "predictions.csv", chunksize=2,
+                progress=lambda totals: reports.append(dict(totals)))
+
+    assert [report["rows"] for report in reports] == [2, 4, 5]
+    assert all(report["rows_per_second"] > 0 for report in reports)
+
+
+def test_drift_monitor_follows_chunks(tmp_path):
+    """
+    Tests that a drift monitor sees every scored row, in order, whatever the chunk size.
+    """
+    input_path = tmp_path / "samples.csv"
+    X_data.to_csv(input_path, index=False)
+    proba = model.predict_proba(X_data)[:, 0]
+    monitor = DriftMonitor(proba, model.predict(X_data), window=2, step=1)
+
+    score_table(model, input_path, tmp_path / "predictions.csv", chunksize=3, monitor=monitor)
+
+    windows = monitor.results()
+    assert windows["start"].tolist() == [0, 1, 2, 3]
+    expected = DriftMonitor(proba, model.predict(X_data)).score(proba[1:3], model.predict(X_data)[1:3])
+    assert windows.loc[1, "ks"] == pytest.approx(expected["ks"])
@@ -0,0 +1,143 @@
+# test_serving.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import json
+import os
+import threading
+import urllib.request
+import numpy as np
+import pandas as pd
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from sklearn.linear_model import LogisticRegression
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.serving import MicroBatcher, make_server
+
+# Create data to test
+X_data = pd.DataFrame({
+    'fixed_acidity': [7.4, 7.8, 6.3, 6.6],
+    'alcohol': [9.4, 9.8, 11.0, 12.2],
+    'quality': [5, 5, 6, 7]
+})
+y_data = pd.Series(['red', 'red', 'white', 'white'])
+records = X_data.to_dict(orient="records")
+
+
+class CountingModel(LogisticRegression):
+    """A logistic regression that counts its predict_proba calls."""
+    calls = 0
+
+    def predict_proba(self, X):
+        CountingModel.calls += 1
+        return super().predict_proba(X)
+
+
+@pytest.fixture
+def batcher():
+    """
+    Fixture that starts a batcher around a fitted model and stops it afterwards.
+    """
+    model = CountingModel(max_iter=1000).fit(X_data, y_data)
+    CountingModel.calls = 0
+    batcher = MicroBatcher(model, max_batch_size=64, max_latency_ms=50).start()
+    yield batcher
+    batcher.stop()
+
+
+def test_predictions_match_model(batcher):
+    """
+    Tests that a request returns the model's prediction and probability per record.
+    """
+    results = batcher.predict(records)
+    expected = batcher.model.predict_proba(X_data)[:, 0]
+
+    assert [r["prediction"] for r in results] == batcher.model.predict(X_data).tolist()
+    np.testing.assert_allclose([r["red_probability"] for r in results], expected)
+
+
+def test_concurrent_requests_are_batched(batcher):
+    """
+    Tests that concurrent single-row requests are scored in fewer model calls.
+    """
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(lambda i: batcher.predict([records[i % 4]]), range(32)))
+
+    metrics = batcher.metrics()
+    assert len(results) == 32
+    assert CountingModel.calls < 32, "Requests were not coalesced into batches."
+    assert metrics["requests"] == 32 and metrics["rows"] == 32
+    assert metrics["p50_latency_ms"] <= metrics["p99_latency_ms"]
+
+
+def test_missing_feature_is_rejected(batcher):
+    """
+    Tests that a record without all features is rejected before it is queued.
+    """
+    with pytest.raises(ValueError, match="Missing features"):
+        batcher.submit([{"alcohol": 9.4}])
+
+
+def test_invalid_values_are_rejected(batcher):
+    """
+    Tests that empty requests and unusable values are rejected before they are queued.
+    """
+    with pytest.raises(ValueError, match="non-empty"):
+        batcher.submit([])
+    with pytest.raises(ValueError, match="quality"):
+        batcher.submit([dict(records[0], quality=42)])
+    with pytest.raises(ValueError, match="alcohol"):
+        batcher.submit([dict(records[0], alcohol=float("nan"))])
+    with pytest.raises(ValueError, match="alcohol"):
+        batcher.submit([dict(records[0], alcohol="high")])
+
+
+class FailingModel(LogisticRegression):
+    """A logistic regression that fails on any batch with a negative alcohol."""
+    def predict_proba(self, X):
+        if (X["alcohol"] < 0).any():
+            raise ValueError("Negative alcohol")
+        return super().predict_proba(X)
+
+
+def test_bad_request_does_not_fail_its_batch():
+    """
+    Tests that a request failing in the model does not fail the other requests of its batch.
+    """
+    model = FailingModel(max_iter=1000).fit(X_data, y_data)
+    batcher = MicroBatcher(model, max_batch_size=64, max_latency_ms=200).start()
+    try:
+        good = batcher.submit(records[:2])
+        bad = batcher.submit([dict(records[0], alcohol=-1.0)])
+        assert len(good.result(5)) == 2
+        with pytest.raises(ValueError, match="Negative alcohol"):
+            bad.result(5)
+    finally:
+        batcher.stop()
+    metrics = batcher.metrics()
+    assert metrics["errors"] == 1
+    assert metrics["requests"] == 1
+
+
+def test_http_round_trip(batcher):
+    """
+    Tests the /predict and /metrics endpoints of the HTTP server.
+    """
+    server = make_server(batcher, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        request = urllib.request.Request(
+            url + "/predict", data=json.dumps({"instances": records[:2]}).encode(), method="POST"
+        )
+        with urllib.request.urlopen(request) as response:
+            predictions = json.loads(response.read())["predictions"]
+        with urllib.request.urlopen(url + "/metrics") as response:
+            metrics = json.loads(response.read())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(predictions) == 2
+    assert metrics["rows"] == 2
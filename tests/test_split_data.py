@@ -6,7 +6,7 @@ import pandas as pd
 import pytest
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from src.split_data import clean_n_split
+from src.split_data import clean_n_split, append_split, load_train_summary
 
 @pytest.fixture
 def create_sample_data(tmp_path):
@@ -76,3 +76,132 @@ def test_split_and_save(create_sample_data, tmp_path):
     sample_df = pd.read_csv(sample_file)
     total_rows = len(sample_df)
     assert len(train_df) + len(test_df) == total_rows, "Split sizes do not match original data"
+
+
+def test_split_columnar_output(create_sample_data, tmp_path):
+    """
+    Test that the split can be saved as Parquet files with the same rows.
+
+    Args:
+        create_sample_data (str): The file path of the sample data.
+        tmp_path (Path): Temporary directory path provided by pytest.
+
+    Asserts:
+        - Parquet train and test files exist and no CSV files are written.
+        - The saved files contain all rows of the original data.
+    """
+    sample_file = create_sample_data
+    output_dir = tmp_path
+
+    clean_n_split(sample_file, output_dir=output_dir, output_format="parquet", compression="snappy")
+
+    assert (output_dir / "wine_train.parquet").exists(), "Train file was not saved"
+    assert (output_dir / "wine_test.parquet").exists(), "Test file was not saved"
+    assert not (output_dir / "wine_train.csv").exists(), "CSV file should not be written"
+
+    train_df = pd.read_parquet(output_dir / "wine_train.parquet")
+    test_df = pd.read_parquet(output_dir / "wine_test.parquet")
+    assert len(train_df) + len(test_df) == 3, "Split sizes do not match original data"
+
+
+def test_streaming_split(tmp_path):
+    """
+    Test that the chunked split removes duplicates across chunks and keeps the
+    same train/test sizes as the in-memory split.
+
+    Args:
+        tmp_path (Path): Temporary directory path provided by pytest.
+
+    Asserts:
+        - Duplicates spread over different chunks are dropped.
+        - Train and test sizes match the in-memory split.
+    """
+    raw_df = pd.DataFrame({
+        'alcohol': [9.4, 9.8, 10.0, 9.4, 11.2, 12.5, 9.8, 10.4, 13.0, 8.9],
+        'quality': [5, 5, 6, 5, 7, 7, 5, 6, 8, 4],
+        'color': ['red', 'red', 'white', 'red', 'white', 'white', 'red', 'white', 'white', 'red']
+    })
+    raw_file = tmp_path / "raw.csv"
+    raw_df.to_csv(raw_file, index=False)
+    (tmp_path / "memory").mkdir()
+    (tmp_path / "stream").mkdir()
+
+    clean_n_split(raw_file, output_dir=tmp_path / "memory")
+    clean_n_split(raw_file, output_dir=tmp_path / "stream", chunksize=3)
+
+    for name in ["wine_train.csv", "wine_test.csv"]:
+        memory_df = pd.read_csv(tmp_path / "memory" / name)
+        stream_df = pd.read_csv(tmp_path / "stream" / name)
+        assert len(memory_df) == len(stream_df), f"{name} sizes differ from the in-memory split"
+
+    stream_df = pd.concat([pd.read_csv(tmp_path / "stream" / name)
+                           for name in ["wine_train.csv", "wine_test.csv"]])
+    assert not stream_df.duplicated().any(), "Duplicates were not removed across chunks"
+    assert len(stream_df) == len(raw_df.drop_duplicates()), "Rows were lost while streaming"
+
+
+def test_hash_split_append(tmp_path):
+    """
+    Test that appending a batch to a hash split gives the same files as
+    splitting the full history at once.
+
+    Args:
+        tmp_path (Path): Temporary directory path provided by pytest.
+
+    Asserts:
+        - Rows already in the split are not appended again.
+        - Each row lands in the same set as in a split of the full history.
+    """
+    history = pd.DataFrame({
+        'alcohol': [9.4 + 0.1 * i for i in range(40)],
+        'quality': [5 + i % 3 for i in range(40)],
+        'color': ['red' if i % 4 == 0 else 'white' for i in range(40)]
+    })
+    first_file = tmp_path / "first.csv"
+    batch_file = tmp_path / "batch.csv"
+    full_file = tmp_path / "full.csv"
+    history.iloc[:30].to_csv(first_file, index=False)
+    history.iloc[25:].to_csv(batch_file, index=False)
+    history.to_csv(full_file, index=False)
+    (tmp_path / "incremental").mkdir()
+    (tmp_path / "full").mkdir()
+
+    clean_n_split(first_file, output_dir=tmp_path / "incremental", split_method="hash")
+    append_split(batch_file, output_dir=tmp_path / "incremental")
+    clean_n_split(full_file, output_dir=tmp_path / "full", split_method="hash")
+
+    for name in ["wine_train.csv", "wine_test.csv"]:
+        incremental_df = pd.read_csv(tmp_path / "incremental" / name)
+        full_df = pd.read_csv(tmp_path / "full" / name)
+        assert not incremental_df.duplicated().any(), "Existing rows were appended again"
+        pd.testing.assert_frame_equal(incremental_df, full_df)
+
+    # The saved summary statistics follow the appended rows
+    train_df = pd.read_csv(tmp_path / "incremental" / "wine_train.csv")
+    summary = load_train_summary(tmp_path / "incremental" / "wine_train.csv")
+    assert summary.rows == len(train_df)
+    pd.testing.assert_frame_equal(summary.describe(), train_df.describe())
+
+    # and are ignored once the train file changes in another way
+    train_df.iloc[:-1].to_csv(tmp_path / "incremental" / "wine_train.csv", index=False)
+    assert load_train_summary(tmp_path / "incremental" / "wine_train.csv") is None
+
+
+def test_append_requires_hash_split(create_sample_data, tmp_path):
+    """
+    Test that appending to a shuffled split raises a FileNotFoundError.
+    """
+    clean_n_split(create_sample_data, output_dir=tmp_path)
+    with pytest.raises(FileNotFoundError):
+        append_split(create_sample_data, output_dir=tmp_path)
+
+
+def test_hash_split_requires_csv(create_sample_data, tmp_path):
+    """
+    Test that a hash split in a columnar format, which could not be appended to, is rejected.
+    """
+    for output_format in ["parquet", "feather"]:
+        with pytest.raises(ValueError, match="CSV"):
+            clean_n_split(create_sample_data, output_dir=tmp_path / "proc", output_format=output_format,
+                          split_method="hash")
+    assert not os.path.exists(tmp_path / "proc")
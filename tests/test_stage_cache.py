@@ -0,0 +1,103 @@
+# test_stage_cache.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import pytest
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.stage_cache import StageCache, CACHE_DIR, REPO_ROOT, code_files
+
+
+@pytest.fixture
+def stage_files(tmp_path):
+    """
+    Fixture that creates an input file, an output file and a cache directory.
+
+    Returns:
+        tuple: Paths of the input file, the output file and the cache directory.
+    """
+    input_path = tmp_path / "wine.csv"
+    input_path.write_text("alcohol,color\n9.4,red\n")
+    output_path = tmp_path / "wine_train.csv"
+    output_path.write_text("alcohol,color\n9.4,red\n")
+    return str(input_path), str(output_path), str(tmp_path / "cache")
+
+
+def test_hit_after_record(stage_files):
+    """
+    Tests that a recorded run is fresh, even after its input is touched.
+    """
+    input_path, output_path, cache_dir = stage_files
+    cache = StageCache("split", cache_dir)
+    key = cache.key(inputs=[input_path], params={"seed": 123})
+    assert not cache.is_fresh(key, [output_path]), "Cache hit before anything was recorded."
+
+    cache.record(key, [output_path])
+    os.utime(input_path, (0, 0))
+    cache = StageCache("split", cache_dir)
+    assert cache.is_fresh(cache.key(inputs=[input_path], params={"seed": 123}), [output_path])
+
+
+def test_miss_on_changed_input_or_params(stage_files):
+    """
+    Tests that changing the input content or a parameter invalidates the cache.
+    """
+    input_path, output_path, cache_dir = stage_files
+    cache = StageCache("split", cache_dir)
+    key = cache.key(inputs=[input_path], params={"seed": 123})
+    cache.record(key, [output_path])
+
+    assert not cache.is_fresh(cache.key(inputs=[input_path], params={"seed": 42}), [output_path])
+    with open(input_path, "a") as f:
+        f.write("9.8,white\n")
+    assert not cache.is_fresh(cache.key(inputs=[input_path], params={"seed": 123}), [output_path])
+
+
+def test_miss_on_changed_output(stage_files):
+    """
+    Tests that a modified or deleted output invalidates the cache.
+    """
+    input_path, output_path, cache_dir = stage_files
+    cache = StageCache("split", cache_dir)
+    key = cache.key(inputs=[input_path])
+    cache.record(key, [output_path])
+
+    with open(output_path, "a") as f:
+        f.write("9.8,white\n")
+    assert not cache.is_fresh(key, [output_path])
+    os.remove(output_path)
+    assert not cache.is_fresh(key, [output_path])
+
+
+def test_disabled_cache(stage_files):
+    """
+    Tests that the cache never hits and writes nothing when disabled.
+    """
+    input_path, output_path, cache_dir = stage_files
+    cache = StageCache("split", "off")
+    key = cache.key(inputs=[input_path])
+    cache.record(key, [output_path])
+    assert not cache.is_fresh(key, [output_path])
+    assert not os.path.exists("off")
+
+
+def test_code_files_follow_imports(tmp_path):
+    """
+    Tests that a stage is keyed on the src modules it imports, directly or indirectly, and no others.
+    """
+    script = tmp_path / "stage.py"
+    script.write_text("import os\nfrom src.split_data import clean_n_split\n")
+    files = [os.path.relpath(path, REPO_ROOT) for path in code_files(str(script))[1:]]
+    assert os.path.join("src", "split_data.py") in files
+    # split_data imports data_io, which is then part of the stage's code
+    assert os.path.join("src", "data_io.py") in files
+    assert os.path.join("src", "serving.py") not in files
+
+
+def test_cache_dir_is_in_repository():
+    """
+    Tests that the default cache directory does not depend on the working directory.
+    """
+    if "WINE_STAGE_CACHE" not in os.environ:
+        assert CACHE_DIR == os.path.join(REPO_ROOT, "results", ".stage_cache")
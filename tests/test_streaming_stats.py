@@ -0,0 +1,110 @@
+# test_streaming_stats.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.streaming_stats import QuantileSketch, StreamingSummary, summarize_table
+
+# Create data to test
+rng = np.random.default_rng(3)
+n_rows = 1000
+wine = pd.DataFrame({
+    'alcohol': np.round(rng.normal(10.5, 1.2, n_rows), 1),
+    'chlorides': rng.gamma(2.0, 0.03, n_rows),
+    'quality': rng.integers(3, 9, n_rows),
+    'color': rng.choice(['red', 'white'], n_rows)
+})
+wine.loc[::9, 'chlorides'] = np.nan
+
+
+def datatypes(df):
+    """The datatypes table as the EDA built it from the full frame."""
+    return pd.DataFrame({
+        "Column": df.columns,
+        "Non-Null Count": [df[col].notnull().sum() for col in df.columns],
+        "Data Type": [df[col].dtype for col in df.columns]
+    })
+
+
+def test_single_chunk_identical_to_pandas():
+    """
+    Tests that summarizing a frame at once gives exactly the tables pandas gives.
+    """
+    summary = StreamingSummary().update(wine)
+    pd.testing.assert_frame_equal(summary.describe(), wine.describe(), check_exact=True)
+    pd.testing.assert_frame_equal(summary.datatypes(), datatypes(wine))
+    assert summary.null_counts()['chlorides'] == wine['chlorides'].isna().sum()
+    assert summary.null_counts()['color'] == 0
+
+
+def test_chunks_and_partitions_merge():
+    """
+    Tests that chunks and separately summarized partitions add up to the whole frame.
+    """
+    chunked = StreamingSummary()
+    for start in range(0, n_rows, 128):
+        chunked.update(wine.iloc[start:start + 128])
+    pd.testing.assert_frame_equal(chunked.describe(), wine.describe(), rtol=1e-12)
+
+    left = StreamingSummary().update(wine.iloc[:300])
+    right = StreamingSummary().update(wine.iloc[300:])
+    merged = left.merge(right)
+    assert merged.rows == n_rows
+    pd.testing.assert_frame_equal(merged.describe(), wine.describe(), rtol=1e-12)
+    pd.testing.assert_frame_equal(merged.datatypes(), datatypes(wine))
+
+
+def test_merge_dtypes_like_concat():
+    """
+    Tests that an integer column with missing values in a later chunk becomes a float column.
+    """
+    first = wine.iloc[:10]
+    second = wine.iloc[10:20].assign(quality=np.nan)
+    summary = StreamingSummary().update(first).update(second)
+    combined = pd.concat([first, second])
+    pd.testing.assert_frame_equal(summary.datatypes(), datatypes(combined))
+    pd.testing.assert_frame_equal(summary.describe(), combined.describe(), rtol=1e-12)
+
+
+def test_sketch_approximate_beyond_size():
+    """
+    Tests that a compressed sketch keeps the quantiles within its rank error.
+    """
+    values = rng.normal(size=50_000)
+    sketch = QuantileSketch(max_size=500)
+    for part in np.array_split(values, 10):
+        sketch.merge(QuantileSketch(max_size=500).update(part))
+    assert not sketch.exact
+    assert len(sketch.values) <= 500
+    assert sketch.counts.sum() == len(values)
+    q = np.array([0.01, 0.25, 0.5, 0.75, 0.99])
+    ranks = np.searchsorted(np.sort(values), sketch.quantile(q)) / len(values)
+    assert np.abs(ranks - q).max() < 0.01
+
+
+def test_save_load(tmp_path):
+    """
+    Tests that a saved summary loads with the same tables and tracks changes to its source.
+    """
+    source = tmp_path / "wine.csv"
+    wine.to_csv(source, index=False)
+    summary = summarize_table(source, chunksize=250)
+    summary.save(tmp_path / "summary.json", source=source)
+
+    loaded = StreamingSummary.load(tmp_path / "summary.json")
+    pd.testing.assert_frame_equal(loaded.describe(), summary.describe(), check_exact=True)
+    pd.testing.assert_frame_equal(loaded.datatypes(), summary.datatypes())
+    assert loaded.is_current(source)
+
+    loaded.update(wine.iloc[:5])
+    assert loaded.rows == n_rows + 5
+    wine.iloc[:5].to_csv(source, mode="a", header=False, index=False)
+    assert not StreamingSummary.load(tmp_path / "summary.json").is_current(source)
+
+    with pytest.raises(FileNotFoundError):
+        StreamingSummary.load(tmp_path / "missing.json")
@@ -0,0 +1,81 @@
+# test_synthetic.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.data_io import read_table
+from src.synthetic import WineSynthesizer
+from src.validation import WINE_RULES, validate_wine
+
+# Create data to test: red wines have more acid and are correlated with alcohol, 1 in 4 is red
+rng = np.random.default_rng(1)
+n_red, n_white = 100, 300
+acidity = np.concatenate([rng.normal(8.5, 1.0, n_red), rng.normal(6.8, 0.8, n_white)])
+wine = pd.DataFrame({
+    'fixed_acidity': acidity.round(1),
+    'alcohol': (10.5 + 0.8 * (acidity - acidity.mean()) + rng.normal(0, 0.3, n_red + n_white)).round(1),
+    'quality': rng.integers(4, 8, n_red + n_white),
+    'color': ['red'] * n_red + ['white'] * n_white
+})
+
+
+def test_sample_keeps_schema_and_distributions():
+    """
+    Tests that synthetic rows have the schema, class ratio, ranges and correlations of the data.
+    """
+    synthetic = WineSynthesizer(random_state=123).fit(wine).sample(20_000)
+    assert list(synthetic.columns) == list(wine.columns)
+    assert (synthetic.dtypes == wine.dtypes).all()
+    assert (synthetic['color'] == 'red').mean() == pytest.approx(0.25, abs=0.01)
+    for color in ['red', 'white']:
+        real, fake = wine[wine['color'] == color], synthetic[synthetic['color'] == color]
+        assert fake['fixed_acidity'].mean() == pytest.approx(real['fixed_acidity'].mean(), abs=0.05)
+        assert fake['alcohol'].between(real['alcohol'].min(), real['alcohol'].max()).all()
+        assert set(fake['quality']) <= set(real['quality'])
+        assert fake['fixed_acidity'].corr(fake['alcohol'], method='spearman') == pytest.approx(
+            real['fixed_acidity'].corr(real['alcohol'], method='spearman'), abs=0.05)
+    # Few distinct values in so small a sample repeat rows, so only the column rules are checked
+    report = validate_wine(synthetic, {col: WINE_RULES[col] for col in wine.columns})
+    assert report[report['check'] != 'duplicates']['passed'].all()
+
+
+def test_sample_is_reproducible():
+    """
+    Tests that the same seed gives the same rows and another seed different rows.
+    """
+    first = WineSynthesizer(random_state=1).fit(wine).sample(500)
+    pd.testing.assert_frame_equal(first, WineSynthesizer(random_state=1).fit(wine).sample(500))
+    assert not first.equals(WineSynthesizer(random_state=2).fit(wine).sample(500))
+
+
+def test_class_fractions():
+    """
+    Tests that the class fractions can be set, and that invalid fractions are rejected.
+    """
+    synthesizer = WineSynthesizer(class_fractions={"red": 0.5, "white": 0.5}, random_state=1)
+    synthetic = synthesizer.fit(wine).sample(10_000)
+    assert (synthetic['color'] == 'red').mean() == pytest.approx(0.5, abs=0.02)
+    with pytest.raises(ValueError):
+        WineSynthesizer(class_fractions={"rose": 1.0}).fit(wine)
+    with pytest.raises(ValueError):
+        WineSynthesizer(class_fractions={"red": 0.5, "white": 0.6}).fit(wine)
+
+
+@pytest.mark.parametrize("extension", [".csv", ".parquet"])
+def test_write_in_chunks(tmp_path, extension):
+    """
+    Tests that rows written chunk by chunk are the rows of `iter_samples`.
+    """
+    synthesizer = WineSynthesizer(random_state=7).fit(wine)
+    path = tmp_path / f"synthetic{extension}"
+    assert synthesizer.write(path, 2_500, chunksize=1_000) == 2_500
+    expected = pd.concat(synthesizer.iter_samples(2_500, chunksize=1_000), ignore_index=True)
+    written = read_table(path)
+    assert len(written) == 2_500
+    pd.testing.assert_frame_equal(written[['quality', 'color']], expected[['quality', 'color']])
+    np.testing.assert_allclose(written['alcohol'], expected['alcohol'])
@@ -0,0 +1,133 @@
+# test_validation.py
+# author: Farhan Bin Faisal, Daria Khon, Adrian Leung, Zhiwei Zhang
+# date: 2026-10-18
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.validation import validate_wine, validate_wine_file, ValidationState
+
+# Create data to test
+valid_data = {
+    'fixed_acidity': [7.4, 7.8, 7.4, 6.3],
+    'volatile_acidity': [0.7, 0.88, 0.76, 0.3],
+    'citric_acid': [0.0, 0.0, 0.04, 0.34],
+    'residual_sugar': [1.9, 2.6, 2.3, 1.6],
+    'chlorides': [0.076, 0.098, 0.092, 0.049],
+    'free_sulfur_dioxide': [11.0, 25.0, 15.0, 14.0],
+    'total_sulfur_dioxide': [34.0, 67.0, 54.0, 132.0],
+    'density': [0.9978, 0.9968, 0.9970, 0.994],
+    'pH': [3.51, 3.20, 3.26, 3.3],
+    'sulphates': [0.56, 0.68, 0.65, 0.49],
+    'alcohol': [9.4, 9.8, 9.8, 9.5],
+    'quality': [5, 5, 5, 6],
+    'color': ['red', 'red', 'red', 'white']
+}
+
+
+def failed_checks(report):
+    return set(zip(report.loc[~report["passed"], "check"], report.loc[~report["passed"], "column"]))
+
+
+def test_valid_data_passes():
+    """
+    Tests that valid data passes every rule and the report has one row per rule.
+    """
+    report = validate_wine(pd.DataFrame(valid_data))
+    assert report["passed"].all(), "Valid data failed validation."
+    assert list(report.columns) == ["check", "column", "failures", "passed", "examples"]
+    # 13 dtype + 13 missingness + empty rows + 12 range + 1 category + duplicates
+    assert len(report) == 41
+
+
+def test_range_and_category_failures():
+    """
+    Tests that out-of-range and unknown category values are reported with their rows.
+    """
+    wine = pd.DataFrame(valid_data)
+    wine.loc[1, 'pH'] = 4.5
+    wine.loc[3, 'color'] = 'rose'
+    report = validate_wine(wine)
+
+    assert failed_checks(report) == {("range", "pH"), ("category", "color")}
+    assert report.set_index(["check", "column"]).loc[("range", "pH"), "examples"] == [1]
+
+
+def test_missingness_and_empty_rows():
+    """
+    Tests that too many nulls and fully empty rows are reported.
+    """
+    wine = pd.concat([pd.DataFrame(valid_data), pd.DataFrame([{}])], ignore_index=True)
+    report = validate_wine(wine)
+    failed = failed_checks(report)
+
+    assert ("empty_rows", None) in failed
+    assert ("missingness", "alcohol") in failed
+    # The empty row also turns quality into a float column and is out of every range
+    assert ("dtype", "quality") in failed
+    assert ("range", "alcohol") in failed
+
+
+def test_duplicates():
+    """
+    Tests that repeated rows are counted as duplicates, ignoring the first occurrence.
+    """
+    wine = pd.DataFrame(valid_data)
+    wine = pd.concat([wine, wine.iloc[[0, 0]]], ignore_index=True)
+    report = validate_wine(wine).set_index("check")
+
+    assert report.loc["duplicates", "failures"] == 2
+    assert report.loc["duplicates", "examples"] == [4, 5]
+
+
+def test_matches_pandas_on_raw_data():
+    """
+    Tests the engine against plain pandas on the raw data, when available.
+    """
+    raw_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'wine.csv')
+    if not os.path.exists(raw_path):
+        pytest.skip("Raw data not downloaded.")
+    wine = pd.read_csv(raw_path)
+    report = validate_wine(wine).set_index(["check", "column"])
+
+    assert report.loc[("duplicates", None), "failures"] == wine.duplicated().sum()
+    assert report.loc[("range", "sulphates"), "failures"] == (~wine['sulphates'].between(0.2, 1.8)).sum()
+
+
+def test_streaming_matches_in_memory(tmp_path):
+    """
+    Tests that validating a file in chunks gives exactly the in-memory report,
+    including duplicates that span chunks and columns typed differently per chunk.
+    """
+    wine = pd.DataFrame(valid_data)
+    wine = pd.concat([wine, wine.iloc[[1]], pd.DataFrame([{}]), wine.iloc[[2]]], ignore_index=True)
+    wine.loc[0, 'alcohol'] = 20.0
+    wine.loc[5, 'quality'] = np.nan
+    path = tmp_path / "wine.csv"
+    wine.to_csv(path, index=False)
+
+    in_memory = validate_wine(pd.read_csv(path))
+    for chunksize in [1, 2, 3, 100]:
+        streamed = validate_wine_file(path, chunksize=chunksize)
+        pd.testing.assert_frame_equal(streamed, in_memory)
+
+
+def test_merge_partitions():
+    """
+    Tests that merging the states of two partitions gives the same pass/fail
+    results and counts as validating all rows at once.
+    """
+    wine = pd.DataFrame(valid_data)
+    wine = pd.concat([wine, wine.iloc[[0, 3]]], ignore_index=True)
+    wine.loc[1, 'pH'] = 5.0
+
+    first = ValidationState().update(wine.iloc[:3])
+    second = ValidationState().update(wine.iloc[3:])
+    merged = first.merge(second).report()
+    expected = validate_wine(wine)
+
+    pd.testing.assert_frame_equal(merged.drop(columns="examples"), expected.drop(columns="examples"))
+    assert merged.set_index("check").loc["duplicates", "failures"] == 2